@@ -0,0 +1,28 @@
+import FreeCAD
+import FreeCADGui as Gui
+from Spring.Features import Preview
+
+class BuildFullShapes:
+    """Command to replace spring preview shapes with the full solids"""
+
+    def GetResources(self):
+        """Defines icon, tooltip, and menu text"""
+        return {
+            "Pixmap": "workbench.svg",
+            "MenuText": "Build Full Spring Shapes",
+            "ToolTip": "Build the full solid of the selected springs (or of all previewed springs)",
+        }
+
+    def Activated(self):
+        """Rebuild the selection, or every pending preview if nothing is selected"""
+        selection = Gui.Selection.getSelection()
+        count = Preview.build_full_shapes(selection or None)
+        FreeCAD.Console.PrintMessage(f"[BuildFullShapes] Rebuilt {count} spring(s)\n")
+
+    def IsActive(self):
+        """Enable only when a document is active"""
+        return Gui.ActiveDocument is not None
+
+def register():
+    """Registers this command with FreeCAD"""
+    Gui.addCommand("Spring_BuildFullShapes", BuildFullShapes())
@@ -0,0 +1,48 @@
+import FreeCAD
+import FreeCADGui as Gui
+from PySide2 import QtWidgets
+from Spring.Features import TubeMesh
+from Spring.Features import Utils as CoreUtils
+
+class ExportSpringMeshes:
+    """Command to write spring coils as triangle meshes without building B-rep solids"""
+
+    def GetResources(self):
+        """Defines icon, tooltip, and menu text"""
+        return {
+            "Pixmap": "workbench.svg",
+            "MenuText": "Export Spring Meshes",
+            "ToolTip": "Write the selected springs (or all springs) as an STL or OBJ tube mesh",
+        }
+
+    def Activated(self):
+        """Ask for a file and write one tube mesh per spring into it"""
+        springs = CoreUtils.selected_springs(Gui.Selection.getSelection(), FreeCAD.ActiveDocument)
+        if not springs:
+            QtWidgets.QMessageBox.warning(None, "Export Spring Meshes", "The document has no springs.")
+            return
+        path, selected = QtWidgets.QFileDialog.getSaveFileName(
+            None, "Export Spring Meshes", "", "Binary STL (*.stl);;Wavefront OBJ (*.obj)"
+        )
+        if not path:
+            return
+        if not path.lower().endswith((".stl", ".obj")):
+            path += ".obj" if "obj" in selected else ".stl"
+
+        segments_per_turn = CoreUtils.preference_int("mesh_segments_per_turn", TubeMesh.SEGMENTS_PER_TURN)
+        segments_around = CoreUtils.preference_int("mesh_segments_around", TubeMesh.SEGMENTS_AROUND)
+        meshes = (TubeMesh.spring_mesh(obj, segments_per_turn, segments_around) for obj in springs)
+        try:
+            count = TubeMesh.write_meshes(path, meshes)
+        except (OSError, ValueError) as e:
+            QtWidgets.QMessageBox.warning(None, "Export Spring Meshes", str(e))
+            return
+        FreeCAD.Console.PrintMessage(f"[ExportSpringMeshes] Wrote {len(springs)} spring(s), {count} triangles to {path}\n")
+
+    def IsActive(self):
+        """Enable only when a document is active"""
+        return Gui.ActiveDocument is not None
+
+def register():
+    """Registers this command with FreeCAD"""
+    Gui.addCommand("Spring_ExportSpringMeshes", ExportSpringMeshes())
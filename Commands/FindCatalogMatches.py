@@ -0,0 +1,57 @@
+import FreeCAD
+import FreeCADGui as Gui
+from PySide2 import QtWidgets
+from Spring.Features import Utils as CoreUtils
+from Spring.Features.Compression import Utils as CompressionUtils
+
+class FindCatalogMatches:
+    """Command to pick the nearest stock catalog spring for a compression spring"""
+
+    def GetResources(self):
+        """Defines icon, tooltip, and menu text"""
+        return {
+            "Pixmap": "compression.svg",
+            "MenuText": "Find Catalog Matches",
+            "ToolTip": "List the nearest stock catalog springs that carry the selected spring's load and apply the chosen one",
+        }
+
+    def Activated(self):
+        """Query the catalogs for the selected spring and apply the chosen entry"""
+        obj = self._selected_spring()
+        if obj is None:
+            return
+        k = CoreUtils.preference_int("catalog_matches", 5)
+        matches = CompressionUtils.catalog_matches(obj, k)
+        if not matches:
+            FreeCAD.Console.PrintWarning(
+                f"[FindCatalogMatches] No catalog entry in {CoreUtils.catalog_directory()} carries {obj.Name}'s load\n"
+            )
+            return
+
+        labels = [
+            f"{m.name} {m.number}: OD {m.values['OutsideDiameterAtFree']:.2f}, wire {m.values['WireDiameter']:.2f}, "
+            f"free {m.values['LengthAtFree']:.1f} mm, rate {m.values['Rate']:.3f} N/mm"
+            for m in matches
+        ]
+        choice, ok = QtWidgets.QInputDialog.getItem(
+            Gui.getMainWindow(), "Catalog Matches", f"Nearest stock springs for {obj.Label}:", labels, 0, False
+        )
+        if not ok:
+            return
+        CompressionUtils.apply_catalog_match(obj, matches[labels.index(choice)])
+        obj.Document.recompute()
+
+    def IsActive(self):
+        """Enable only when a compression spring is selected"""
+        return self._selected_spring() is not None
+
+    @staticmethod
+    def _selected_spring():
+        for obj in Gui.Selection.getSelection():
+            if getattr(obj, "SpringType", None) == "Compression":
+                return obj
+        return None
+
+def register():
+    """Registers this command with FreeCAD"""
+    Gui.addCommand("Spring_FindCatalogMatches", FindCatalogMatches())
@@ -0,0 +1,37 @@
+import FreeCAD
+import FreeCADGui as Gui
+from PySide2 import QtWidgets
+from Spring.Features import BulkImport
+
+class ImportSprings:
+    """Command to create many springs from a CSV or JSON specification"""
+
+    def GetResources(self):
+        """Defines icon, tooltip, and menu text"""
+        return {
+            "Pixmap": "workbench.svg",
+            "MenuText": "Import Springs",
+            "ToolTip": "Create springs from a CSV or JSON file with one spring per row, recomputing once",
+        }
+
+    def Activated(self):
+        """Ask for a specification file and import it into the active document"""
+        path, _ = QtWidgets.QFileDialog.getOpenFileName(
+            None, "Import Springs", "", "Spring specifications (*.csv *.json)"
+        )
+        if not path:
+            return
+        try:
+            springs = BulkImport.import_springs(path, FreeCAD.ActiveDocument)
+        except (OSError, ValueError) as e:
+            QtWidgets.QMessageBox.warning(None, "Import Springs", str(e))
+            return
+        FreeCAD.Console.PrintMessage(f"[ImportSprings] Created {len(springs)} spring(s) from {path}\n")
+
+    def IsActive(self):
+        """Enable only when a document is active"""
+        return Gui.ActiveDocument is not None
+
+def register():
+    """Registers this command with FreeCAD"""
+    Gui.addCommand("Spring_ImportSprings", ImportSprings())
@@ -0,0 +1,23 @@
+import FreeCADGui as Gui
+from Spring.Dialogs.ProfilingDialog import ProfilingDialog
+
+class ProfilingStats:
+    """Command to show the per-phase recompute statistics"""
+
+    def GetResources(self):
+        """Defines icon, tooltip, and menu text"""
+        return {
+            "Pixmap": "SpringInfo.svg",
+            "MenuText": "Recompute Statistics",
+            "ToolTip": "Show per-object and per-type recompute timings and cache hit rates",
+        }
+
+    def Activated(self):
+        ProfilingDialog.show_stats()
+
+    def IsActive(self):
+        return True
+
+def register():
+    """Registers this command with FreeCAD"""
+    Gui.addCommand("Spring_ProfilingStats", ProfilingStats())
@@ -0,0 +1,44 @@
+import FreeCAD
+import FreeCADGui as Gui
+from Spring.Features import Utils as CoreUtils
+from Spring.Features.Compression import Utils as CompressionUtils
+
+class SearchSpring:
+    """Command to search for a compression spring design that meets its constraints"""
+
+    def GetResources(self):
+        """Defines icon, tooltip, and menu text"""
+        return {
+            "Pixmap": "compression.svg",
+            "MenuText": "Search",
+            "ToolTip": "Adjust the selected compression springs' free variables to satisfy the design constraints",
+        }
+
+    def Activated(self):
+        """Search each selected compression spring, then recompute"""
+        springs = [obj for obj in Gui.Selection.getSelection() if getattr(obj, "SpringType", None) == "Compression"]
+        starts = CoreUtils.preference_int("search_starts", 1)
+        for obj in springs:
+            if starts > 1:
+                results = CompressionUtils.multistart(obj, starts)
+                FreeCAD.Console.PrintMessage(
+                    f"[SearchSpring] {obj.Name}: {len(results)} of {starts} starting points reached a feasible design\n"
+                )
+                continue
+            result = CompressionUtils.search(obj)
+            status = "feasible" if result.feasible else "not feasible"
+            FreeCAD.Console.PrintMessage(
+                f"[SearchSpring] {obj.Name}: {status}, objective={result.objective:.6g}, "
+                f"{result.iterations} iterations, {result.evaluations} evaluations in {1000.0 * result.elapsed:.1f} ms "
+                f"({result.termination})\n"
+            )
+        if springs:
+            springs[0].Document.recompute()
+
+    def IsActive(self):
+        """Enable only when a compression spring is selected"""
+        return any(getattr(obj, "SpringType", None) == "Compression" for obj in Gui.Selection.getSelection())
+
+def register():
+    """Registers this command with FreeCAD"""
+    Gui.addCommand("Spring_SearchSpring", SearchSpring())
@@ -0,0 +1,82 @@
+import FreeCAD, FreeCADGui
+from PySide2 import QtWidgets
+import tempfile, os, datetime
+
+from Spring.Features import Profiling
+
+class ProfilingDialog(QtWidgets.QDialog):
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("Spring Recompute Statistics")
+        layout = QtWidgets.QVBoxLayout(self)
+
+        if not Profiling.enabled():
+            layout.addWidget(QtWidgets.QLabel(
+                "Profiling is off. Enable \"Profile recomputes\" in the Spring preferences to record statistics."
+            ))
+
+        # --- Results area
+        self.table = QtWidgets.QTableWidget()
+        self.table.setColumnCount(len(Profiling.COLUMNS))
+        self.table.setHorizontalHeaderLabels([
+            "Scope", "Object / Type", "Phase", "Calls", "Total (ms)", "Mean (ms)", "Max (ms)", "Hit Rate"
+        ])
+        self._populate_table()
+        layout.addWidget(self.table)
+
+        # --- Buttons
+        btn_layout = QtWidgets.QHBoxLayout()
+        for label, slot in (
+            ("Refresh", self._populate_table),
+            ("Reset", self._reset),
+            ("Export JSON", self._export_json),
+            ("Export CSV", self._export_csv),
+            ("Close", self.accept),
+        ):
+            btn = QtWidgets.QPushButton(label)
+            btn.clicked.connect(slot)
+            btn_layout.addWidget(btn)
+        layout.addLayout(btn_layout)
+
+    # ------------------------------------------------------------
+    def _populate_table(self):
+        rows = Profiling.rows()
+        self.table.setRowCount(len(rows))
+        for i, row in enumerate(rows):
+            hit_rate = row["hit_rate"]
+            for j, val in enumerate([
+                row["scope"], row["key"], row["phase"], str(row["calls"]),
+                f"{row['total_ms']:.3f}", f"{row['mean_ms']:.3f}", f"{row['max_ms']:.3f}",
+                f"{100.0 * hit_rate:.1f} %" if hit_rate != "" else "",
+            ]):
+                self.table.setItem(i, j, QtWidgets.QTableWidgetItem(val))
+        self.table.resizeColumnsToContents()
+
+    def _reset(self):
+        Profiling.reset()
+        self._populate_table()
+
+    # ------------------------------------------------------------
+    def _export(self, extension, description, writer):
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        default_path = os.path.join(tempfile.gettempdir(), f"SpringProfile_{timestamp}.{extension}")
+        path, _ = QtWidgets.QFileDialog.getSaveFileName(
+            self, "Export Recompute Statistics", default_path, description
+        )
+        if not path:
+            return
+        writer(path)
+        QtWidgets.QMessageBox.information(
+            self, "Spring Recompute Statistics", f"✅ Exported {self.table.rowCount()} rows to:\n{path}"
+        )
+
+    def _export_json(self):
+        self._export("json", "JSON files (*.json)", Profiling.export_json)
+
+    def _export_csv(self):
+        self._export("csv", "CSV files (*.csv)", Profiling.export_csv)
+
+    # ------------------------------------------------------------
+    @staticmethod
+    def show_stats():
+        ProfilingDialog().exec_()
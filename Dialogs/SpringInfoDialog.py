@@ -1,8 +1,77 @@
 import FreeCAD, FreeCADGui
-from PySide2 import QtWidgets
-import csv, tempfile, os, datetime
+from PySide2 import QtCore, QtWidgets
+import tempfile, os, datetime
 
-from Spring.Features import Utils
+from Spring.Features import Export, Utils
+
+# Columns shown when the dialog opens; the others can be enabled from the Columns menu.
+DEFAULT_COLUMNS = (
+    "OutsideDiameterAtFree", "WireDiameter", "Pitch", "LengthAtFree", "CoilsTotal", "WireLength", "Rate",
+)
+
+# Item data role holding the unformatted value, used for sorting.
+SORT_ROLE = QtCore.Qt.UserRole
+
+def _name(obj):
+    return obj.Name
+
+def _wire_length(obj):
+    """Wire length of the helix, from the spring's computed Pitch."""
+    mean_diameter = obj.OutsideDiameterAtFree - obj.WireDiameter
+    return Utils.spring_wire_length(mean_diameter, obj.Pitch, obj.CoilsTotal)
+
+# Columns computed from other properties: { column: function(obj) }.
+DERIVED_COLUMNS = {"Name": _name, "WireLength": _wire_length}
+
+class SpringTableModel(QtCore.QAbstractTableModel):
+    """Table of spring properties read from the objects when a cell is shown.
+
+    No values are copied or formatted up front, so the model opens instantly
+    and stays small for any number of springs.
+    """
+
+    def __init__(self, objs, columns, parent=None):
+        super().__init__(parent)
+        self.objs = list(objs)
+        self.columns = list(columns)
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.objs)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.columns)
+
+    def value(self, row, column):
+        """Return the unformatted value of a cell, or None if the spring has no such property."""
+        obj = self.objs[row]
+        name = self.columns[column]
+        try:
+            if name in DERIVED_COLUMNS:
+                return DERIVED_COLUMNS[name](obj)
+            return getattr(obj, name)
+        except (AttributeError, ArithmeticError):
+            return None
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == QtCore.Qt.DisplayRole:
+            value = self.value(index.row(), index.column())
+            if value is None:
+                return ""
+            return f"{value:.6g}" if isinstance(value, float) else str(value)
+        if role == SORT_ROLE:
+            return self.value(index.row(), index.column())
+        if role == QtCore.Qt.TextAlignmentRole and isinstance(self.value(index.row(), index.column()), float):
+            return int(QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
+        return None
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if role != QtCore.Qt.DisplayRole:
+            return None
+        if orientation == QtCore.Qt.Horizontal:
+            return self.columns[section]
+        return str(section + 1)
 
 class SpringInfoDialog(QtWidgets.QDialog):
     def __init__(self, objs):
@@ -11,72 +80,108 @@ class SpringInfoDialog(QtWidgets.QDialog):
         self.setWindowTitle("Spring Info")
         layout = QtWidgets.QVBoxLayout(self)
 
+        # --- Filter and column selection
+        tools_layout = QtWidgets.QHBoxLayout()
+        self.filter_edit = QtWidgets.QLineEdit()
+        self.filter_edit.setPlaceholderText("Filter by name")
+        tools_layout.addWidget(self.filter_edit)
+        self.columns_btn = QtWidgets.QToolButton()
+        self.columns_btn.setText("Columns")
+        self.columns_btn.setPopupMode(QtWidgets.QToolButton.InstantPopup)
+        tools_layout.addWidget(self.columns_btn)
+        layout.addLayout(tools_layout)
+
         # --- Results area
-        self.table = QtWidgets.QTableWidget()
-        self.table.setColumnCount(8)
-        self.table.setHorizontalHeaderLabels([
-            "Name", "Outer Ø @ Free (mm)", "Wire Ø (mm)", "Pitch (mm)",
-            "Length @ Free (mm)", "Total Coils", "Wire Len (mm)", "Rate (N/mm)"
-        ])
-        self._populate_table()
+        self.model = SpringTableModel(objs, ["Name", "WireLength"] + Utils.spring_properties(objs), self)
+        self.proxy = QtCore.QSortFilterProxyModel(self)
+        self.proxy.setSourceModel(self.model)
+        self.proxy.setSortRole(SORT_ROLE)
+        self.proxy.setFilterKeyColumn(0)
+        self.proxy.setFilterCaseSensitivity(QtCore.Qt.CaseInsensitive)
+        self.filter_edit.textChanged.connect(self.proxy.setFilterFixedString)
+
+        self.table = QtWidgets.QTableView()
+        self.table.setModel(self.proxy)
+        self.table.horizontalHeader().setSortIndicator(-1, QtCore.Qt.AscendingOrder)  # keep selection order
+        self.table.setSortingEnabled(True)
+        self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.table.verticalHeader().setDefaultSectionSize(self.table.fontMetrics().height() + 6)
+        self._build_columns_menu()
         layout.addWidget(self.table)
 
         # --- Buttons
         btn_layout = QtWidgets.QHBoxLayout()
-        export_btn = QtWidgets.QPushButton("Export CSV")
-        export_btn.clicked.connect(self._export_csv)
+        export_btn = QtWidgets.QPushButton("Export...")
+        export_btn.clicked.connect(self._export)
         close_btn = QtWidgets.QPushButton("Close")
         close_btn.clicked.connect(self.accept)
         btn_layout.addWidget(export_btn)
         btn_layout.addWidget(close_btn)
         layout.addLayout(btn_layout)
 
+        self.resize(900, 500)
+        self.table.resizeColumnsToContents()  # only measures the visible rows
+
     # ------------------------------------------------------------
-    def _populate_table(self):
-        self.table.setRowCount(len(self.objs))
-        for i, obj in enumerate(self.objs):
-            outer_d = getattr(obj, "OutsideDiameterAtFree", 20.0)
-            wire_d = getattr(obj, "WireDiameter", 2.0)
-            inactive_coils = getattr(obj, "CoilsInactive", 2.0)
-            length_free = getattr(obj, "LengthAtFree", 25.0)
-            pitch = (length_free - inactive_coils) / wire_d
-            total_coils = getattr(obj, "CoilsTotal", 25.0)
-            wire_len = Utils.spring_wire_length(outer_d, pitch, coils)
-            rate = getattr(obj, "Rate", 0.0)
-
-            for j, val in enumerate([
-                obj.Name, f"{outer_d:.2f}", f"{wire_d:.2f}",
-                f"{pitch:.2f}", f"{length_free:.2f}", f"{total_coils:.2f}",
-                f"{wire_len:.1f}", f"{rate:.3f}"
-            ]):
-                self.table.setItem(i, j, QtWidgets.QTableWidgetItem(val))
-
-        self.table.resizeColumnsToContents()
+    def _build_columns_menu(self):
+        menu = QtWidgets.QMenu(self.columns_btn)
+        for column, name in enumerate(self.model.columns):
+            visible = name == "Name" or name in DEFAULT_COLUMNS
+            self.table.setColumnHidden(column, not visible)
+            if name == "Name":
+                continue
+            action = menu.addAction(name)
+            action.setCheckable(True)
+            action.setChecked(visible)
+            action.toggled.connect(lambda checked, column=column: self._show_column(column, checked))
+        self.columns_btn.setMenu(menu)
+
+    def _show_column(self, column, visible):
+        self.table.setColumnHidden(column, not visible)
+        if visible:
+            self.table.resizeColumnToContents(column)
 
     # ------------------------------------------------------------
-    def _export_csv(self):
+    def _export(self):
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         default_path = os.path.join(tempfile.gettempdir(), f"SpringInfo_{timestamp}.csv")
-        path, _ = QtWidgets.QFileDialog.getSaveFileName(
-            self, "Export Spring Info", default_path, "CSV files (*.csv)"
+        path, selected = QtWidgets.QFileDialog.getSaveFileName(
+            self, "Export Spring Info", default_path, "CSV files (*.csv);;JSON Lines files (*.jsonl)"
         )
         if not path:
             return
+        if not os.path.splitext(path)[1]:
+            path += ".jsonl" if "jsonl" in selected else ".csv"
 
-        with open(path, "w", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                "Name", "OutsideDiameterAtFree_mm", "WireDiameter_mm", "Pitch_mm",
-                "LengthAtFree_mm", "Coils", "WireLength_mm", "SpringRate_N_per_mm"
-            ])
-            for i in range(self.table.rowCount()):
-                writer.writerow([
-                    self.table.item(i, c).text() for c in range(self.table.columnCount())
-                ])
-
-        QtWidgets.QMessageBox.information(
-            self, "Spring Info", f"✅ Exported {self.table.rowCount()} springs to:\n{path}"
-        )
+        # Every design property of the springs shown, in the current sort order.
+        objs = [self.model.objs[self.proxy.mapToSource(self.proxy.index(i, 0)).row()] for i in range(self.proxy.rowCount())]
+        try:
+            job = Export.ExportJob(path, objs)
+        except ValueError as e:
+            QtWidgets.QMessageBox.warning(self, "Spring Info", str(e))
+            return
+        progress = QtWidgets.QProgressDialog("Exporting springs...", "Cancel", 0, job.total, self)
+        progress.setWindowModality(QtCore.Qt.WindowModal)
+        progress.setMinimumDuration(500)
+        progress.canceled.connect(job.cancel)
+        timer = QtCore.QTimer(self)
+
+        def poll():
+            progress.setValue(job.written)
+            if job.is_alive():
+                return
+            timer.stop()
+            progress.reset()
+            if job.error is not None:
+                QtWidgets.QMessageBox.warning(self, "Spring Info", f"Export failed:\n{job.error}")
+            elif not job.cancelled:
+                QtWidgets.QMessageBox.information(
+                    self, "Spring Info", f"✅ Exported {job.written} springs to:\n{path}"
+                )
+
+        timer.timeout.connect(poll)
+        job.start()
+        timer.start(100)
 
     # ------------------------------------------------------------
     @staticmethod
@@ -0,0 +1,111 @@
+"""Bulk creation of springs from CSV or JSON specifications.
+
+A specification lists one spring per CSV row (header = property names) or per
+object of a JSON list.  ``SpringType`` selects Compression (the default),
+Extension or Torsion, ``Label`` names the object and every other key sets the
+property of that name; empty cells and JSON nulls keep the default.  All springs are created
+with their calculations deferred and brought up to date by one document
+recompute at the end.
+"""
+
+import FreeCAD
+import os, csv, json, importlib
+from typing import Any, Dict, Iterable, List, Union
+
+from . import Utils as CoreUtils
+from . import Log, Profiling
+
+# Spring type: (feature module, proxy class, object name).
+SPRING_TYPES = {
+    "Compression": (".Compression.Spring", "CompressionSpring", "CompressionSpring"),
+    "Extension": (".Extension.Spring", "ExtensionSpring", "ExtensionSpring"),
+    "Torsion": (".Torsion.Spring", "TorsionSpring", "TorsionSpring"),
+}
+
+# Keys of a specification that are not spring properties.
+SPEC_KEYS = ("SpringType", "Label")
+
+def read_specs(path: str) -> List[Dict[str, Any]]:
+    """Read spring specifications from a ``.csv`` or ``.json`` file."""
+
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".json":
+        with open(path, "r") as f:
+            specs = json.load(f)
+        if not isinstance(specs, list) or not all(isinstance(spec, dict) for spec in specs):
+            raise ValueError(f"{path}: expected a JSON list of objects")
+        return specs
+    if extension == ".csv":
+        with open(path, "r", newline="") as f:
+            return [{k: v for k, v in row.items() if k and v not in (None, "")} for row in csv.DictReader(f)]
+    raise ValueError(f"{path}: unsupported file type {extension!r} (expected .csv or .json)")
+
+def _convert(obj, name: str, value):
+    """Convert a specification value to the type of property ``name``."""
+
+    type_id = obj.getTypeIdOfProperty(name)
+    if type_id == "App::PropertyFloat":
+        return float(value)
+    if type_id == "App::PropertyBool":
+        return value if isinstance(value, bool) else str(value).strip().lower() in ("1", "true", "yes")
+    return str(value)
+
+def _proxy_class(spring_type: str):
+    try:
+        module, cls, _name = SPRING_TYPES[spring_type]
+    except KeyError:
+        raise ValueError(f"unknown SpringType {spring_type!r}") from None
+    return getattr(importlib.import_module(module, __package__), cls)
+
+def _create(doc, number: int, spec: Dict[str, Any]):
+    spring_type = spec.get("SpringType", "Compression")
+    proxy = _proxy_class(spring_type)
+    obj = doc.addObject("Part::FeaturePython", SPRING_TYPES[spring_type][2])
+    try:
+        proxy(obj)
+        for name, value in spec.items():
+            if name in SPEC_KEYS or value is None:
+                continue
+            if name not in obj.PropertiesList:
+                raise ValueError(f"spring {number}: {spring_type} springs have no property {name!r}")
+            try:
+                value = _convert(obj, name, value)
+            except (TypeError, ValueError):
+                raise ValueError(f"spring {number}: invalid value {value!r} for {name}") from None
+            setattr(obj, name, value)
+        if "Label" in spec:
+            obj.Label = str(spec["Label"])
+    except Exception:
+        doc.removeObject(obj.Name)
+        raise
+    return obj
+
+def import_springs(specs: Union[str, Iterable[Dict[str, Any]]], doc=None, recompute: bool = True) -> List:
+    """Create one spring per specification and return the new objects.
+
+    ``specs`` is a file path (see read_specs) or an iterable of dictionaries.
+    The springs are created inside ``CoreUtils.deferred_updates()`` and the
+    document is recomputed once at the end unless ``recompute`` is False.  If
+    a specification is invalid, the springs created so far are removed and the
+    ValueError propagates.
+    """
+    if isinstance(specs, str):
+        specs = read_specs(specs)
+    doc = doc or FreeCAD.ActiveDocument
+    if doc is None:
+        raise ValueError("no active document")
+
+    created = []
+    with Profiling.phase("bulk_import"):
+        with CoreUtils.deferred_updates():
+            try:
+                for number, spec in enumerate(specs, start=1):
+                    created.append(_create(doc, number, spec))
+            except Exception:
+                for obj in created:
+                    doc.removeObject(obj.Name)
+                raise
+        Log.info("[import_springs] created %d springs", len(created))
+        if recompute and created:
+            doc.recompute()
+    return created
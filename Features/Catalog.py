@@ -0,0 +1,219 @@
+"""Indexed stock-spring catalogs.
+
+A catalog is a CSV file with one stock spring per row and (at least) the
+columns ``Number``, ``OutsideDiameterAtFree``, ``WireDiameter``,
+``LengthAtFree`` and ``Rate`` in millimetres and N/mm.  Optional columns are
+``Name`` (default: the file name), ``CoilsTotal``, ``LengthAtSolid`` and
+``MaxForce``.  All catalogs of a directory are loaded into one columnar index,
+pre-sorted into the leaf order of a KD-tree over the logarithms of the four
+key dimensions, so a nearest-match query only visits a few leaves even for
+catalogs with tens of thousands of entries.  This module needs numpy but not
+FreeCAD.
+"""
+
+import os, csv, heapq, math
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Columns of the KD-tree, in order; distances are measured between their logarithms.
+KEY_COLUMNS = ("OutsideDiameterAtFree", "WireDiameter", "LengthAtFree", "Rate")
+OPTIONAL_COLUMNS = ("CoilsTotal", "LengthAtSolid", "MaxForce")
+LEAF_SIZE = 32
+
+@dataclass
+class CatalogMatch:
+    """One catalog entry returned by a query, with its distance to the target."""
+
+    name: str
+    number: str
+    distance: float
+    values: Dict[str, float]
+
+class CatalogIndex:
+    """Columnar catalog data with a KD-tree over the key columns."""
+
+    def __init__(self, names: Sequence[str], numbers: Sequence[str], columns: Dict[str, np.ndarray]):
+        count = len(numbers)
+        columns = dict(columns)
+        for column in KEY_COLUMNS:
+            if column not in columns:
+                if count:
+                    raise ValueError(f"catalog is missing column {column}")
+                columns[column] = np.empty(0)  # no catalogs: an empty index
+        valid = np.ones(count, dtype=bool)
+        for column in KEY_COLUMNS:
+            valid &= np.isfinite(columns[column]) & (columns[column] > 0.0)
+        points = np.log(np.column_stack([columns[c][valid] for c in KEY_COLUMNS])) if count else np.empty((0, 4))
+        order = np.arange(len(points))
+        self._build(points, order)
+
+        keep = np.flatnonzero(valid)[order]
+        self.names = np.asarray(names, dtype=object)[keep]
+        self.numbers = np.asarray(numbers, dtype=object)[keep]
+        self.columns = {column: np.asarray(values, dtype=float)[keep] for column, values in columns.items()}
+        self.points = points[order]
+
+    def __len__(self):
+        return len(self.numbers)
+
+    # ------------------------------------------------------------
+    def _build(self, points: np.ndarray, order: np.ndarray) -> None:
+        """Build the tree, permuting ``order`` so every node covers a contiguous range."""
+
+        starts, ends, children, lows, highs = [], [], [], [], []
+
+        def add(start, end):
+            block = points[order[start:end]]
+            starts.append(start)
+            ends.append(end)
+            children.append((-1, -1))
+            lows.append(block.min(axis=0) if end > start else np.zeros(points.shape[1]))
+            highs.append(block.max(axis=0) if end > start else np.zeros(points.shape[1]))
+            return len(starts) - 1
+
+        pending = [add(0, len(order))]
+        while pending:
+            node = pending.pop()
+            start, end = starts[node], ends[node]
+            if end - start <= LEAF_SIZE:
+                continue
+            dim = int(np.argmax(highs[node] - lows[node]))
+            middle = (end - start) // 2
+            block = order[start:end]
+            order[start:end] = block[np.argpartition(points[block, dim], middle)]
+            left, right = add(start, start + middle), add(start + middle, end)
+            children[node] = (left, right)
+            pending.extend((left, right))
+
+        self._starts = np.asarray(starts)
+        self._ends = np.asarray(ends)
+        self._children = children
+        self._lows = np.asarray(lows)
+        self._highs = np.asarray(highs)
+
+    def _bound(self, node: int, target: np.ndarray) -> float:
+        gap = np.maximum(self._lows[node] - target, 0.0) + np.maximum(target - self._highs[node], 0.0)
+        return float(gap @ gap)
+
+    def query(self, target: Sequence[float], k: int = 5, accept: Optional[Callable[[slice], np.ndarray]] = None) -> List[Tuple[float, int]]:
+        """Return up to ``k`` (distance, row) pairs nearest to ``target`` (KEY_COLUMNS values).
+
+        ``accept(rows)`` may reject entries; it receives a slice of rows and
+        returns a boolean mask over it.
+        """
+        if not len(self) or k <= 0:
+            return []
+        target = np.log(np.asarray(target, dtype=float))
+        best = []  # max-heap of (-squared distance, row)
+        pending = [(self._bound(0, target), 0)]
+        while pending:
+            bound, node = heapq.heappop(pending)
+            if len(best) == k and bound > -best[0][0]:
+                break
+            left, right = self._children[node]
+            if left >= 0:
+                for child in (left, right):
+                    heapq.heappush(pending, (self._bound(child, target), child))
+                continue
+            rows = slice(int(self._starts[node]), int(self._ends[node]))
+            delta = self.points[rows] - target
+            distances = np.einsum("ij,ij->i", delta, delta)
+            candidates = np.arange(rows.start, rows.stop)
+            if accept is not None:
+                mask = accept(rows)
+                distances, candidates = distances[mask], candidates[mask]
+            for distance, row in zip(distances.tolist(), candidates.tolist()):
+                if len(best) < k:
+                    heapq.heappush(best, (-distance, row))
+                elif distance < -best[0][0]:
+                    heapq.heapreplace(best, (-distance, row))
+        return sorted((math.sqrt(-d), row) for d, row in best)
+
+    def carries(self, force: float) -> Callable[[slice], np.ndarray]:
+        """Return an ``accept`` filter for entries that carry ``force`` without going solid or overloading."""
+
+        rate = self.columns["Rate"]
+        free = self.columns["LengthAtFree"]
+        solid = self.columns.get("LengthAtSolid")
+        max_force = self.columns.get("MaxForce")
+
+        def accept(rows):
+            mask = free[rows] - force / rate[rows] > 0.0
+            if solid is not None:
+                mask &= ~(free[rows] - force / rate[rows] < solid[rows])
+            if max_force is not None:
+                mask &= ~(force > max_force[rows])
+            return mask
+        return accept
+
+    def nearest(self, outside_diameter, wire_diameter, length_at_free, rate, k=5, force=None) -> List[CatalogMatch]:
+        """Return the ``k`` catalog entries nearest the given spring, optionally carrying ``force``."""
+
+        accept = self.carries(force) if force else None
+        matches = []
+        for distance, row in self.query((outside_diameter, wire_diameter, length_at_free, rate), k, accept):
+            values = {column: float(values[row]) for column, values in self.columns.items() if not math.isnan(values[row])}
+            matches.append(CatalogMatch(str(self.names[row]), str(self.numbers[row]), distance, values))
+        return matches
+
+# ------------------------------------------------------------
+def read_catalog(path: str) -> Tuple[List[str], List[str], Dict[str, np.ndarray]]:
+    """Read a catalog CSV file into (names, numbers, columns)."""
+
+    default_name = os.path.splitext(os.path.basename(path))[0]
+    with open(path, "r", newline="") as f:
+        rows = list(csv.DictReader(f))
+    names = [row.get("Name") or default_name for row in rows]
+    numbers = [row.get("Number", "") for row in rows]
+    columns = {}
+    for column in KEY_COLUMNS + OPTIONAL_COLUMNS:
+        if rows and column in rows[0]:
+            columns[column] = np.array([float(row[column] or "nan") for row in rows])
+    return names, numbers, columns
+
+def load_index(paths: Sequence[str]) -> CatalogIndex:
+    """Load and index the given catalog files together."""
+
+    names, numbers, parts = [], [], []
+    for path in paths:
+        n, m, columns = read_catalog(path)
+        names += n
+        numbers += m
+        parts.append((len(m), columns))
+    columns = {}
+    for column in KEY_COLUMNS + OPTIONAL_COLUMNS:
+        if any(column in part for _count, part in parts):
+            columns[column] = np.concatenate(
+                [part.get(column, np.full(count, np.nan)) for count, part in parts]
+            ) if parts else np.empty(0)
+    return CatalogIndex(names, numbers, columns)
+
+_INDEX_CACHE = {}  # { directory: (signature, CatalogIndex) }
+
+def catalog_files(directory: str) -> List[str]:
+    """Return the catalog CSV files of ``directory``, sorted by name."""
+
+    if not os.path.isdir(directory):
+        return []
+    return sorted(os.path.join(directory, f) for f in os.listdir(directory) if f.lower().endswith(".csv"))
+
+def directory_index(directory: str) -> CatalogIndex:
+    """Return the index of all catalogs in ``directory``, rebuilt when a file changes.
+
+    A missing or empty directory gives an empty index.
+    """
+
+    paths = catalog_files(directory)
+    signature = tuple((path, os.path.getmtime(path)) for path in paths)
+    cached = _INDEX_CACHE.get(directory)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    index = load_index(paths)
+    _INDEX_CACHE[directory] = (signature, index)
+    return index
+
+def clear_index_cache() -> None:
+    """Forget all loaded catalog indexes."""
+    _INDEX_CACHE.clear()
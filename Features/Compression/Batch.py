@@ -0,0 +1,288 @@
+"""Vectorized evaluation of the compression spring equations.
+
+``update_properties`` works one FeaturePython object at a time.  The helpers in
+this module evaluate the same equations over NumPy arrays so that thousands of
+candidate designs can be analysed in a single pass without touching document
+objects.  Every input may be a scalar or an array; inputs are broadcast against
+each other and the results are returned as a dictionary keyed by the names of
+the corresponding ``Dependent`` properties.
+"""
+
+from __future__ import annotations
+import math
+from typing import Dict, Optional
+
+import numpy as np
+
+from .. import CycleLife, Enums, ForwardDiff as fd, Materials
+from . import Model as SpringModel
+
+# Names of the arrays returned by evaluate(), in the order update_properties() sets them.
+OUTPUTS = (
+    "MeanDiameterAtFree",
+    "InsideDiameterAtFree",
+    "SpringIndex",
+    "CoilsActive",
+    "Pitch",
+    "Rate",
+    "Deflection1",
+    "Deflection2",
+    "LengthAtDeflection1",
+    "LengthAtDeflection2",
+    "LengthStroke",
+    "Slenderness",
+    "LengthAtSolid",
+    "ForceAtSolid",
+    "StressAtDeflection1",
+    "StressAtDeflection2",
+    "StressAtSolid",
+    "Tensile",
+    "StressLimitEndurance",
+    "StressLimitStatic",
+    "FactorOfSafetyAtDeflection2",
+    "FactorOfSafetyAtSolid",
+    "FactorOfSafetyAtCycleLife",
+    "CycleLife",
+    "Weight",
+    "PercentAvailableDeflection",
+    "Energy",
+)
+
+# Pitch = (LengthAtFree - PITCH_WIRE_FACTOR * WireDiameter) / CoilsActive, indexed by EndType.
+# Index 0 (unknown) and 7 (User_Specified) are handled from CoilsInactive instead.
+_PITCH_WIRE_FACTOR = np.array([np.nan, 1.0, np.nan, 3.0, 2.0, 1.5, 2.0, np.nan])
+
+def _end_type_columns():
+    """Return (CoilsInactive, AddCoilsAtSolid, EndTrim) arrays indexed by the 1-based EndType index."""
+
+    end_types = Enums.enum_table("Compression", "EndType")
+    return tuple(np.concatenate(([0.0], end_types.columns[name])) for name in ("CoilsInactive", "AddCoilsAtSolid", "EndTrim"))
+
+def material_constants(material=SpringModel.MUSIC_WIRE_MATERIAL_TYPE, life_category_index=1, tbase010=0.010, tbase400=0.400):
+    """Return the material-table constants of ``update_globals`` as arrays.
+
+    ``material`` is a material name or an array of names; the result maps
+    ``evaluate`` argument names (density, torsion_modulus, hot_factor_kh,
+    percent_tensile_endurance, percent_tensile_static, const_term, slope_term,
+    tensile_010) to arrays broadcast against ``life_category_index``.
+    """
+    table = Materials.load_materials()
+    names = np.asarray(material, dtype=object)
+    rows = np.array([table.index(name) for name in names.ravel()], dtype=np.intp).reshape(names.shape)
+
+    def column(name):
+        return np.asarray(table.columns[name], dtype=float)[rows]
+
+    # PercentTensileEndurance by [row, LifeCategory index]; index 0 (unknown) falls back to pte1.
+    pte_columns = [SpringModel.PTE_COLUMNS.get(i, "pte1") for i in range(max(SpringModel.PTE_COLUMNS) + 1)]
+    pte_table = np.column_stack([np.asarray(table.columns[name], dtype=float) for name in pte_columns])
+    life_category_index = np.clip(np.asarray(life_category_index, dtype=np.intp), 0, len(pte_columns) - 1)
+
+    tensile_010 = 1000.0 * column("t010")
+    tensile_400 = 1000.0 * column("t400")
+    const_term = math.log10(tbase010)
+    return {
+        "density": column("Density"),
+        "torsion_modulus": column("gg") * 1.0e9,
+        "hot_factor_kh": column("kh"),
+        "percent_tensile_endurance": pte_table[rows, life_category_index],
+        "percent_tensile_static": column("pte1"),
+        "const_term": const_term,
+        "slope_term": (tensile_400 - tensile_010) / (math.log10(tbase400) - const_term),
+        "tensile_010": tensile_010,
+    }
+
+def evaluate(
+    outside_diameter_at_free,
+    wire_diameter,
+    length_at_free,
+    coils_total,
+    force_at_deflection1,
+    force_at_deflection2,
+    end_type_index=1,
+    coils_inactive=None,
+    add_coils_at_solid=None,
+    life_category_index=1,
+    prop_calc_method_index=1,
+    material=SpringModel.MUSIC_WIRE_MATERIAL_TYPE,
+    density=None,
+    torsion_modulus=None,
+    hot_factor_kh=None,
+    tensile=0.0,
+    percent_tensile_endurance=None,
+    percent_tensile_static=None,
+    stress_limit_endurance=0.0,
+    stress_limit_static=0.0,
+    const_term: Optional[float] = None,
+    slope_term: Optional[float] = None,
+    tensile_010: Optional[float] = None,
+    _differentiate: bool = False,
+) -> Dict[str, np.ndarray]:
+    """Evaluate the compression spring equations for arrays of designs.
+
+    Enumerations are given by their 1-based index into the corresponding
+    ``<name>.json`` table, exactly as ``_enum_index`` reports them.  When
+    ``coils_inactive`` or ``add_coils_at_solid`` are omitted they are taken from
+    the EndType table.  Omitted material constants (density through
+    ``tensile_010``) are taken from the material table for ``material``, a
+    name or an array of names, as ``update_globals`` does.
+
+    Invalid designs (for example zero active coils) produce ``inf``/``nan``
+    entries instead of raising ``ZeroDivisionError``.
+    """
+
+    constants = material_constants(material, life_category_index)
+    density = constants["density"] if density is None else density
+    torsion_modulus = constants["torsion_modulus"] if torsion_modulus is None else torsion_modulus
+    hot_factor_kh = constants["hot_factor_kh"] if hot_factor_kh is None else hot_factor_kh
+    if percent_tensile_endurance is None:
+        percent_tensile_endurance = constants["percent_tensile_endurance"]
+    if percent_tensile_static is None:
+        percent_tensile_static = constants["percent_tensile_static"]
+    const_term = constants["const_term"] if const_term is None else const_term
+    slope_term = constants["slope_term"] if slope_term is None else slope_term
+    tensile_010 = constants["tensile_010"] if tensile_010 is None else tensile_010
+
+    end_type_index = np.asarray(end_type_index, dtype=np.intp)
+    life_category_index = np.asarray(life_category_index, dtype=np.intp)
+    prop_calc_method_index = np.asarray(prop_calc_method_index, dtype=np.intp)
+    if coils_inactive is None or add_coils_at_solid is None:
+        table_inactive, table_add, _table_trim = _end_type_columns()
+        index = np.clip(end_type_index, 0, len(table_inactive) - 1)
+        if coils_inactive is None:
+            coils_inactive = table_inactive[index]
+        if add_coils_at_solid is None:
+            add_coils_at_solid = table_add[index]
+
+    (od, d, lf, nt, f1, f2, et, ci, acs, pcm, rho, g, kh, tensile, pte, pts, sle, sls) = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (
+            outside_diameter_at_free, wire_diameter, length_at_free, coils_total,
+            force_at_deflection1, force_at_deflection2, end_type_index, coils_inactive,
+            add_coils_at_solid, prop_calc_method_index, density, torsion_modulus, hot_factor_kh,
+            tensile, percent_tensile_endurance, percent_tensile_static,
+            stress_limit_endurance, stress_limit_static,
+        ))
+    )
+    et = et.astype(np.intp)
+    pcm = pcm.astype(np.intp)
+    if _differentiate:
+        od, d, lf, nt, f1, f2 = fd.variables(od, d, lf, nt, f1, f2)
+
+    out = {}
+    with np.errstate(divide="ignore", invalid="ignore"):
+        dm = od - d
+        out["MeanDiameterAtFree"] = dm
+        out["InsideDiameterAtFree"] = dm - d
+        c = dm / d
+        out["SpringIndex"] = c
+        kc = (4.0 * c - 1.0) / (4.0 * c - 4.0)
+        ks = kc + 0.615 / c
+        na = nt - ci
+        out["CoilsActive"] = na
+
+        known = (et >= 1) & (et <= 6)
+        factor = np.where(known, _PITCH_WIRE_FACTOR[np.where(known, et, 1)], ci + 1.0)
+        pitch = (lf - factor * d) / na
+        pitch = fd.where(et == 2, lf / nt, pitch)  # Open & Ground
+        out["Pitch"] = pitch
+
+        c2 = c * c
+        rate = kh * (g / 1.0e6) * dm / (8.0 * na * c2 * c2)
+        out["Rate"] = rate
+        deflection1 = f1 / rate
+        deflection2 = f2 / rate
+        out["Deflection1"] = deflection1
+        out["Deflection2"] = deflection2
+        out["LengthAtDeflection1"] = lf - deflection1
+        out["LengthAtDeflection2"] = lf - deflection2
+        out["LengthStroke"] = out["LengthAtDeflection1"] - out["LengthAtDeflection2"]
+        out["Slenderness"] = lf / dm
+        length_at_solid = d * (nt + acs)
+        out["LengthAtSolid"] = length_at_solid
+        force_at_solid = rate * (lf - length_at_solid)
+        out["ForceAtSolid"] = force_at_solid
+
+        s_f = ks * 8.0 * dm / (math.pi * d * d * d)
+        stress1 = s_f * f1
+        stress2 = s_f * f2
+        stress_solid = s_f * force_at_solid
+        out["StressAtDeflection1"] = stress1
+        out["StressAtDeflection2"] = stress2
+        out["StressAtSolid"] = stress_solid
+
+        tensile = fd.where(pcm == 1, slope_term * (fd.log10(d) - const_term) + tensile_010, tensile)
+        sle = fd.where(pcm <= 2, tensile * pte / 100.0, sle)
+        sls = fd.where(pcm <= 2, tensile * pts / 100.0, sls)
+        out["Tensile"] = tensile
+        out["StressLimitEndurance"] = sle
+        out["StressLimitStatic"] = sls
+
+        out["FactorOfSafetyAtDeflection2"] = fd.where(stress2 > 0.0, sls / stress2, 1.0)
+        out["FactorOfSafetyAtSolid"] = fd.where(stress_solid > 0.0, sls / stress_solid, 1.0)
+        stress_average = (stress1 + stress2) / 2.0
+        stress_range = (stress2 - stress1) / 2.0
+        se2 = sle / 2.0
+        out["FactorOfSafetyAtCycleLife"] = sls / (kc * stress_range * (sls - se2) / se2 + stress_average)
+        cycle_life = CycleLife.cycle_life_array(material, life_category_index, fd.value(tensile), fd.value(stress1), fd.value(stress2))
+        out["CycleLife"] = np.where(pcm == 1, cycle_life, 0.0)
+
+        sq2 = nt * math.pi * dm
+        wire_len_t = fd.sqrt(lf * lf + sq2 * sq2)
+        end_trim = _end_type_columns()[2]
+        wire_len_t = wire_len_t - end_trim[np.clip(et, 0, len(end_trim) - 1)] * d  # e.g. Tapered_C&G
+        out["Weight"] = rho * (math.pi * d * d / 4.0) * wire_len_t
+
+        available = lf - length_at_solid
+        overrun = 100.0 * deflection2 / d + 10000.0 * (length_at_solid + d - lf)
+        percent = 100.0 * deflection2 / available
+        percent = fd.where(lf < length_at_solid + d, fd.minimum(percent, overrun), percent)
+        out["PercentAvailableDeflection"] = fd.where(lf > length_at_solid, percent, overrun)
+        out["Energy"] = 0.5 * rate * (deflection2 * deflection2 - deflection1 * deflection1)
+
+    return out
+
+# Outputs of jacobian(), differentiated with respect to Model.INDEPENDENT.
+JACOBIAN_OUTPUTS = tuple(name for name in OUTPUTS if name != "CycleLife")
+
+def jacobian(*args, **kwargs) -> Dict[str, np.ndarray]:
+    """Return the derivatives of the evaluate() outputs with respect to the Independent variables.
+
+    Takes the arguments of evaluate().  The equations are evaluated once in
+    forward mode, so the result for every output (JACOBIAN_OUTPUTS; CycleLife
+    is a table lookup and has none) has the shape of the broadcast inputs
+    plus a trailing axis ordered as ``Model.INDEPENDENT``.  Derivatives follow
+    the branch each design takes; they are exact except at the branch points.
+    """
+    return fd.jacobian(evaluate(*args, _differentiate=True, **kwargs))
+
+def state_jacobian(state) -> Dict[str, Dict[str, float]]:
+    """Return jacobian() for one CompressionState as { output: { independent: derivative } }.
+
+    Globals (material constants, stress limits, coil counts) are taken from
+    the state as update_properties() uses them.
+    """
+    def index(name, selection):
+        return Enums.enum_index("Compression", name, selection)
+
+    jac = jacobian(
+        state.OutsideDiameterAtFree, state.WireDiameter, state.LengthAtFree, state.CoilsTotal,
+        state.ForceAtDeflection1, state.ForceAtDeflection2,
+        end_type_index=index("EndType", state.EndType),
+        coils_inactive=state.CoilsInactive,
+        add_coils_at_solid=state.AddCoilsAtSolid,
+        life_category_index=index("LifeCategory", state.LifeCategory),
+        prop_calc_method_index=index("PropCalcMethod", state.PropCalcMethod),
+        material=Enums.enum_value(state.MaterialType),
+        density=state.Density,
+        torsion_modulus=state.TorsionModulus,
+        hot_factor_kh=state.HotFactorKh,
+        tensile=state.Tensile,
+        percent_tensile_endurance=state.PercentTensileEndurance,
+        percent_tensile_static=state.PercentTensileStatic,
+        stress_limit_endurance=state.StressLimitEndurance,
+        stress_limit_static=state.StressLimitStatic,
+        const_term=state.const_term,
+        slope_term=state.slope_term,
+        tensile_010=state.tensile_010,
+    )
+    return {name: dict(zip(SpringModel.INDEPENDENT, grad.tolist())) for name, grad in jac.items()}
@@ -0,0 +1,436 @@
+"""Headless calculation model for compression springs.
+
+The functions in this module implement the compression spring equations on a
+``CompressionState`` and never import FreeCAD, so they can run in scripts and
+worker processes.  ``Utils`` adapts them to the FeaturePython object.
+"""
+
+from __future__ import annotations
+import math
+
+from .. import CycleLife, Enums, Log, Materials, Profiling
+from ..Dependency import DependencyGraph, Node
+from ..Search import Constraint, SearchProblem
+from ..State import SpringState
+
+# Material of new springs.  All material constants come from the material
+# table; the MUSIC_WIRE_* names below are the defaults of new objects.
+MUSIC_WIRE_MATERIAL_TYPE = "MUSIC_WIRE"
+_MUSIC_WIRE = Materials.load_materials().row(MUSIC_WIRE_MATERIAL_TYPE)
+MUSIC_WIRE_ASTM_FS = _MUSIC_WIRE["astm_fs"]
+MUSIC_WIRE_FEDSPEC = _MUSIC_WIRE["fedspec"]
+MUSIC_WIRE_DENSITY = _MUSIC_WIRE["Density"]
+MUSIC_WIRE_ELASTIC_MODULUS = _MUSIC_WIRE["ee"]
+MUSIC_WIRE_SHEAR_MODULUS = _MUSIC_WIRE["gg"] * 1.0e9  # Pascals
+MUSIC_WIRE_HOT_FACTOR_KH = _MUSIC_WIRE["kh"]  # Ratio
+MUSIC_WIRE_T010 = _MUSIC_WIRE["t010"]
+MUSIC_WIRE_T400 = _MUSIC_WIRE["t400"]
+MUSIC_WIRE_PTE1 = _MUSIC_WIRE["pte1"]
+
+# Material table column of PercentTensileEndurance, by 1-based LifeCategory index.
+PTE_COLUMNS = {1: "pte1", 2: "pte2", 3: "pte3", 4: "pte4", 5: "pte1", 6: "pte6", 7: "pte7", 8: "pte8"}
+
+INDEPENDENT = (
+    "OutsideDiameterAtFree",
+    "WireDiameter",
+    "LengthAtFree",
+    "CoilsTotal",
+    "ForceAtDeflection1",
+    "ForceAtDeflection2",
+)
+
+DEPENDENT = (
+    "MeanDiameterAtFree",
+    "CoilsActive",
+    "Pitch",
+    "Rate",
+    "Deflection1",
+    "Deflection2",
+    "LengthAtDeflection1",
+    "LengthAtDeflection2",
+    "LengthStroke",
+    "LengthAtSolid",
+    "Slenderness",
+    "InsideDiameterAtFree",
+    "Weight",
+    "SpringIndex",
+    "ForceAtFree",
+    "ForceAtSolid",
+    "StressAtDeflection1",
+    "StressAtDeflection2",
+    "StressAtSolid",
+    "FactorOfSafetyAtDeflection2",
+    "FactorOfSafetyAtSolid",
+    "FactorOfSafetyAtCycleLife",
+    "CycleLife",
+    "PercentAvailableDeflection",
+    "Energy",
+)
+
+GLOBAL = (
+    "SpringType",
+    "PropCalcMethod",
+    "MaterialType",
+    "ASTMFedSpec",
+    "Process",
+    "MaterialFile",
+    "LifeCategory",
+    "Density",
+    "TorsionModulus",
+    "HotFactorKh",
+    "Tensile",
+    "PercentTensileEndurance",
+    "PercentTensileStatic",
+    "StressLimitEndurance",
+    "StressLimitStatic",
+    "EndType",
+    "CoilsInactive",
+    "AddCoilsAtSolid",
+    "CatalogName",
+    "CatalogNumber",
+    "tbase010",
+    "tbase400",
+    "const_term",
+    "slope_term",
+    "tensile_010",
+)
+
+# Properties assigned by update_globals() and update_properties() respectively.
+GLOBAL_RESULTS = (
+    "ASTMFedSpec",
+    "Process",
+    "HotFactorKh",
+    "Density",
+    "TorsionModulus",
+    "tensile_010",
+    "PercentTensileEndurance",
+    "PercentTensileStatic",
+    "const_term",
+    "slope_term",
+    "Tensile",
+    "StressLimitEndurance",
+    "StressLimitStatic",
+)
+PROPERTY_RESULTS = DEPENDENT + ("Tensile", "StressLimitEndurance", "StressLimitStatic", "CoilsInactive", "AddCoilsAtSolid")
+
+class CompressionState(SpringState):
+    """Property snapshot of a compression spring."""
+
+    FIELDS = {
+        "OutsideDiameterAtFree": 28.0,
+        "WireDiameter": 2.8,
+        "LengthAtFree": 80.0,
+        "CoilsTotal": 10.0,
+        "ForceAtDeflection1": 50.0,
+        "ForceAtDeflection2": 190.0,
+        **{name: 0.0 for name in DEPENDENT},
+        "SpringType": "Compression",
+        "PropCalcMethod": "Use values from material table",
+        "MaterialType": MUSIC_WIRE_MATERIAL_TYPE,
+        "ASTMFedSpec": MUSIC_WIRE_ASTM_FS + "/" + MUSIC_WIRE_FEDSPEC,
+        "Process": "Cold Coiled",
+        "MaterialFile": "",
+        "LifeCategory": "Static - Not peened",
+        "Density": MUSIC_WIRE_DENSITY,
+        "TorsionModulus": MUSIC_WIRE_SHEAR_MODULUS,
+        "HotFactorKh": MUSIC_WIRE_HOT_FACTOR_KH,
+        "Tensile": 0.0,
+        "PercentTensileEndurance": 0.0,
+        "PercentTensileStatic": 0.0,
+        "StressLimitEndurance": 0.0,
+        "StressLimitStatic": 0.0,
+        "EndType": "Open",
+        "CoilsInactive": 0.0,
+        "AddCoilsAtSolid": 0.0,
+        "CatalogName": "",
+        "CatalogNumber": "",
+        "tbase010": 0.010,
+        "tbase400": 0.400,
+        "const_term": 0.0,
+        "slope_term": 0.0,
+        "tensile_010": 1000.0 * MUSIC_WIRE_T010,
+    }
+    __slots__ = tuple(FIELDS)
+
+def _enum_index(name: str, selection) -> int:
+    """Return the 1-based index of a compression enumeration selection."""
+
+    return Enums.enum_index("Compression", name, selection)
+
+def update_globals(state) -> None:
+    """Update global properties based on the state's global properties."""
+
+    prop_calc_method_index = _enum_index("PropCalcMethod", state.PropCalcMethod)
+    match prop_calc_method_index:
+        case 1: # Prop_Calc_Method = 1 - Use values from material table
+            materials = Materials.load_materials()
+            if state.MaterialType not in materials:
+                Log.warning("[update_globals] Unknown MaterialType %r; material globals not updated", state.MaterialType)
+                return
+            material = materials.row(state.MaterialType)
+            state.ASTMFedSpec = material["astm_fs"] + "/" + material["fedspec"]
+            state.HotFactorKh = material["kh"]
+            if state.HotFactorKh < 1.0:
+                state.Process = "Hot Wound"
+            else :
+                state.Process = "Cold Coiled"
+            state.Density = material["Density"]
+            state.TorsionModulus = material["gg"] * 1.0e9
+            state.tensile_010 =  1000 * material["t010"]
+            tensile_400 = 1000 * material["t400"]
+            life_category_index = _enum_index("LifeCategory", state.LifeCategory)
+            if life_category_index in PTE_COLUMNS:
+                state.PercentTensileEndurance = material[PTE_COLUMNS[life_category_index]]
+            state.PercentTensileStatic = material["pte1"]
+            state.const_term = math.log10(state.tbase010);
+            state.slope_term = (tensile_400 - state.tensile_010) / (math.log10(state.tbase400) - state.const_term);
+            state.Tensile = state.slope_term * (math.log10(state.WireDiameter) - state.const_term) + state.tensile_010;
+            state.StressLimitEndurance = state.Tensile * state.PercentTensileEndurance / 100.0;
+            state.StressLimitStatic = state.Tensile * state.PercentTensileStatic / 100.0;
+        case 2: # Prop_Calc_Method = 2 - Specify Tensile, %_Tensile_Stat & %_Tensile_Endur
+            pass #tbd
+        case 3: # Prop_Calc_Method = 3 - Specify Stress_Lim_Stat & Stress_Lim_Endur
+            pass #tbd
+
+# Calculation steps of update_properties(), in run order.  Each step names the
+# properties it reads so that update_changed() can skip unaffected steps.
+_PROPERTY_NODES = []
+
+def _node(outputs, inputs):
+    def register(compute):
+        _PROPERTY_NODES.append(Node(outputs, inputs, compute, "update_properties"))
+        return compute
+    return register
+
+def _curvature_factors(state):
+    """Return the Wahl curvature factor kc and the stress correction factor ks."""
+
+    kc = (4.0 * state.SpringIndex - 1.0) / (4.0 * state.SpringIndex - 4.0)
+    ks = kc + 0.615 / state.SpringIndex
+    return kc, ks
+
+def _stress_factor(state):
+    """Return the shear stress per unit force."""
+
+    _kc, ks = _curvature_factors(state)
+    return ks * 8.0 * state.MeanDiameterAtFree / (math.pi * state.WireDiameter * state.WireDiameter * state.WireDiameter)
+
+@_node(("MeanDiameterAtFree",), ("OutsideDiameterAtFree", "WireDiameter"))
+def _mean_diameter(state):
+    state.MeanDiameterAtFree = state.OutsideDiameterAtFree - state.WireDiameter
+
+@_node(("InsideDiameterAtFree",), ("MeanDiameterAtFree", "WireDiameter"))
+def _inside_diameter(state):
+    state.InsideDiameterAtFree = state.MeanDiameterAtFree - state.WireDiameter
+
+@_node(("SpringIndex",), ("MeanDiameterAtFree", "WireDiameter"))
+def _spring_index(state):
+    state.SpringIndex = state.MeanDiameterAtFree / state.WireDiameter
+
+@_node(("CoilsInactive", "AddCoilsAtSolid"), ("EndType",))
+def _end_type_coils(state):
+    end_type_index = _enum_index("EndType", state.EndType)
+    if 1 <= end_type_index <= 6: # User Specified keeps the entered values
+        end_types = Enums.enum_table("Compression", "EndType")
+        state.CoilsInactive = end_types.value(end_type_index, "CoilsInactive")
+        state.AddCoilsAtSolid = end_types.value(end_type_index, "AddCoilsAtSolid")
+
+@_node(("CoilsActive",), ("CoilsTotal", "CoilsInactive"))
+def _coils_active(state):
+    state.CoilsActive = state.CoilsTotal - state.CoilsInactive
+
+@_node(("Pitch",), ("EndType", "LengthAtFree", "WireDiameter", "CoilsTotal", "CoilsInactive", "CoilsActive"))
+def _pitch(state):
+    match _enum_index("EndType", state.EndType):
+        case 1: # Open
+            state.Pitch = (state.LengthAtFree - state.WireDiameter) / state.CoilsActive
+        case 2: # Open & Ground
+            state.Pitch = state.LengthAtFree / state.CoilsTotal
+        case 3: # Closed
+            state.Pitch = (state.LengthAtFree - 3.0 * state.WireDiameter) / state.CoilsActive
+        case 4: # Closed & Ground
+            state.Pitch = (state.LengthAtFree - 2.0 * state.WireDiameter) / state.CoilsActive
+        case 5: # Tapered Closed & Ground
+            state.Pitch = (state.LengthAtFree - 1.5 * state.WireDiameter) / state.CoilsActive
+        case 6: # Pig-tail
+            state.Pitch = (state.LengthAtFree - 2.0 * state.WireDiameter) / state.CoilsActive
+        case _: # User Specified
+            state.Pitch = (state.LengthAtFree - (state.CoilsInactive + 1.0) * state.WireDiameter) / state.CoilsActive
+
+@_node(("Rate",), ("HotFactorKh", "TorsionModulus", "MeanDiameterAtFree", "CoilsActive", "SpringIndex"))
+def _rate(state):
+    temp = state.SpringIndex * state.SpringIndex
+    state.Rate = state.HotFactorKh * (state.TorsionModulus / 1.0e6) * state.MeanDiameterAtFree / (8.0 * state.CoilsActive * temp * temp)
+
+@_node(("Deflection1",), ("ForceAtDeflection1", "Rate"))
+def _deflection1(state):
+    state.Deflection1 = state.ForceAtDeflection1 / state.Rate
+
+@_node(("Deflection2",), ("ForceAtDeflection2", "Rate"))
+def _deflection2(state):
+    state.Deflection2 = state.ForceAtDeflection2 / state.Rate
+
+@_node(("LengthAtDeflection1",), ("LengthAtFree", "Deflection1"))
+def _length_at_deflection1(state):
+    state.LengthAtDeflection1 = state.LengthAtFree - state.Deflection1
+
+@_node(("LengthAtDeflection2",), ("LengthAtFree", "Deflection2"))
+def _length_at_deflection2(state):
+    state.LengthAtDeflection2 = state.LengthAtFree - state.Deflection2
+
+@_node(("LengthStroke",), ("LengthAtDeflection1", "LengthAtDeflection2"))
+def _length_stroke(state):
+    state.LengthStroke = state.LengthAtDeflection1 - state.LengthAtDeflection2
+
+@_node(("Slenderness",), ("LengthAtFree", "MeanDiameterAtFree"))
+def _slenderness(state):
+    state.Slenderness = state.LengthAtFree / state.MeanDiameterAtFree
+
+@_node(("LengthAtSolid",), ("WireDiameter", "CoilsTotal", "AddCoilsAtSolid"))
+def _length_at_solid(state):
+    state.LengthAtSolid = state.WireDiameter * (state.CoilsTotal + state.AddCoilsAtSolid)
+
+@_node(("ForceAtSolid",), ("Rate", "LengthAtFree", "LengthAtSolid"))
+def _force_at_solid(state):
+    state.ForceAtSolid = state.Rate * (state.LengthAtFree - state.LengthAtSolid)
+
+@_node(("StressAtDeflection1",), ("SpringIndex", "MeanDiameterAtFree", "WireDiameter", "ForceAtDeflection1"))
+def _stress_at_deflection1(state):
+    state.StressAtDeflection1 = _stress_factor(state) * state.ForceAtDeflection1
+
+@_node(("StressAtDeflection2",), ("SpringIndex", "MeanDiameterAtFree", "WireDiameter", "ForceAtDeflection2"))
+def _stress_at_deflection2(state):
+    state.StressAtDeflection2 = _stress_factor(state) * state.ForceAtDeflection2
+
+@_node(("StressAtSolid",), ("SpringIndex", "MeanDiameterAtFree", "WireDiameter", "ForceAtSolid"))
+def _stress_at_solid(state):
+    state.StressAtSolid = _stress_factor(state) * state.ForceAtSolid
+
+@_node(("Tensile",), ("PropCalcMethod", "slope_term", "const_term", "tensile_010", "WireDiameter"))
+def _tensile(state):
+    if _enum_index("PropCalcMethod", state.PropCalcMethod) == 1:
+        state.Tensile = state.slope_term * (math.log10(state.WireDiameter) - state.const_term) + state.tensile_010
+
+@_node(("StressLimitEndurance", "StressLimitStatic"), ("PropCalcMethod", "Tensile", "PercentTensileEndurance", "PercentTensileStatic"))
+def _stress_limits(state):
+    if _enum_index("PropCalcMethod", state.PropCalcMethod) <= 2:
+        state.StressLimitEndurance = state.Tensile * state.PercentTensileEndurance / 100.0
+        state.StressLimitStatic  = state.Tensile * state.PercentTensileStatic  / 100.0
+
+@_node(("FactorOfSafetyAtDeflection2",), ("StressLimitStatic", "StressAtDeflection2"))
+def _factor_of_safety_at_deflection2(state):
+    if state.StressAtDeflection2 > 0.0:
+        state.FactorOfSafetyAtDeflection2 = state.StressLimitStatic / state.StressAtDeflection2
+    else:
+        state.FactorOfSafetyAtDeflection2 = 1.0
+
+@_node(("FactorOfSafetyAtSolid",), ("StressLimitStatic", "StressAtSolid"))
+def _factor_of_safety_at_solid(state):
+    if state.StressAtSolid > 0.0:
+        state.FactorOfSafetyAtSolid = state.StressLimitStatic / state.StressAtSolid
+    else:
+        state.FactorOfSafetyAtSolid = 1.0
+
+@_node(("FactorOfSafetyAtCycleLife",), ("SpringIndex", "StressAtDeflection1", "StressAtDeflection2", "StressLimitEndurance", "StressLimitStatic"))
+def _factor_of_safety_at_cycle_life(state):
+    kc, _ks = _curvature_factors(state)
+    stress_average = (state.StressAtDeflection1 + state.StressAtDeflection2) / 2.0
+    stress_range = (state.StressAtDeflection2 - state.StressAtDeflection1) / 2.0
+    se2 = state.StressLimitEndurance / 2.0
+    state.FactorOfSafetyAtCycleLife =  state.StressLimitStatic / (kc * stress_range * (state.StressLimitStatic - se2) / se2 + stress_average)
+
+@_node(("CycleLife",), ("PropCalcMethod", "MaterialType", "LifeCategory", "Tensile", "StressAtDeflection1", "StressAtDeflection2"))
+def _cycle_life(state):
+    if _enum_index("PropCalcMethod", state.PropCalcMethod) == 1:
+        life_category_index = _enum_index("LifeCategory", state.LifeCategory)
+        state.CycleLife = CycleLife.cycle_life(state.MaterialType, life_category_index, state.Tensile, state.StressAtDeflection1, state.StressAtDeflection2)
+    else:
+        state.CycleLife = 0.0
+
+@_node(("Weight",), ("EndType", "Density", "LengthAtFree", "CoilsTotal", "MeanDiameterAtFree", "WireDiameter"))
+def _weight(state):
+    sq1 = state.LengthAtFree
+    sq2 = state.CoilsTotal * math.pi * state.MeanDiameterAtFree
+    wire_len_t = math.sqrt(sq1 * sq1 + sq2 * sq2)
+    end_type_index = _enum_index("EndType", state.EndType)
+    if end_type_index > 0: # e.g. Tapered_C&G
+        wire_len_t = wire_len_t - Enums.enum_table("Compression", "EndType").value(end_type_index, "EndTrim") * state.WireDiameter
+    state.Weight = state.Density * (math.pi * state.WireDiameter * state.WireDiameter / 4.0) * wire_len_t
+
+@_node(("PercentAvailableDeflection",), ("LengthAtFree", "LengthAtSolid", "Deflection2", "WireDiameter"))
+def _percent_available_deflection(state):
+    if state.LengthAtFree > state.LengthAtSolid:
+        state.PercentAvailableDeflection = 100.0 * state.Deflection2 / (state.LengthAtFree - state.LengthAtSolid)
+        if state.LengthAtFree < state.LengthAtSolid + state.WireDiameter:
+            temp = 100.0 * state.Deflection2 / state.WireDiameter + 10000.0 * (state.LengthAtSolid + state.WireDiameter - state.LengthAtFree)
+            if temp < state.PercentAvailableDeflection:
+                state.PercentAvailableDeflection = temp
+    else:
+        state.PercentAvailableDeflection = 100.0 * state.Deflection2 / state.WireDiameter + 10000.0 * (state.LengthAtSolid + state.WireDiameter - state.LengthAtFree)
+
+@_node(("Energy",), ("Rate", "Deflection1", "Deflection2"))
+def _energy(state):
+    state.Energy = 0.5 * state.Rate * (state.Deflection2 * state.Deflection2 - state.Deflection1 * state.Deflection1)
+
+GLOBALS_NODE = Node(
+    tuple(name for name in GLOBAL_RESULTS if name not in ("Tensile", "StressLimitEndurance", "StressLimitStatic")),
+    ("PropCalcMethod", "MaterialType", "LifeCategory", "tbase010", "tbase400"),
+    update_globals,
+    "update_globals",
+)
+
+# Dependency graph of update_globals() followed by update_properties().
+GRAPH = DependencyGraph([GLOBALS_NODE] + _PROPERTY_NODES)
+
+# Properties whose change requires update_globals().
+GLOBAL_INPUTS = GLOBALS_NODE.inputs
+
+def update_properties(state) -> None:
+    """Update dependent properties based on the state's properties."""
+
+    for node in _PROPERTY_NODES:
+        node.compute(state)
+
+def update(state) -> None:
+    """Run update_globals() followed by update_properties()."""
+
+    with Profiling.phase("update_globals"):
+        update_globals(state)
+    with Profiling.phase("update_properties"):
+        update_properties(state)
+
+def update_changed(state, changed=None):
+    """Recompute only what depends on the ``changed`` property names.
+
+    With ``changed`` None everything is recomputed.  Returns the names of the
+    properties that took a new value.
+    """
+    return GRAPH.evaluate(state, changed)
+
+# Independent variables a design search adjusts by default; the forces are the requirements.
+SEARCH_FREE = ("OutsideDiameterAtFree", "WireDiameter", "LengthAtFree", "CoilsTotal")
+
+# Default design constraints, after ODOP's compression spring defaults.
+SEARCH_CONSTRAINTS = (
+    Constraint("SpringIndex", minimum=4.0, maximum=25.0),
+    Constraint("CoilsActive", minimum=1.0),
+    Constraint("InsideDiameterAtFree", minimum=0.0),
+    Constraint("FactorOfSafetyAtDeflection2", minimum=1.0),
+    Constraint("FactorOfSafetyAtSolid", minimum=1.0),
+    Constraint("PercentAvailableDeflection", maximum=98.0),
+)
+
+# Range of each Independent variable explored by searches and multi-start seeding (mm, coils).
+SEARCH_BOUNDS = {
+    "OutsideDiameterAtFree": (1.0, 250.0),
+    "WireDiameter": (0.1, 25.0),
+    "LengthAtFree": (1.0, 1000.0),
+    "CoilsTotal": (2.0, 100.0),
+}
+
+def search_problem(state, constraints=SEARCH_CONSTRAINTS, free=SEARCH_FREE, bounds=None, merit="Weight") -> SearchProblem:
+    """Return a SearchProblem that varies ``free`` of a copy of ``state``.
+
+    ``bounds`` defaults to SEARCH_BOUNDS.
+    """
+    return SearchProblem(state.copy(), update, tuple(free), tuple(constraints), dict(SEARCH_BOUNDS if bounds is None else bounds), merit)
@@ -2,12 +2,17 @@ import FreeCAD
 from pathlib import Path
 
 from .. import Utils as CoreUtils
+from .. import Log, Preview, Profiling
 from ..ViewProviderSpring import ViewProviderSpring
+from . import Model as SpringModel
 from . import Utils as SpringUtils
 
+# Load requirements whose change may trigger the automatic design search.
+AUTO_SEARCH_TRIGGERS = {"ForceAtDeflection1", "ForceAtDeflection2"}
+
 class CompressionSpring:
     def __init__(self, obj):
-        FreeCAD.Console.PrintMessage(f"[CompressionSpring.__init__] self={self} obj={obj}\n")
+        Log.debug("[CompressionSpring.__init__] self=%s obj=%s", self, obj)
         CoreUtils.add_property(obj, "OutsideDiameterAtFree", 28, "App::PropertyFloat", "Independent")
         CoreUtils.add_property(obj, "WireDiameter", 2.8, "App::PropertyFloat", "Independent")
         CoreUtils.add_property(obj, "LengthAtFree", 80.0, "App::PropertyFloat", "Independent")
@@ -44,7 +49,8 @@ class CompressionSpring:
         CoreUtils.add_property(obj, "SpringType", "Compression", "App::PropertyString", "Global")
         CoreUtils.add_property(obj, "PropCalcMethod", None, "App::PropertyEnumeration", "Global")
         CoreUtils.reload_enum(obj, "Compression", "PropCalcMethod")
-        CoreUtils.add_property(obj, "MaterialType", SpringUtils.MUSIC_WIRE_MATERIAL_TYPE, "App::PropertyString", "Global")
+        CoreUtils.add_property(obj, "MaterialType", None, "App::PropertyEnumeration", "Global")
+        SpringUtils.reload_material_enum(obj)
         CoreUtils.add_property(obj, "ASTMFedSpec", SpringUtils.MUSIC_WIRE_ASTM_FS + "/" + SpringUtils.MUSIC_WIRE_FEDSPEC, "App::PropertyString", "Global")
         CoreUtils.add_property(obj, "Process", "Cold Coiled", "App::PropertyString", "Global")
         CoreUtils.add_property(obj, "MaterialFile", "", "App::PropertyString", "Global", 2) # hidden
@@ -70,40 +76,77 @@ class CompressionSpring:
         CoreUtils.add_property(obj, "slope_term", 0.0, "App::PropertyFloat", "Global", 2)
         CoreUtils.add_property(obj, "tensile_010", 1000.0 * SpringUtils.MUSIC_WIRE_T010, "App::PropertyFloat", "Global", 2)
 
+        CoreUtils.add_property(obj, "ShapeDetail", list(Preview.SHAPE_DETAILS), "App::PropertyEnumeration", "Shape")
+        CoreUtils.add_property(obj, "ShapeIsPreview", False, "App::PropertyBool", "Shape", 2)
+        CoreUtils.add_property(obj, "ShapeSignature", "", "App::PropertyString", "Shape", 2)
+
         obj.Proxy = self
         ViewProviderSpring(obj.ViewObject)
-        SpringUtils.update_globals(obj)
-        SpringUtils.update_properties(obj)
+        if CoreUtils.updates_deferred(obj):
+            self._changed = None  # the first execute runs the full update
+        else:
+            self._update(obj)
+            self._changed = set()
 
     def execute(self, obj):
-        FreeCAD.Console.PrintMessage(f"[CompressionSpring.execute] self={self} obj={obj}\n")
-        obj.Shape = CoreUtils.helix_solid(obj.OutsideDiameterAtFree / 2.0, obj.Pitch, obj.LengthAtFree, obj.WireDiameter / 2.0)
-        SpringUtils.update_globals(obj)
-        SpringUtils.update_properties(obj)
+        Log.debug("[CompressionSpring.execute] self=%s obj=%s", self, obj)
+        if CoreUtils.updates_deferred(obj):
+            return  # changes stay recorded until the spring_batch() block ends
+        with Profiling.recompute(obj):
+            changed = self._take_changes()
+            if changed and changed & AUTO_SEARCH_TRIGGERS and self._auto_search(obj):
+                changed = None
+            self._update(obj, changed)
+            Preview.update_shape(
+                obj, obj.OutsideDiameterAtFree / 2.0, obj.Pitch, obj.LengthAtFree, obj.WireDiameter / 2.0,
+                *SpringUtils.end_geometry(obj),
+            )
 
     def onChanged(self, obj, prop):
-        FreeCAD.Console.PrintMessage(f"[CompressionSpring.execute] self={self} obj={obj}\n")
-        if prop == "PropCalcMethod":
-            selection = getattr(obj, "PropCalcMethod", None)
-            if isinstance(selection, (list, tuple)):
-                selection = selection[0] if selection else None
-            SpringUtils.update_globals(obj)
-            SpringUtils.update_properties(obj)
-        if prop == "LifeCategory":
-            selection = getattr(obj, "LifeCategory", None)
-            if isinstance(selection, (list, tuple)):
-                selection = selection[0] if selection else None
-            SpringUtils.update_globals(obj)
-            SpringUtils.update_properties(obj)
-        if prop == "EndType":
-            selection = getattr(obj, "EndType", None)
-            if isinstance(selection, (list, tuple)):
-                selection = selection[0] if selection else None
-            SpringUtils.update_globals(obj)
-            SpringUtils.update_properties(obj)
+        Log.debug("[CompressionSpring.onChanged] self=%s obj=%s prop=%s", self, obj, prop)
+        if getattr(self, "_updating", False):
+            return
+        if prop in ("PropCalcMethod", "LifeCategory", "EndType") and not CoreUtils.updates_deferred(obj):
+            self._update(obj, {prop})
+        elif prop in SpringModel.GRAPH.inputs:
+            changed = getattr(self, "_changed", None)
+            if changed is not None:
+                changed.add(prop)
+
+    def _take_changes(self):
+        """Return the inputs changed since the last update, or None for a full update."""
+        changed = getattr(self, "_changed", None)
+        self._changed = set()
+        return changed or None
+
+    def _auto_search(self, obj):
+        """Run the automatic design search without recording its writes as edits."""
+        self._updating = True
+        try:
+            with Profiling.phase("auto_search"):
+                return SpringUtils.auto_search(obj) is not None
+        finally:
+            self._updating = False
+
+    def _update(self, obj, changed=None):
+        """Recompute the properties affected by ``changed`` without recording our own writes."""
+        self._updating = True
+        try:
+            SpringUtils.update(obj, changed)
+        finally:
+            self._updating = False
+
+    def onDocumentRestored(self, obj):
+        SpringUtils.reload_material_enum(obj)
+
+    def __getstate__(self):
+        return None
+
+    def __setstate__(self, state):
+        return None
 
 def make():
-    FreeCAD.Console.PrintMessage(f"[make]\n")
+    Log.debug("[make]")
     doc = FreeCAD.ActiveDocument
     if doc is None:
         return None
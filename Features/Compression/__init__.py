@@ -1,6 +1,20 @@
-"""Compression spring feature package."""
+"""Compression spring feature package.
 
-from .Spring import CompressionSpring, make
-from . import Utils
+``Model`` holds the FreeCAD-free calculations; the FeaturePython class in
+``Spring`` is imported on first use so the model can be loaded without FreeCAD.
+"""
 
-__all__ = ["CompressionSpring", "make", "Utils"]
+import importlib
+
+_LAZY = {"CompressionSpring": ".Spring", "make": ".Spring"}
+
+__all__ = ["CompressionSpring", "make", "Utils", "Model", "Batch"]
+
+def __getattr__(name):
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,183 @@
+"""Cycle life from the material table's S-N data.
+
+Every material row lists the percentage of tensile strength a spring endures
+for 10 million, 1 million and 100,000 cycles (``pte4``/``pte3``/``pte2`` not
+peened, ``pte8``/``pte7``/``pte6`` shot peened, ``ptb*`` for torsion springs)
+and statically (``pte1``/``ptb1``, taken as 10,000 cycles).  The life is
+interpolated linearly in log10(cycles) between those points, after ODOP's
+``cyclelife_calculation``.  The interpolation lines are precomputed once per
+(material, LifeCategory) in units of tensile strength, so the scalar path is a
+bisection and a power of ten and ``cycle_life_array`` evaluates whole design
+sweeps with NumPy.  The scalar path only depends on the standard library.
+"""
+
+import math
+from bisect import bisect_right
+from typing import Dict, Optional, Tuple
+
+from . import Materials
+
+# log10 of the cycle counts of the S-N points: 10 million, 1 million, 100,000 and 10,000 cycles.
+LOG_CYCLES = (7.0, 6.0, 5.0, 4.0)
+
+# Material columns of the S-N points, in LOG_CYCLES order, by (torsion, shot peened).
+SN_COLUMNS = {
+    (False, False): ("pte4", "pte3", "pte2", "pte1"),
+    (False, True): ("pte8", "pte7", "pte6", "pte1"),
+    (True, False): ("ptb4", "ptb3", "ptb2", "ptb1"),
+    (True, True): ("ptb8", "ptb7", "ptb6", "ptb1"),
+}
+
+# LifeCategory indices 1-4 are not peened, 5-8 shot peened.
+LIFE_CATEGORIES = 8
+
+# Fraction of tensile strength used as the ultimate stress of the Goodman line (compression and extension).
+ULTIMATE_FRACTION = 0.67
+
+# Smallest stress difference kept positive in the equivalent stress calculation.
+SMALLNUM = 1.0e-7
+
+class SNTable:
+    """Piecewise-linear log10(cycles) of the stress-to-tensile ratio for one material and LifeCategory.
+
+    ``fractions`` are the S-N points as fractions of tensile strength (in
+    LOG_CYCLES order); segment ``i`` is ``intercepts[i] + slopes[i] * ratio``.
+    """
+
+    __slots__ = ("fractions", "intercepts", "slopes", "torsion")
+
+    def __init__(self, percents, torsion=False):
+        self.fractions = tuple(0.01 * p for p in percents)
+        self.torsion = torsion
+        slopes, intercepts = [], []
+        for i in range(len(LOG_CYCLES) - 1):
+            span = self.fractions[i + 1] - self.fractions[i]
+            slope = (LOG_CYCLES[i + 1] - LOG_CYCLES[i]) / span if span > 0.0 else math.nan
+            slopes.append(slope)
+            intercepts.append(LOG_CYCLES[i] - slope * self.fractions[i])
+        self.slopes = tuple(slopes)
+        self.intercepts = tuple(intercepts)
+
+    @property
+    def valid(self) -> bool:
+        """True if the S-N points increase strictly, i.e. the material has data for this category."""
+        return not any(math.isnan(s) for s in self.slopes)
+
+    def log_cycles(self, ratio: float) -> float:
+        """Return log10(cycles) at a stress of ``ratio`` times tensile strength."""
+
+        # Points beyond either end extrapolate the first or last segment.
+        segment = min(max(bisect_right(self.fractions, ratio) - 1, 0), len(self.slopes) - 1)
+        return self.intercepts[segment] + self.slopes[segment] * ratio
+
+    def cycle_life(self, tensile: float, stress1: float, stress2: float) -> float:
+        """Return the cycles to failure between ``stress1`` and ``stress2``, or 0.0 without S-N data."""
+
+        if not self.valid or tensile <= 0.0:
+            return 0.0
+        stress = equivalent_stress(tensile, stress1, stress2, self.torsion)
+        return 10.0 ** self.log_cycles(stress / tensile)
+
+def equivalent_stress(tensile: float, stress1: float, stress2: float, torsion: bool = False) -> float:
+    """Return the zero-minimum stress equivalent to cycling between ``stress1`` and ``stress2``."""
+
+    ultimate = tensile if torsion else ULTIMATE_FRACTION * tensile
+    margin1 = max(ultimate - stress1, SMALLNUM)
+    margin2 = max(ultimate - stress2, SMALLNUM)
+    return max(stress2 - stress1 * margin2 / margin1, SMALLNUM)
+
+_TABLES: Dict[Tuple[str, int, bool], SNTable] = {}  # { (material, LifeCategory index, torsion): SNTable }
+_SOURCE = None  # MaterialTable the cached tables were built from
+
+def _materials():
+    """Return the material table, dropping cached S-N data when it was reloaded."""
+
+    global _SOURCE
+    materials = Materials.load_materials()
+    if materials is not _SOURCE:
+        _TABLES.clear()
+        _ARRAYS.clear()
+        _SOURCE = materials
+    return materials
+
+def sn_table(material: str, life_category_index: int, torsion: bool = False) -> Optional[SNTable]:
+    """Return the S-N table of ``material`` for a 1-based LifeCategory index, or None if unknown."""
+
+    materials = _materials()
+    key = (material, life_category_index, torsion)
+    table = _TABLES.get(key)
+    if table is None:
+        if material not in materials or not 1 <= life_category_index <= LIFE_CATEGORIES:
+            return None
+        columns = SN_COLUMNS[(torsion, life_category_index > LIFE_CATEGORIES // 2)]
+        row = materials.row(material)
+        table = _TABLES[key] = SNTable([row[column] for column in columns], torsion)
+    return table
+
+def cycle_life(material: str, life_category_index: int, tensile: float, stress1: float, stress2: float, torsion: bool = False) -> float:
+    """Return the cycle life of one spring, or 0.0 if the material or category has no S-N data."""
+
+    table = sn_table(material, life_category_index, torsion)
+    return table.cycle_life(tensile, stress1, stress2) if table is not None else 0.0
+
+# ------------------------------------------------------------
+_ARRAYS = {}  # { torsion: (fractions, intercepts, slopes) } indexed by [material row, LifeCategory index]
+
+def sn_arrays(torsion: bool = False):
+    """Return the S-N tables of all materials and LifeCategories as NumPy arrays.
+
+    The result is (fractions, intercepts, slopes) of shapes (materials, 9, 4),
+    (materials, 9, 3) and (materials, 9, 3), indexed by material table row and
+    1-based LifeCategory index; index 0 and invalid tables hold NaN.
+    """
+    import numpy as np
+
+    materials = _materials()
+    arrays = _ARRAYS.get(torsion)
+    if arrays is None:
+        shape = (len(materials), LIFE_CATEGORIES + 1)
+        fractions = np.full(shape + (len(LOG_CYCLES),), np.nan)
+        intercepts = np.full(shape + (len(LOG_CYCLES) - 1,), np.nan)
+        slopes = np.full(shape + (len(LOG_CYCLES) - 1,), np.nan)
+        for row, name in enumerate(materials.names):
+            for index in range(1, LIFE_CATEGORIES + 1):
+                table = sn_table(name, index, torsion)
+                if table.valid:
+                    fractions[row, index] = table.fractions
+                    intercepts[row, index] = table.intercepts
+                    slopes[row, index] = table.slopes
+        arrays = _ARRAYS[torsion] = (fractions, intercepts, slopes)
+    return arrays
+
+def cycle_life_array(material, life_category_index, tensile, stress1, stress2, torsion: bool = False):
+    """Return the cycle life of arrays of stress pairs.
+
+    ``material`` is a material name or an array of names and
+    ``life_category_index`` a 1-based index or an array of them; all arguments
+    are broadcast against each other.  Designs without S-N data give 0.0, as
+    ``cycle_life`` does.
+    """
+    import numpy as np
+
+    materials = _materials()
+    names = np.asarray(material, dtype=object)
+    rows = np.array([materials.index(name) for name in names.ravel()], dtype=np.intp).reshape(names.shape)
+    index = np.asarray(life_category_index, dtype=np.intp)
+    index = np.where((index >= 1) & (index <= LIFE_CATEGORIES), index, 0)
+    rows, index, tensile, stress1, stress2 = np.broadcast_arrays(
+        rows, index, *(np.asarray(v, dtype=float) for v in (tensile, stress1, stress2))
+    )
+
+    fractions, intercepts, slopes = sn_arrays(torsion)
+    fractions, intercepts, slopes = fractions[rows, index], intercepts[rows, index], slopes[rows, index]
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        ultimate = tensile if torsion else ULTIMATE_FRACTION * tensile
+        margin1 = np.maximum(ultimate - stress1, SMALLNUM)
+        margin2 = np.maximum(ultimate - stress2, SMALLNUM)
+        ratio = np.maximum(stress2 - stress1 * margin2 / margin1, SMALLNUM) / tensile
+        # Same segment choice as SNTable.log_cycles: count the inner points at or below the ratio.
+        segment = np.count_nonzero(ratio[..., None] >= fractions[..., 1:-1], axis=-1)
+        segment = segment[..., None]
+        log_cycles = (np.take_along_axis(intercepts, segment, -1) + np.take_along_axis(slopes, segment, -1) * ratio[..., None])[..., 0]
+        life = 10.0 ** log_cycles
+    return np.where(np.isfinite(life) & (tensile > 0.0), life, 0.0)
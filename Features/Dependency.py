@@ -0,0 +1,96 @@
+"""Declared dependency graphs for incremental spring recomputes.
+
+A model registers each calculation step as a ``Node`` naming the properties
+it reads and the properties it assigns.  ``DependencyGraph.evaluate`` then
+runs only the nodes downstream of the properties that changed, in declaration
+order, and reports which outputs actually took a new value.
+"""
+
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from . import Profiling
+
+class Node:
+    """One calculation step: ``compute(state)`` assigns ``outputs`` from ``inputs``.
+
+    ``phase`` names the profiling phase the step is timed under.
+    """
+
+    __slots__ = ("outputs", "inputs", "compute", "phase")
+
+    def __init__(self, outputs: Tuple[str, ...], inputs: Tuple[str, ...], compute: Callable, phase: Optional[str] = None):
+        self.outputs = tuple(outputs)
+        self.inputs = tuple(inputs)
+        self.compute = compute
+        self.phase = phase or compute.__name__
+
+    def __repr__(self):
+        return f"Node({self.compute.__name__}: {self.inputs} -> {self.outputs})"
+
+class DependencyGraph:
+    """Ordered set of nodes with precomputed downstream lookups."""
+
+    def __init__(self, nodes: Iterable[Node]):
+        self.nodes = tuple(nodes)
+        self._consumers: Dict[str, List[int]] = {}
+        produced = set()
+        for index, node in enumerate(self.nodes):
+            for name in node.inputs:
+                if name in node.outputs:
+                    raise ValueError(f"{node!r} reads its own output {name}")
+                self._consumers.setdefault(name, []).append(index)
+            produced.update(node.outputs)
+        for index, node in enumerate(self.nodes):
+            for later in self.nodes[index + 1:]:
+                late = produced.intersection(node.inputs).intersection(later.outputs)
+                if late:
+                    raise ValueError(f"{node!r} reads {sorted(late)} before {later!r} assigns them")
+        self.outputs = frozenset(produced)
+        self.inputs = frozenset(self._consumers)
+        self.sources = self.inputs - self.outputs
+        self._plans: Dict[FrozenSet[str], Tuple[int, ...]] = {}
+
+    def plan(self, changed: Iterable[str]) -> Tuple[int, ...]:
+        """Return the indices of the nodes affected by ``changed``, in run order."""
+
+        key = frozenset(changed)
+        plan = self._plans.get(key)
+        if plan is None:
+            affected = set()
+            pending = list(key)
+            while pending:
+                for index in self._consumers.get(pending.pop(), ()):
+                    if index not in affected:
+                        affected.add(index)
+                        pending.extend(self.nodes[index].outputs)
+            plan = self._plans[key] = tuple(sorted(affected))
+        return plan
+
+    def evaluate(self, state, changed: Optional[Iterable[str]] = None) -> List[str]:
+        """Run the nodes affected by ``changed`` (all nodes if None) on ``state``.
+
+        Returns the names of the outputs whose value differs from before.
+        """
+        if changed is None:
+            nodes = self.nodes
+        else:
+            nodes = [self.nodes[index] for index in self.plan(changed)]
+        before = {name: getattr(state, name) for node in nodes for name in node.outputs}
+        if Profiling.enabled():
+            self._evaluate_profiled(state, nodes)
+        else:
+            for node in nodes:
+                node.compute(state)
+        return [name for name, value in before.items() if getattr(state, name) != value]
+
+    @staticmethod
+    def _evaluate_profiled(state, nodes) -> None:
+        """Run ``nodes``, timing each run of consecutive nodes that share a phase."""
+
+        index = 0
+        while index < len(nodes):
+            with Profiling.phase(nodes[index].phase):
+                phase = nodes[index].phase
+                while index < len(nodes) and nodes[index].phase == phase:
+                    nodes[index].compute(state)
+                    index += 1
@@ -0,0 +1,116 @@
+"""Enumeration tables shared by the FreeCAD features and the headless models.
+
+Each ``<type>/<name>.json`` table is parsed once into an ``EnumTable`` held in
+a registry keyed by (type, name), with a value-to-index dictionary and its
+numeric columns as typed arrays, so enumeration lookups in the calculation hot
+path are constant-time.  This module only depends on the standard library so
+that the calculation models can resolve enumeration selections outside of
+FreeCAD.
+"""
+
+import os, json, time
+from array import array
+from typing import Dict, Tuple
+
+from . import Profiling
+
+# Seconds between checks of a table file's modification time.
+VALIDATE_INTERVAL = 1.0
+
+class EnumTable:
+    """One parsed enumeration table.
+
+    ``values`` are the enumeration choices (first column), ``index`` maps a
+    choice to its 1-based index and ``columns`` maps every other header name
+    to its values, as an ``array("d")`` when the column is numeric.
+    """
+
+    __slots__ = ("type", "name", "path", "mtime", "checked", "header", "rows", "values", "index", "columns")
+
+    def __init__(self, type, name, path, mtime, header, rows):
+        self.type = type
+        self.name = name
+        self.path = path
+        self.mtime = mtime
+        self.checked = time.monotonic()
+        self.header = header
+        self.rows = rows
+        self.values = tuple(row[0] for row in rows)
+        self.index = {value: i for i, value in enumerate(self.values, start=1)}
+        self.columns = {}
+        for i, column in enumerate(header[1:], start=1):
+            values = [row[i] if i < len(row) else None for row in rows]
+            if all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in values):
+                self.columns[column] = array("d", values)
+            else:
+                self.columns[column] = tuple(values)
+
+    def value(self, index: int, column: str):
+        """Return ``column`` of the row with the 1-based ``index``."""
+
+        return self.columns[column][index - 1]
+
+_REGISTRY: Dict[Tuple[str, str], EnumTable] = {}  # { (type, name): EnumTable }
+
+def enum_table_path(type, enum_name):
+    """Return the absolute path of <type>/<enum_name>.json."""
+
+    base_dir = os.path.dirname(__file__)
+    return os.path.abspath(os.path.join(base_dir, f"./{type}/{enum_name}.json"))
+
+def enum_table(type, enum_name) -> EnumTable:
+    """Return the registered table of <type>/<enum_name>.json.
+
+    The file is parsed on first use and again when its modification time has
+    changed (checked at most every VALIDATE_INTERVAL seconds).  Errors while
+    reading the file propagate.
+    """
+    key = (type, enum_name)
+    table = _REGISTRY.get(key)
+    if table is not None:
+        now = time.monotonic()
+        if now - table.checked < VALIDATE_INTERVAL:
+            return table
+        table.checked = now
+        try:
+            if os.path.getmtime(table.path) == table.mtime:
+                return table
+        except OSError:
+            return table
+
+    with Profiling.phase("enum_load"):
+        path = enum_table_path(type, enum_name)
+        mtime = os.path.getmtime(path)
+        with open(path, "r") as f:
+            data = json.load(f)
+        table = _REGISTRY[key] = EnumTable(type, enum_name, path, mtime, data[0], data[1:])
+    return table
+
+def load_enum_table(type, enum_name):
+    """Return (header, rows, mtime) of <type>/<enum_name>.json; errors propagate."""
+
+    table = enum_table(type, enum_name)
+    return table.header, table.rows, table.mtime
+
+def clear_enum_cache():
+    """Clear all registered enumeration tables."""
+    _REGISTRY.clear()
+
+def enum_value(selection):
+    """Return the active enumeration value from a property selection."""
+
+    if isinstance(selection, (list, tuple)):
+        return selection[0] if selection else None
+    return selection
+
+def enum_index(type, name, selection) -> int:
+    """Return the 1-based index of an enumeration selection, or 0 if unknown."""
+
+    value = enum_value(selection)
+    if value is None:
+        return 0
+
+    try:
+        return enum_table(type, name).index.get(value, 0)
+    except Exception:
+        return 0
@@ -0,0 +1,126 @@
+"""Export of spring data to CSV or JSON Lines.
+
+Values are written at full precision.  ``iter_export`` streams: it reads the
+spring objects one at a time as it writes, so exports of whole assembly
+documents need no table in memory.  It is a generator that writes one row per
+step and yields the number of rows written; ``export_springs`` runs it to
+completion (e.g. in nightly scripts).  ``ExportJob`` instead snapshots every
+value when it is created, on the calling (GUI) thread, and writes the
+snapshot in a background thread with progress and cancellation, so it holds
+the whole table in memory.  Files are written under a temporary name and only
+renamed into place once complete.
+"""
+
+import os, csv, json, threading
+from typing import Iterable, Iterator, List, Optional, Sequence
+
+from . import Utils as CoreUtils
+from . import Log
+
+# Columns written before the spring properties.
+NAME_COLUMNS = ("Name", "Label")
+
+# Output format by file extension.
+FORMATS = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl"}
+
+def export_columns(objs: Sequence) -> List[str]:
+    """Return NAME_COLUMNS followed by every Independent, Dependent and Global property of ``objs``."""
+    return list(NAME_COLUMNS) + CoreUtils.spring_properties(objs)
+
+def spring_values(obj, columns: Sequence[str]) -> List:
+    """Return the values of ``columns`` on ``obj``; None where the spring has no such property."""
+    return [getattr(obj, name, None) for name in columns]
+
+def export_format(path: str) -> str:
+    """Return "csv" or "jsonl" for ``path``'s extension."""
+
+    extension = os.path.splitext(path)[1].lower()
+    try:
+        return FORMATS[extension]
+    except KeyError:
+        raise ValueError(f"{path}: unsupported export type {extension!r} (expected .csv or .jsonl)") from None
+
+def iter_export(path: str, objs: Iterable, columns: Optional[Sequence[str]] = None) -> Iterator[int]:
+    """Write ``objs`` to ``path`` one spring per step, yielding the rows written so far.
+
+    ``columns`` defaults to export_columns(objs).  The file only appears at
+    ``path`` when the generator runs to completion; closing it early (or an
+    error) removes the partial output.
+    """
+    objs = list(objs)
+    columns = list(columns) if columns is not None else export_columns(objs)
+    yield from _write_rows(path, columns, (spring_values(obj, columns) for obj in objs))
+
+def _write_rows(path: str, columns: Sequence[str], rows: Iterable[Sequence]) -> Iterator[int]:
+    """Write ``rows`` of ``columns`` to ``path`` as described in iter_export."""
+
+    fmt = export_format(path)
+    partial = path + ".part"
+    complete = False
+    try:
+        with open(partial, "w", newline="") as f:
+            if fmt == "csv":
+                writer = csv.writer(f)
+                writer.writerow(columns)
+                write = writer.writerow
+            else:
+                write = lambda values: f.write(json.dumps(dict(zip(columns, values))) + "\n")
+            for count, values in enumerate(rows, start=1):
+                write(values)
+                yield count
+        os.replace(partial, path)
+        complete = True
+    finally:
+        if not complete and os.path.exists(partial):
+            os.remove(partial)
+
+def export_springs(path: str, objs: Iterable, columns: Optional[Sequence[str]] = None) -> int:
+    """Write ``objs`` to ``path`` and return the number of springs written."""
+
+    count = 0
+    for count in iter_export(path, objs, columns):
+        pass
+    return count
+
+class ExportJob(threading.Thread):
+    """Writes an export in a background thread.
+
+    The spring values are read when the job is created, on the calling (GUI)
+    thread; the thread only formats and writes them, so it never touches
+    document objects and the document may be edited while it runs.  The
+    snapshot holds every row in memory; scripts exporting very large documents
+    should stream with export_springs instead.  ``written`` and ``total`` report progress, ``cancel()`` stops the export
+    after the current spring (leaving no file), and ``error`` holds the
+    exception that ended the export, if any.
+    """
+
+    def __init__(self, path: str, objs: Iterable, columns: Optional[Sequence[str]] = None):
+        super().__init__(name="SpringExport", daemon=True)
+        export_format(path)  # reject unsupported types before reading the springs
+        objs = list(objs)
+        self.path = path
+        self.columns = list(columns) if columns is not None else export_columns(objs)
+        self.rows = [spring_values(obj, self.columns) for obj in objs]
+        self.total = len(self.rows)
+        self.written = 0
+        self.error = None
+        self._cancelled = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    def run(self):
+        export = _write_rows(self.path, self.columns, self.rows)
+        try:
+            for self.written in export:
+                if self._cancelled.is_set():
+                    break
+        except Exception as e:
+            self.error = e
+            Log.error("[ExportJob] export to %s failed: %s", self.path, e)
+        finally:
+            export.close()
@@ -0,0 +1,46 @@
+"""Vectorized evaluation of the extension spring equations.
+
+The NumPy counterpart of ``Model.update_properties``: every input may be a
+scalar or an array, and ``jacobian`` returns the derivatives of the results
+with respect to the Independent variables in the same pass.
+"""
+
+from __future__ import annotations
+from typing import Dict
+
+import numpy as np
+
+from .. import ForwardDiff as fd
+from . import Model as SpringModel
+
+def evaluate(outside_diameter_at_free, wire_diameter, coils_total, length_at_free=0.0,
+             torsion_modulus=SpringModel.MUSIC_WIRE_SHEAR_MODULUS, _differentiate: bool = False) -> Dict[str, np.ndarray]:
+    """Evaluate the extension spring Rate for arrays of designs (0 where the design is invalid)."""
+
+    od, d, nt, lf = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (
+        outside_diameter_at_free, wire_diameter, coils_total, length_at_free,
+    )))
+    g = np.asarray(torsion_modulus, dtype=float)
+    if _differentiate:
+        od, d, nt, lf = fd.variables(od, d, nt, lf)
+    dm = od - d
+    valid = (fd.value(dm) > 0.0) & (fd.value(d) > 0.0) & (fd.value(nt) > 0.0) & (g > 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        wire_m = d / 1000.0
+        mean_m = dm / 1000.0
+        rate = (g * wire_m ** 4) / (8.0 * nt * mean_m ** 3) / 1000.0
+    return {"Rate": fd.where(valid, rate, 0.0)}
+
+def jacobian(*args, **kwargs) -> Dict[str, np.ndarray]:
+    """Return the derivatives of the evaluate() outputs with respect to ``Model.INDEPENDENT``.
+
+    Takes the arguments of evaluate(); each result has a trailing axis
+    ordered as ``Model.INDEPENDENT``.
+    """
+    return fd.jacobian(evaluate(*args, _differentiate=True, **kwargs))
+
+def state_jacobian(state) -> Dict[str, Dict[str, float]]:
+    """Return jacobian() for one ExtensionState as { output: { independent: derivative } }."""
+
+    jac = jacobian(state.OutsideDiameterAtFree, state.WireDiameter, state.CoilsTotal, state.LengthAtFree, state.TorsionModulus)
+    return {name: dict(zip(SpringModel.INDEPENDENT, grad.tolist())) for name, grad in jac.items()}
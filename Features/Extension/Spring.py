@@ -2,6 +2,7 @@ import FreeCAD
 from pathlib import Path
 
 from .. import Utils as CoreUtils
+from .. import Preview, Profiling
 from ..ViewProviderSpring import ViewProviderSpring
 from . import Utils as SpringUtils
 
@@ -17,7 +18,8 @@ class ExtensionSpring:
         CoreUtils.add_property(obj, "Rate", 0.0, "App::PropertyFloat", "Dependent")
         obj.setEditorMode("Rate", 1)
 
-#        CoreUtils.add_property(obj, "EndType", "", "App::PropertyEnumeration", "Global")
+        CoreUtils.add_property(obj, "EndType", None, "App::PropertyEnumeration", "Global")
+        CoreUtils.reload_enum(obj, "Extension", "EndType")
         CoreUtils.add_property(obj, "CoilsInactive", 0.0, "App::PropertyFloat", "Global")
         obj.setEditorMode("CoilsInactive", 1)
         CoreUtils.add_property(obj, "EndDiameter", 0.0, "App::PropertyFloat", "Global")
@@ -26,25 +28,39 @@ class ExtensionSpring:
         obj.setEditorMode("HookDeflectionAllowance", 1)
         CoreUtils.add_property(obj, "TorsionModulus", SpringUtils.MUSIC_WIRE_SHEAR_MODULUS, "App::PropertyFloat", "Global")
 
+        CoreUtils.add_property(obj, "ShapeDetail", list(Preview.SHAPE_DETAILS), "App::PropertyEnumeration", "Shape")
+        CoreUtils.add_property(obj, "ShapeIsPreview", False, "App::PropertyBool", "Shape", 2)
+        CoreUtils.add_property(obj, "ShapeSignature", "", "App::PropertyString", "Shape", 2)
+
         obj.Proxy = self
         ViewProviderSpring(obj.ViewObject)
-        SpringUtils.update_globals(obj)
-        SpringUtils.update_properties(obj)
+        if not CoreUtils.updates_deferred(obj):
+            SpringUtils.update(obj)
 
     def execute(self, obj):
+        if CoreUtils.updates_deferred(obj):
+            return
         radius = obj.OutsideDiameterAtFree / 2.0
         wire_radius = obj.WireDiameter / 2.0
-        obj.Shape = CoreUtils.helix_solid(radius, obj.Pitch, obj.LengthAtFree, wire_radius)
-        SpringUtils.update_globals(obj)
-        SpringUtils.update_properties(obj)
+        with Profiling.recompute(obj):
+            SpringUtils.update(obj)
+            Preview.update_shape(
+                obj, radius, obj.Pitch, obj.LengthAtFree, wire_radius, ends=SpringUtils.end_template(obj, radius),
+            )
 
     def onChanged(self, obj, prop):
-        if prop == "EndType":
+        if prop == "EndType" and not CoreUtils.updates_deferred(obj):
             selection = getattr(obj, "EndType", None)
             if isinstance(selection, (list, tuple)):
                 selection = selection[0] if selection else None
-                SpringUtils.update_globals(obj)
-                SpringUtils.update_properties(obj)
+                SpringUtils.update(obj)
+
+    def onDocumentRestored(self, obj):
+        restored = hasattr(obj, "EndType")
+        CoreUtils.add_property(obj, "EndType", None, "App::PropertyEnumeration", "Global")
+        CoreUtils.reload_enum(obj, "Extension", "EndType")
+        if not restored:  # saved before end types were drawn: keep the bare coil
+            obj.EndType = "Close_Wound_Coil"
 
 def make():
     doc = FreeCAD.ActiveDocument
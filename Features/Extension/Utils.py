@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-MUSIC_WIRE_SHEAR_MODULUS = 79.3e9  # Pascals
+from .. import Enums
+from . import Batch, Model
+from .Model import MUSIC_WIRE_SHEAR_MODULUS
 
 def _as_float(value, default):
     try:
@@ -14,27 +16,47 @@ def _as_float(value, default):
 def update_globals(obj) -> None:
     """Update global properties based on the object's global properties."""
 
+    state = Model.ExtensionState.from_object(obj)
+    Model.update_globals(state)
+    state.apply_to(obj, Model.GLOBAL_RESULTS)
+
 def update_properties(obj) -> None:
     """Update properties based on the object's properties."""
 
-    rate = 0.0
-
-    try:
-        outer = float(obj.OutsideDiameterAtFree)
-        wire = float(obj.WireDiameter)
-        coils = float(obj.CoilsTotal)
-        shear_modulus = _as_float(getattr(obj, "TorsionModulus", MUSIC_WIRE_SHEAR_MODULUS), MUSIC_WIRE_SHEAR_MODULUS)
-    except (AttributeError, TypeError, ValueError):
-        obj.Rate = rate
-        return
-
-    mean_diameter = outer - wire
-    if mean_diameter <= 0.0 or wire <= 0.0 or coils <= 0.0 or shear_modulus <= 0.0:
-        obj.Rate = rate
-        return
-
-    wire_m = wire / 1000.0
-    mean_m = mean_diameter / 1000.0
-    rate_n_per_m = (shear_modulus * wire_m**4) / (8.0 * coils * (mean_m**3))
-    rate = rate_n_per_m / 1000.0
-    obj.Rate = rate
+    state = Model.ExtensionState.from_object(obj)
+    Model.update_properties(state)
+    state.apply_to(obj, Model.PROPERTY_RESULTS)
+
+def sensitivities(obj) -> dict:
+    """Return the derivatives of the Dependent properties with respect to each Independent one.
+
+    The result maps output names to { independent name: derivative }.
+    """
+    return Batch.state_jacobian(Model.ExtensionState.from_object(obj))
+
+def update(obj) -> None:
+    """Run update_globals() and update_properties() on a single state snapshot."""
+
+    state = Model.ExtensionState.from_object(obj)
+    Model.update(state)
+    state.apply_to(obj, Model.GLOBAL_RESULTS + Model.PROPERTY_RESULTS)
+
+def end_template(obj, radius) -> tuple | None:
+    """Return the (template, loop radius, sweep, extension) of the spring's hooks, or None.
+
+    ``radius`` is the radius of the coil the hooks are attached to; the loop
+    radius is the EndType's EndDia times it.
+    """
+    end_type_index = Enums.enum_index("Extension", "EndType", getattr(obj, "EndType", None))
+    if end_type_index == 0:
+        return None
+    end_types = Enums.enum_table("Extension", "EndType")
+    template = end_types.value(end_type_index, "Template")
+    if template == "none":
+        return None
+    return (
+        template,
+        end_types.value(end_type_index, "EndDia") * radius,
+        end_types.value(end_type_index, "Sweep"),
+        end_types.value(end_type_index, "Extension"),
+    )
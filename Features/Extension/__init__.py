@@ -1,6 +1,20 @@
-"""Extension spring feature package."""
+"""Extension spring feature package.
 
-from .Spring import ExtensionSpring, make
-from . import Utils
+``Model`` holds the FreeCAD-free calculations; the FeaturePython class in
+``Spring`` is imported on first use so the model can be loaded without FreeCAD.
+"""
 
-__all__ = ["ExtensionSpring", "make", "Utils"]
+import importlib
+
+_LAZY = {"ExtensionSpring": ".Spring", "make": ".Spring"}
+
+__all__ = ["ExtensionSpring", "make", "Utils", "Model"]
+
+def __getattr__(name):
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,126 @@
+"""Forward-mode automatic differentiation over NumPy arrays.
+
+A ``Dual`` carries a value array and the derivatives of that value with
+respect to ``n`` seeded inputs in an extra trailing axis, so the batch
+equations evaluate their Jacobian in the same single pass as their values.
+The helpers ``sqrt``, ``log10``, ``where`` and ``minimum`` accept plain arrays
+as well as duals, so an equation written with them serves both uses.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+class Dual:
+    """Value array with derivatives ``grad`` of shape value.shape + (n,)."""
+
+    __slots__ = ("value", "grad")
+    __array_ufunc__ = None  # ndarray (op) Dual falls back to Dual's reflected operators
+
+    def __init__(self, value, grad):
+        self.value = np.asarray(value, dtype=float)
+        self.grad = np.asarray(grad, dtype=float)
+
+    def __add__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.value + other.value, self.grad + other.grad)
+        return Dual(self.value + other, _broadcast_grad(self.grad, other))
+
+    __radd__ = __add__
+
+    def __neg__(self):
+        return Dual(-self.value, -self.grad)
+
+    def __sub__(self, other):
+        return self + (-other)
+
+    def __rsub__(self, other):
+        return (-self) + other
+
+    def __mul__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.value * other.value, self.grad * other.value[..., None] + other.grad * self.value[..., None])
+        other = np.asarray(other, dtype=float)
+        return Dual(self.value * other, self.grad * other[..., None])
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, Dual):
+            value = self.value / other.value
+            return Dual(value, (self.grad - other.grad * value[..., None]) / other.value[..., None])
+        other = np.asarray(other, dtype=float)
+        return Dual(self.value / other, self.grad / other[..., None])
+
+    def __rtruediv__(self, other):
+        value = other / self.value
+        return Dual(value, -self.grad * (value / self.value)[..., None])
+
+    def __pow__(self, exponent):
+        if isinstance(exponent, Dual):
+            raise TypeError("Dual exponents are not supported")
+        return Dual(self.value ** exponent, self.grad * (exponent * self.value ** (exponent - 1))[..., None])
+
+    # Comparisons (for branches and masks) use the value only.
+    def __lt__(self, other):
+        return self.value < value(other)
+
+    def __le__(self, other):
+        return self.value <= value(other)
+
+    def __gt__(self, other):
+        return self.value > value(other)
+
+    def __ge__(self, other):
+        return self.value >= value(other)
+
+def _broadcast_grad(grad, other):
+    shape = np.broadcast_shapes(grad.shape[:-1], np.shape(other))
+    return np.broadcast_to(grad, shape + grad.shape[-1:])
+
+def value(x):
+    """Return the value of a dual, or ``x`` itself."""
+    return x.value if isinstance(x, Dual) else x
+
+def gradient(x, n: int):
+    """Return the derivatives of ``x`` (zeros for a constant) with shape value.shape + (n,)."""
+
+    if isinstance(x, Dual):
+        return x.grad
+    return np.zeros(np.shape(x) + (n,))
+
+def variables(*values) -> Tuple[Dual, ...]:
+    """Return duals seeding each of ``values`` (broadcast together) as one independent input."""
+
+    arrays = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in values))
+    n = len(arrays)
+    return tuple(Dual(a, np.broadcast_to(np.eye(n)[i], a.shape + (n,))) for i, a in enumerate(arrays))
+
+def sqrt(x):
+    if isinstance(x, Dual):
+        root = np.sqrt(x.value)
+        return Dual(root, x.grad * (0.5 / root)[..., None])
+    return np.sqrt(x)
+
+def log10(x):
+    if isinstance(x, Dual):
+        return Dual(np.log10(x.value), x.grad * (1.0 / (x.value * np.log(10.0)))[..., None])
+    return np.log10(x)
+
+def where(condition, a, b):
+    """np.where for duals and plain arrays; the derivatives follow the selected branch."""
+
+    if not isinstance(a, Dual) and not isinstance(b, Dual):
+        return np.where(condition, a, b)
+    condition = np.asarray(condition)
+    values = np.where(condition, value(a), value(b))
+    n = (a if isinstance(a, Dual) else b).grad.shape[-1]
+    grads = np.where(condition[..., None], _broadcast_grad(gradient(a, n), values), _broadcast_grad(gradient(b, n), values))
+    return Dual(values, grads)
+
+def minimum(a, b):
+    return where(value(a) <= value(b), a, b)
+
+def jacobian(outputs: dict) -> dict:
+    """Return the derivatives of the dual entries of ``outputs``, keyed by output name."""
+    return {name: x.grad for name, x in outputs.items() if isinstance(x, Dual)}
@@ -0,0 +1,236 @@
+"""Content-addressed cache for generated spring geometry.
+
+Sweeping a circle along a helix is the most expensive part of a spring
+recompute, and assemblies tend to reuse a handful of spring geometries many
+times.  Shapes are cached as BREP text keyed on their rounded geometric
+parameters: a least-recently-used set is held in memory and a size-bounded
+copy is kept on disk so later sessions can reuse it.
+"""
+
+import os, hashlib, tempfile
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+import FreeCAD, Part
+
+from . import Log
+
+# Number of decimals geometric parameters are rounded to before hashing.
+KEY_DIGITS = 6
+
+def cache_key(kind: str, *params) -> str:
+    """Return the content address of a shape built by ``kind`` from ``params``."""
+
+    rounded = ",".join(repr(round(float(p), KEY_DIGITS) + 0.0) for p in params)
+    return hashlib.sha1(f"{kind}({rounded})".encode("utf-8")).hexdigest()
+
+class GeometryCache:
+    """LRU cache of BREP blobs with an optional on-disk store."""
+
+    def __init__(self, memory_bytes: int, disk_dir: Optional[str] = None, disk_bytes: int = 0):
+        self.memory_bytes = memory_bytes
+        self.disk_dir = disk_dir if disk_bytes > 0 else None
+        self.disk_bytes = disk_bytes
+        self._memory = OrderedDict()  # { key: blob }
+        self._memory_size = 0
+        self._disk = OrderedDict()  # { key: size }, least recently used first
+        self._disk_size = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        if self.disk_dir:
+            self._scan_disk()
+
+    # ------------------------------------------------------------
+    def get(self, key: str) -> Optional[Part.Shape]:
+        """Return a new shape for ``key``, or None if it is not cached."""
+
+        blob = self._memory.get(key)
+        if blob is not None:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return self._to_shape(blob)
+
+        blob = self._read_disk(key)
+        if blob is not None:
+            self.disk_hits += 1
+            self._remember(key, blob)
+            return self._to_shape(blob)
+
+        self.misses += 1
+        return None
+
+    def put(self, key: str, shape: Part.Shape) -> None:
+        """Store ``shape`` under ``key`` in memory and on disk."""
+
+        blob = shape.exportBrepToString()
+        self._remember(key, blob)
+        self._write_disk(key, blob)
+
+    def get_or_build(self, key: str, build: Callable[[], Part.Shape]) -> Part.Shape:
+        """Return the cached shape for ``key``, building and storing it on a miss."""
+
+        shape = self.get(key)
+        if shape is None:
+            shape = build()
+            self.put(key, shape)
+        return shape
+
+    def clear(self, disk: bool = False) -> None:
+        """Drop all in-memory entries, and the on-disk store too if ``disk``."""
+
+        self._memory.clear()
+        self._memory_size = 0
+        if disk and self.disk_dir:
+            for key in list(self._disk):
+                self._remove_disk(key)
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and current cache sizes."""
+
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "memory_entries": len(self._memory),
+            "memory_bytes": self._memory_size,
+            "disk_entries": len(self._disk),
+            "disk_bytes": self._disk_size,
+        }
+
+    # ------------------------------------------------------------
+    @staticmethod
+    def _to_shape(blob: str) -> Part.Shape:
+        shape = Part.Shape()
+        shape.importBrepFromString(blob)
+        return shape
+
+    def _remember(self, key: str, blob: str) -> None:
+        if key in self._memory:
+            self._memory_size -= len(self._memory.pop(key))
+        if len(blob) > self.memory_bytes:
+            return
+        self._memory[key] = blob
+        self._memory_size += len(blob)
+        while self._memory_size > self.memory_bytes:
+            _old_key, old_blob = self._memory.popitem(last=False)
+            self._memory_size -= len(old_blob)
+            self.evictions += 1
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, f"{key}.brep")
+
+    def _scan_disk(self) -> None:
+        try:
+            os.makedirs(self.disk_dir, exist_ok=True)
+            entries = [e for e in os.scandir(self.disk_dir) if e.name.endswith(".brep")]
+        except OSError as e:
+            Log.warning("[GeometryCache] Disk cache disabled: %s", e)
+            self.disk_dir = None
+            return
+        for entry in sorted(entries, key=lambda e: e.stat().st_mtime):
+            size = entry.stat().st_size
+            self._disk[entry.name[:-len(".brep")]] = size
+            self._disk_size += size
+        self._trim_disk()
+
+    def _read_disk(self, key: str) -> Optional[str]:
+        if not self.disk_dir or key not in self._disk:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "r") as f:
+                blob = f.read()
+            os.utime(path)
+        except OSError:
+            self._forget_disk(key)
+            return None
+        self._disk.move_to_end(key)
+        return blob
+
+    def _write_disk(self, key: str, blob: str) -> None:
+        if not self.disk_dir or key in self._disk or len(blob) > self.disk_bytes:
+            return
+        path = self._path(key)
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.disk_dir, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                f.write(blob)
+            os.replace(tmp_path, path)
+            tmp_path = None
+        except OSError as e:
+            Log.warning("[GeometryCache] Failed to write %s: %s", path, e)
+            return
+        finally:
+            if tmp_path is not None:  # the write failed: drop the partial file
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+        self._disk[key] = len(blob)
+        self._disk_size += len(blob)
+        self._trim_disk()
+
+    def _trim_disk(self) -> None:
+        while self._disk_size > self.disk_bytes and self._disk:
+            self._remove_disk(next(iter(self._disk)))
+            self.evictions += 1
+
+    def _remove_disk(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+        self._forget_disk(key)
+
+    def _forget_disk(self, key: str) -> None:
+        self._disk_size -= self._disk.pop(key, 0)
+
+_SHARED_CACHE = None  # GeometryCache, or False when disabled by preference
+
+def default_disk_dir() -> str:
+    """Return the directory of the on-disk geometry store."""
+
+    try:
+        base = FreeCAD.getUserCachePath()
+    except AttributeError:
+        base = tempfile.gettempdir()
+    return os.path.join(base, "Spring", "geometry")
+
+def shared_cache() -> Optional[GeometryCache]:
+    """Return the workbench-wide cache, or None if disabled in the preferences."""
+
+    global _SHARED_CACHE
+    if _SHARED_CACHE is None:
+        from . import Utils as CoreUtils
+        if CoreUtils.preference_bool("geometry_cache", True):
+            _SHARED_CACHE = GeometryCache(
+                CoreUtils.preference_int("geometry_cache_memory_mb", 64) * 1024 * 1024,
+                default_disk_dir(),
+                CoreUtils.preference_int("geometry_cache_disk_mb", 256) * 1024 * 1024,
+            )
+        else:
+            _SHARED_CACHE = False
+    return _SHARED_CACHE or None
+
+def shared_cache_stats() -> Optional[Dict[str, int]]:
+    """Return the shared cache's stats(), or None if it is disabled or not created yet."""
+
+    return _SHARED_CACHE.stats() if _SHARED_CACHE else None
+
+def reset_shared_cache() -> None:
+    """Forget the shared cache so the next use re-reads the preferences."""
+
+    global _SHARED_CACHE
+    _SHARED_CACHE = None
+
+def cached_shape(kind: str, params, build: Callable[[], Part.Shape]) -> Part.Shape:
+    """Return the shape built by ``build``, going through the shared cache if enabled."""
+
+    cache = shared_cache()
+    if cache is None:
+        return build()
+    return cache.get_or_build(cache_key(kind, *params), build)
@@ -0,0 +1,80 @@
+"""Level-gated logging for the Spring workbench.
+
+Messages are only formatted (with ``%``-style arguments) and written to the
+FreeCAD console when their level is enabled, so disabled debug traces in the
+calculation and geometry paths cost a single level check.  The level comes
+from the ``log_level`` preference and is cached; call ``refresh`` after the
+preference changes.  Without FreeCAD, messages go to ``sys.stderr``.
+"""
+
+import sys
+
+try:
+    import FreeCAD
+except ImportError:
+    FreeCAD = None
+
+ERROR = 0
+WARNING = 1
+INFO = 2
+DEBUG = 3
+
+# Labels of the log_level preference values.
+LEVEL_NAMES = ("Error", "Warning", "Info", "Debug")
+
+_LEVEL = None  # cached level, None until first use
+
+def level() -> int:
+    """Return the current log level, reading the preference on first use."""
+
+    global _LEVEL
+    if _LEVEL is None:
+        _LEVEL = WARNING
+        if FreeCAD is not None:
+            from .Utils import preference_int
+            _LEVEL = preference_int("log_level", WARNING)
+    return _LEVEL
+
+def set_level(value: int) -> None:
+    """Override the log level for this session."""
+
+    global _LEVEL
+    _LEVEL = value
+
+def refresh() -> None:
+    """Forget the cached level so the next message re-reads the preference."""
+
+    global _LEVEL
+    _LEVEL = None
+
+def enabled(value: int) -> bool:
+    """Return True if messages of level ``value`` are written."""
+
+    return (level() if _LEVEL is None else _LEVEL) >= value
+
+def _emit(value: int, msg: str, args) -> None:
+    text = (msg % args if args else msg) + "\n"
+    if FreeCAD is None:
+        sys.stderr.write(text)
+    elif value == ERROR:
+        FreeCAD.Console.PrintError(text)
+    elif value == WARNING:
+        FreeCAD.Console.PrintWarning(text)
+    else:
+        FreeCAD.Console.PrintMessage(text)
+
+def error(msg: str, *args) -> None:
+    if enabled(ERROR):
+        _emit(ERROR, msg, args)
+
+def warning(msg: str, *args) -> None:
+    if enabled(WARNING):
+        _emit(WARNING, msg, args)
+
+def info(msg: str, *args) -> None:
+    if enabled(INFO):
+        _emit(INFO, msg, args)
+
+def debug(msg: str, *args) -> None:
+    if enabled(DEBUG):
+        _emit(DEBUG, msg, args)
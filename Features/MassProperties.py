@@ -0,0 +1,163 @@
+"""Analytic mass properties of helical coils.
+
+A coil is a circular wire section of radius ``a`` swept along the helix
+c(t) = (R cos t, R sin t, k t) (``k = pitch / 2 pi``), as built by
+``Utils.helix_solid``.  With the section frame (N, B) of the helix, the
+section's area A = pi a^2, its polar-free second moment I = pi a^4 / 4 and the
+helix curvature kappa = R / (R^2 + k^2), the volume integrals reduce exactly
+to integrals over t of
+
+    dV:     A
+    x dV:   A c - kappa I N
+    xx' dV: A c c' + I (N N' + B B') - kappa I (c N' + N c')
+
+times ds/dt = sqrt(R^2 + k^2).  These have closed forms in sin, cos and
+powers of t, evaluated here with NumPy for scalars or whole arrays of coils.
+End corrections trim wire from both ends of the helix (``EndTrim`` column of
+``Compression/EndType.json``, in wire diameters for the whole spring, as in
+the Weight calculation).  The cross-check compares against the OCC solid and
+is the only part that needs FreeCAD.
+"""
+
+import math
+from dataclasses import dataclass
+from typing import Dict
+
+import numpy as np
+
+from . import Enums
+
+@dataclass
+class MassProperties:
+    """Volume, mass, centroid (..., 3) and inertia tensor about the centroid (..., 3, 3)."""
+
+    volume: np.ndarray
+    mass: np.ndarray
+    centroid: np.ndarray
+    inertia: np.ndarray
+
+def _trig_integrals(ta, tb):
+    """Return the integrals over [ta, tb] of the t-functions appearing in the moments."""
+
+    def antiderivatives(t):
+        sin, cos = np.sin(t), np.cos(t)
+        return {
+            "1": t,
+            "t": t * t / 2.0,
+            "tt": t * t * t / 3.0,
+            "cos": sin,
+            "sin": -cos,
+            "tcos": t * sin + cos,
+            "tsin": -t * cos + sin,
+            "coscos": t / 2.0 + np.sin(2.0 * t) / 4.0,
+            "sinsin": t / 2.0 - np.sin(2.0 * t) / 4.0,
+            "sincos": sin * sin / 2.0,
+        }
+
+    upper, lower = antiderivatives(tb), antiderivatives(ta)
+    return {name: upper[name] - lower[name] for name in upper}
+
+def helix_mass_properties(radius, pitch, height, wire_radius, density=1.0, trim=0.0) -> MassProperties:
+    """Return the mass properties of wire swept along ``Part.makeHelix(pitch, height, radius)``.
+
+    ``trim`` is the length of wire removed at each end.  All arguments may be
+    arrays and are broadcast against each other.
+    """
+    radius, pitch, height, wire_radius, density, trim = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (radius, pitch, height, wire_radius, density, trim))
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        k = pitch / (2.0 * math.pi)
+        ds = np.sqrt(radius * radius + k * k)  # ds/dt
+        kappa = radius / (ds * ds)
+        area = math.pi * wire_radius ** 2
+        second = math.pi * wire_radius ** 4 / 4.0
+
+        ta = trim / ds
+        tb = 2.0 * math.pi * height / pitch - ta
+        q = _trig_integrals(ta, tb)
+
+        volume = area * ds * q["1"]
+        zero = np.zeros_like(volume)
+        first = ds[..., None] * np.stack((
+            area * radius * q["cos"] + kappa * second * q["cos"],
+            area * radius * q["sin"] + kappa * second * q["sin"],
+            area * k * q["t"],
+        ), axis=-1)
+
+        def sym(xx, yy, zz, xy, xz, yz):
+            return np.stack((
+                np.stack((xx, xy, xz), axis=-1),
+                np.stack((xy, yy, yz), axis=-1),
+                np.stack((xz, yz, zz), axis=-1),
+            ), axis=-2)
+
+        r2, k2, b = radius * radius, k * k, 1.0 / (ds * ds)
+        cc = sym(r2 * q["coscos"], r2 * q["sinsin"], k2 * q["tt"], r2 * q["sincos"], radius * k * q["tcos"], radius * k * q["tsin"])
+        nn = sym(q["coscos"], q["sinsin"], zero, q["sincos"], zero, zero)
+        bb = sym(b * k2 * q["sinsin"], b * k2 * q["coscos"], b * r2 * q["1"], -b * k2 * q["sincos"], b * k * radius * -q["sin"], -b * k * radius * q["cos"])
+        cn = sym(-2.0 * radius * q["coscos"], -2.0 * radius * q["sinsin"], zero, -2.0 * radius * q["sincos"], -k * q["tcos"], -k * q["tsin"])
+        moment = ds[..., None, None] * (
+            area[..., None, None] * cc + second[..., None, None] * (nn + bb) - (kappa * second)[..., None, None] * cn
+        )
+
+        centroid = first / volume[..., None]
+        identity = np.eye(3)
+        inertia_origin = np.trace(moment, axis1=-2, axis2=-1)[..., None, None] * identity - moment
+        shift = (centroid * centroid).sum(axis=-1)[..., None, None] * identity - centroid[..., :, None] * centroid[..., None, :]
+        inertia = density[..., None, None] * (inertia_origin - volume[..., None, None] * shift)
+    return MassProperties(volume, density * volume, centroid, inertia)
+
+def end_trim(end_type_index, wire_diameter):
+    """Return the wire length removed at each end for 1-based compression EndType indices."""
+
+    trims = np.concatenate(([0.0], Enums.enum_table("Compression", "EndType").columns["EndTrim"]))
+    index = np.clip(np.asarray(end_type_index, dtype=np.intp), 0, len(trims) - 1)
+    return trims[index] * np.asarray(wire_diameter, dtype=float) / 2.0
+
+def compression_mass_properties(outside_diameter_at_free, wire_diameter, length_at_free, coils_total,
+                                end_type_index=1, density=1.0) -> MassProperties:
+    """Return the mass properties of compression springs from their Independent values.
+
+    The coil is the helix of the Weight calculation: mean diameter, CoilsTotal
+    turns over LengthAtFree, trimmed per EndType, so ``mass`` equals Weight.
+    """
+    wire_diameter = np.asarray(wire_diameter, dtype=float)
+    coils_total = np.asarray(coils_total, dtype=float)
+    length_at_free = np.asarray(length_at_free, dtype=float)
+    return helix_mass_properties(
+        (np.asarray(outside_diameter_at_free, dtype=float) - wire_diameter) / 2.0,
+        length_at_free / coils_total,
+        length_at_free,
+        wire_diameter / 2.0,
+        density,
+        end_trim(end_type_index, wire_diameter),
+    )
+
+def spring_mass_properties(obj) -> MassProperties:
+    """Return the mass properties of a compression spring object or state."""
+
+    end_type_index = Enums.enum_index("Compression", "EndType", obj.EndType)
+    return compression_mass_properties(
+        obj.OutsideDiameterAtFree, obj.WireDiameter, obj.LengthAtFree, obj.CoilsTotal, end_type_index, obj.Density,
+    )
+
+def cross_check(radius, pitch, height, wire_radius) -> Dict[str, float]:
+    """Compare helix_mass_properties with the swept OCC solid of the same helix.
+
+    Returns the relative volume error and the centroid and inertia errors
+    relative to the coil radius and the largest principal moment.  Needs
+    FreeCAD.
+    """
+    from . import Utils as CoreUtils
+
+    solid = CoreUtils._build_helix_solid(radius, pitch, height, wire_radius)
+    analytic = helix_mass_properties(radius, pitch, height, wire_radius)
+    matrix = solid.MatrixOfInertia
+    occ_inertia = np.array([[matrix.A[4 * i + j] for j in range(3)] for i in range(3)])
+    center = solid.CenterOfMass
+    return {
+        "volume": abs(float(analytic.volume) - solid.Volume) / solid.Volume,
+        "centroid": float(np.linalg.norm(analytic.centroid - np.array([center.x, center.y, center.z]))) / radius,
+        "inertia": float(np.abs(analytic.inertia - occ_inertia).max() / np.abs(occ_inertia).max()),
+    }
@@ -0,0 +1,109 @@
+"""Spring material database.
+
+The material table (``MaterialType.json``, laid out like ODOP's
+``mat_metric.json``: a header row followed by one row per material) is parsed
+once into a columnar store.  Lookups by material name are O(1), whole columns
+are available for vectorized evaluations, and the table is re-read when the
+file's modification time changes (checked at most every
+``Enums.VALIDATE_INTERVAL`` seconds).  Standard library only, like ``Enums``.
+"""
+
+import os, json, time
+from typing import Any, Dict, List, Sequence, Tuple
+
+from . import Profiling
+from .Enums import VALIDATE_INTERVAL
+
+# Name of the column holding the material name.
+NAME_COLUMN = "matnam"
+
+class MaterialTable:
+    """Columnar material data with an index by material name."""
+
+    def __init__(self, header: Sequence[str], rows: Sequence[Sequence[Any]], path: str = "", mtime: float = 0):
+        self.header = tuple(header)
+        self.path = path
+        self.mtime = mtime
+        self.checked = time.monotonic()
+        self.columns: Dict[str, Tuple[Any, ...]] = {
+            column: tuple(row[i] for row in rows) for i, column in enumerate(self.header)
+        }
+        self.names: Tuple[str, ...] = self.columns.get(NAME_COLUMN, ())
+        self._index = {name: i for i, name in enumerate(self.names)}
+        self._rows: Dict[str, Dict[str, Any]] = {}
+
+    def __contains__(self, name) -> bool:
+        return name in self._index
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def index(self, name: str) -> int:
+        """Return the 0-based row of material ``name``."""
+
+        try:
+            return self._index[name]
+        except KeyError:
+            raise KeyError(f"unknown material {name!r}") from None
+
+    def value(self, name: str, column: str) -> Any:
+        """Return one property of material ``name``."""
+
+        return self.columns[column][self.index(name)]
+
+    def row(self, name: str) -> Dict[str, Any]:
+        """Return all properties of material ``name`` as a (shared, read-only) dictionary."""
+
+        row = self._rows.get(name)
+        if row is None:
+            i = self.index(name)
+            row = self._rows[name] = {column: values[i] for column, values in self.columns.items()}
+        return row
+
+    def column(self, column: str, names: Sequence[str]) -> List[Any]:
+        """Return ``column`` for each of ``names``, e.g. to build arrays for a batch evaluation."""
+
+        values = self.columns[column]
+        return [values[self.index(name)] for name in names]
+
+_TABLES: Dict[str, MaterialTable] = {}  # { path: MaterialTable }
+
+def table_path() -> str:
+    """Return the absolute path of the material table."""
+
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), "MaterialType.json")
+
+def load_materials(path: str = None) -> MaterialTable:
+    """Return the material table, parsing it again only if the file changed.
+
+    The modification time is checked at most every VALIDATE_INTERVAL seconds.
+    """
+
+    path = path or table_path()
+    table = _TABLES.get(path)
+    if table is not None:
+        now = time.monotonic()
+        if now - table.checked < VALIDATE_INTERVAL:
+            return table
+        table.checked = now
+        try:
+            if os.path.getmtime(path) == table.mtime:
+                return table
+        except OSError:
+            return table
+
+    mtime = os.path.getmtime(path)
+    with Profiling.phase("material_load"):
+        with open(path, "r") as f:
+            data = json.load(f)
+        table = _TABLES[path] = MaterialTable(data[0], data[1:], path, mtime)
+    return table
+
+def material_names() -> List[str]:
+    """Return the names of all materials, in table order."""
+
+    return list(load_materials().names)
+
+def clear_material_cache() -> None:
+    """Forget all parsed material tables."""
+    _TABLES.clear()
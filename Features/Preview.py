@@ -0,0 +1,128 @@
+"""Level-of-detail handling for spring shapes.
+
+While a spring is being edited its shape can be replaced by a cheap preview
+(the helix centerline or the envelope tube) instead of the full helical
+sweep.  The full solid is built on demand with ``build_full_shapes`` or
+automatically once the user has stopped editing for a while.
+"""
+
+from typing import Iterable, Optional
+
+import FreeCAD
+
+from . import GeometryCache, Profiling
+from . import Utils as CoreUtils
+
+# Values of the per-object ShapeDetail property.
+SHAPE_DETAILS = ["Auto", "Preview", "Full"]
+
+_FORCE_FULL = set()  # { (document name, object name) } built in full regardless of ShapeDetail
+_PENDING = set()  # { (document name, object name) } holding a preview shape
+_IDLE_TIMER = None
+
+def _key(obj):
+    return (obj.Document.Name, obj.Name)
+
+def use_preview(obj) -> bool:
+    """Return True if ``obj`` should currently get a preview shape."""
+
+    if _key(obj) in _FORCE_FULL:
+        return False
+    detail = getattr(obj, "ShapeDetail", "Auto")
+    if detail == "Preview":
+        return True
+    if detail == "Full":
+        return False
+    return FreeCAD.GuiUp and CoreUtils.preference_bool("preview_while_editing", False)
+
+def shape_signature(kind, radius, pitch, height, wire_radius, *ends) -> str:
+    """Return the geometric signature of a spring shape of the given kind."""
+
+    return GeometryCache.cache_key(kind, radius, pitch, height, wire_radius, *ends)
+
+def update_shape(obj, radius, pitch, height, wire_radius, end_coils=0.0, ground=False, ends=None) -> bool:
+    """Assign the full or preview shape of a spring, depending on its detail level.
+
+    ``end_coils`` and ``ground`` describe closed and ground ends of the full
+    shape (see ``Utils.coil_solid``) and ``ends`` its hooks or legs (see
+    ``Utils.attach_ends``); previews always show a plain helix.  The
+    shape is only rebuilt when its geometric signature changed, so edits of
+    forces, materials or other analytic inputs keep the existing shape.
+    Returns True if the shape was rebuilt.
+    """
+    preview = use_preview(obj)
+    signature_kind, signature_ends = None, ()
+    if not preview:
+        _PENDING.discard(_key(obj))
+        kind = "helix_solid"
+        if end_coils > 0.0 or ground:
+            kind, signature_ends = "coil_solid", (end_coils, float(bool(ground)))
+        if ends:
+            signature_kind, signature_ends = f"{kind}+end_{ends[0]}", signature_ends + tuple(ends[1:])
+    else:
+        envelope = CoreUtils.preference_bool("preview_envelope", False)
+        kind = "helix_envelope" if envelope else "helix_preview"
+        if getattr(obj, "ShapeDetail", "Auto") == "Auto":
+            _PENDING.add(_key(obj))
+            _schedule_idle_build()
+    _mark_preview(obj, preview)
+
+    signature = shape_signature(signature_kind or kind, radius, pitch, height, wire_radius, *signature_ends)
+    if signature == getattr(obj, "ShapeSignature", None) and not obj.Shape.isNull():
+        return False
+    with Profiling.phase(kind):
+        if preview:
+            obj.Shape = CoreUtils.helix_preview(radius, pitch, height, wire_radius, envelope)
+        else:
+            coil = CoreUtils.coil_solid(radius, pitch, height, wire_radius, end_coils, ground)
+            obj.Shape = CoreUtils.attach_ends(coil, radius, pitch, height, wire_radius, ends)
+    if hasattr(obj, "ShapeSignature"):
+        obj.ShapeSignature = signature
+    return True
+
+def _mark_preview(obj, preview: bool) -> None:
+    if getattr(obj, "ShapeIsPreview", preview) != preview:
+        obj.ShapeIsPreview = preview
+
+def build_full_shapes(objs: Optional[Iterable] = None) -> int:
+    """Rebuild the given spring objects (default: all pending previews) in full.
+
+    Call this before exporting geometry.  Returns the number of objects rebuilt.
+    """
+    if objs is None:
+        objs = []
+        for doc_name, obj_name in list(_PENDING):
+            doc = FreeCAD.listDocuments().get(doc_name)
+            obj = doc.getObject(obj_name) if doc else None
+            if obj is None:
+                _PENDING.discard((doc_name, obj_name))
+            else:
+                objs.append(obj)
+    objs = [obj for obj in objs if getattr(obj, "ShapeIsPreview", False)]
+
+    docs = {}
+    for obj in objs:
+        _FORCE_FULL.add(_key(obj))
+        obj.touch()
+        docs[obj.Document.Name] = obj.Document
+    try:
+        for doc in docs.values():
+            doc.recompute()
+    finally:
+        for obj in objs:
+            _FORCE_FULL.discard(_key(obj))
+    return len(objs)
+
+def _schedule_idle_build() -> None:
+    """(Re)start the timer that builds pending previews once editing pauses."""
+
+    global _IDLE_TIMER
+    delay = CoreUtils.preference_int("preview_idle_ms", 1500)
+    if delay <= 0 or not FreeCAD.GuiUp:
+        return
+    if _IDLE_TIMER is None:
+        from PySide2 import QtCore
+        _IDLE_TIMER = QtCore.QTimer()
+        _IDLE_TIMER.setSingleShot(True)
+        _IDLE_TIMER.timeout.connect(build_full_shapes)
+    _IDLE_TIMER.start(delay)
@@ -0,0 +1,184 @@
+"""Optional per-phase timing of spring recomputes.
+
+When the ``profiling`` preference is set, recompute phases (enumeration
+loading, ``update_globals``, ``update_properties``, shape building, ...) record
+their wall time and call count for the spring object being recomputed.  The
+statistics can be listed per object or per spring type, together with cache
+hit rates, and exported as JSON or CSV.  Phase times include the phases nested
+inside them (an ``enum_load`` during ``update_globals`` counts in both).  When
+profiling is off, ``phase`` and ``recompute`` return a shared no-op context
+manager.  Standard library only; the preference is read through FreeCAD when
+it is available.
+"""
+
+import csv, json, time
+from typing import Dict, List, Tuple
+
+try:
+    import FreeCAD
+except ImportError:
+    FreeCAD = None
+
+_ENABLED = None  # cached preference, None until first use
+_STATS: Dict[Tuple[str, str, str], List[float]] = {}  # { (object, spring type, phase): [calls, total s, max s] }
+_CURRENT = ("", "")  # (object, spring type) being recomputed
+
+# Columns of rows() and of the CSV export.
+COLUMNS = ("scope", "key", "phase", "calls", "total_ms", "mean_ms", "max_ms", "hit_rate")
+
+def enabled() -> bool:
+    """Return True if profiling is on, reading the preference on first use."""
+
+    global _ENABLED
+    if _ENABLED is None:
+        _ENABLED = False
+        if FreeCAD is not None:
+            from .Utils import preference_bool
+            _ENABLED = preference_bool("profiling", False)
+    return _ENABLED
+
+def set_enabled(value: bool) -> None:
+    """Turn profiling on or off for this session."""
+
+    global _ENABLED
+    _ENABLED = value
+
+def refresh() -> None:
+    """Forget the cached preference so the next phase re-reads it."""
+
+    global _ENABLED
+    _ENABLED = None
+
+def reset() -> None:
+    """Discard all recorded statistics."""
+    _STATS.clear()
+
+def record(phase: str, elapsed: float) -> None:
+    """Add one call of ``phase`` taking ``elapsed`` seconds to the current object."""
+
+    entry = _STATS.get(_CURRENT + (phase,))
+    if entry is None:
+        _STATS[_CURRENT + (phase,)] = [1, elapsed, elapsed]
+    else:
+        entry[0] += 1
+        entry[1] += elapsed
+        if elapsed > entry[2]:
+            entry[2] = elapsed
+
+class _Null:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+_NULL = _Null()
+
+class _Phase:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        record(self.name, time.perf_counter() - self.start)
+        return False
+
+class _Recompute(_Phase):
+    __slots__ = ("current", "previous")
+
+    def __init__(self, current):
+        super().__init__("recompute")
+        self.current = current
+
+    def __enter__(self):
+        global _CURRENT
+        self.previous, _CURRENT = _CURRENT, self.current
+        return super().__enter__()
+
+    def __exit__(self, *exc):
+        global _CURRENT
+        super().__exit__(*exc)
+        _CURRENT = self.previous
+        return False
+
+def phase(name: str):
+    """Return a context manager timing ``name`` for the current object."""
+
+    if not (enabled() if _ENABLED is None else _ENABLED):
+        return _NULL
+    return _Phase(name)
+
+def recompute(obj):
+    """Return a context manager attributing the phases inside it to ``obj``."""
+
+    if not (enabled() if _ENABLED is None else _ENABLED):
+        return _NULL
+    doc = getattr(obj, "Document", None)
+    key = f"{doc.Name}/{obj.Name}" if doc is not None else getattr(obj, "Name", repr(obj))
+    proxy = getattr(obj, "Proxy", None)
+    spring_type = type(proxy).__name__ if proxy is not None else type(obj).__name__  # e.g. "TorsionSpring"
+    return _Recompute((key, spring_type))
+
+# ------------------------------------------------------------
+def _row(scope, key, phase, calls, total, longest, hit_rate=""):
+    return {
+        "scope": scope,
+        "key": key,
+        "phase": phase,
+        "calls": int(calls),
+        "total_ms": 1000.0 * total,
+        "mean_ms": 1000.0 * total / calls if calls else 0.0,
+        "max_ms": 1000.0 * longest,
+        "hit_rate": hit_rate,
+    }
+
+def cache_rows() -> List[dict]:
+    """Return one row per cache with its lookups and hit rate."""
+
+    rows = []
+    try:
+        from . import GeometryCache
+        stats = GeometryCache.shared_cache_stats()
+    except ImportError:
+        stats = None
+    if stats is not None:
+        hits = stats["hits"] + stats["disk_hits"]
+        lookups = hits + stats["misses"]
+        rows.append(_row("cache", "geometry", "lookup", lookups, 0.0, 0.0, hits / lookups if lookups else ""))
+    return rows
+
+def rows() -> List[dict]:
+    """Return the statistics per object, per spring type and per cache."""
+
+    by_type: Dict[Tuple[str, str], List[float]] = {}
+    result = []
+    for (key, spring_type, name), (calls, total, longest) in sorted(_STATS.items()):
+        result.append(_row("object", key or "(none)", name, calls, total, longest))
+        entry = by_type.setdefault((spring_type or "(none)", name), [0, 0.0, 0.0])
+        entry[0] += calls
+        entry[1] += total
+        entry[2] = max(entry[2], longest)
+    for (spring_type, name), (calls, total, longest) in sorted(by_type.items()):
+        result.append(_row("type", spring_type, name, calls, total, longest))
+    return result + cache_rows()
+
+def export_json(path: str) -> None:
+    """Write rows() to ``path`` as a JSON list."""
+
+    with open(path, "w") as f:
+        json.dump(rows(), f, indent=2)
+
+def export_csv(path: str) -> None:
+    """Write rows() to ``path`` as CSV with the COLUMNS header."""
+
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows())
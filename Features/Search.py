@@ -0,0 +1,303 @@
+"""Hooke & Jeeves pattern search over the headless spring models.
+
+The search adjusts the free Independent variables of a spring state to
+minimize an ODOP-style merit function: the weighted sum of squared, normalized
+constraint violations, optionally plus a weighted merit property.  It runs on
+``SpringState`` snapshots and the per-type ``Model.update`` functions only, so
+it never touches document objects and can run outside FreeCAD.
+"""
+
+import math, multiprocessing, os, random, sys, time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Factor the step size is divided by after an unsuccessful exploration.
+STEP_REDUCTION = 2.0
+
+@dataclass
+class SearchOptions:
+    """Search settings, named after the Spring preferences they come from."""
+
+    maxit: int = 600
+    delta: float = 1.0  # "del": initial relative step size
+    delmin: float = 0.0001
+    tol: float = 0.0001
+    objmin: float = 0.00001
+    fix_wt: float = 1.5
+    con_wt: float = 1.0
+    zero_wt: float = 10.0
+    viol_wt: float = 1.0
+    mfn_wt: float = 0.01
+    nmerit: int = 1
+    smallnum: float = 1.0e-07
+
+@dataclass
+class Constraint:
+    """Bounds on a state value; a ``fixed`` constraint targets ``minimum`` exactly."""
+
+    name: str
+    minimum: Optional[float] = None
+    maximum: Optional[float] = None
+    fixed: bool = False
+
+    @classmethod
+    def fix(cls, name: str, value: float) -> "Constraint":
+        return cls(name, value, value, True)
+
+@dataclass
+class SearchProblem:
+    """A state, the model update that evaluates it and what the search may change.
+
+    ``bounds`` limits the free variables (default: strictly positive);
+    ``merit`` names a state value added to the objective when ``nmerit`` is 2.
+    ``update`` must be a module-level function so problems can be pickled.
+    """
+
+    state: object
+    update: Callable
+    free: Tuple[str, ...]
+    constraints: Tuple[Constraint, ...]
+    bounds: Dict[str, Tuple[float, float]] = field(default_factory=dict)
+    merit: Optional[str] = None
+
+    def bounds_of(self, name: str) -> Tuple[float, float]:
+        return self.bounds.get(name, (0.0, math.inf))
+
+    def evaluate(self, x) -> object:
+        """Return a new state with the free variables set to ``x`` and updated."""
+
+        state = self.state.copy()
+        for name, value in zip(self.free, x):
+            setattr(state, name, value)
+        self.update(state)
+        return state
+
+@dataclass
+class SearchResult:
+    """Outcome of a search run, with timing statistics."""
+
+    x: Dict[str, float]
+    objective: float
+    feasible: bool
+    termination: str
+    iterations: int
+    evaluations: int
+    elapsed: float
+    iteration_times: List[float]
+    state: object = None
+
+    @property
+    def mean_iteration_time(self) -> float:
+        return self.elapsed / self.iterations if self.iterations else 0.0
+
+def _scale(level: float, options: SearchOptions) -> float:
+    """Return the normalizing denominator of a violation of ``level``."""
+
+    level = abs(level)
+    return level if level > options.smallnum else options.zero_wt
+
+def violation(problem: SearchProblem, state, options: SearchOptions) -> float:
+    """Return the weighted constraint violation of an evaluated state (0.0 if feasible)."""
+
+    total = 0.0
+    for constraint in problem.constraints:
+        value = getattr(state, constraint.name)
+        if not math.isfinite(value):
+            return math.inf
+        if constraint.fixed:
+            deviation = (value - constraint.minimum) / _scale(constraint.minimum, options)
+            total += options.fix_wt * deviation * deviation
+            continue
+        if constraint.minimum is not None and value < constraint.minimum:
+            deviation = (constraint.minimum - value) / _scale(constraint.minimum, options)
+            total += options.con_wt * deviation * deviation
+        if constraint.maximum is not None and value > constraint.maximum:
+            deviation = (value - constraint.maximum) / _scale(constraint.maximum, options)
+            total += options.con_wt * deviation * deviation
+    return options.viol_wt * total
+
+def objective(problem: SearchProblem, state, options: SearchOptions) -> float:
+    """Return the merit of an evaluated state: violation plus the optional merit term."""
+
+    total = violation(problem, state, options)
+    if options.nmerit == 2 and problem.merit:
+        total += options.mfn_wt * getattr(state, problem.merit)
+    return total
+
+class _Evaluator:
+    """Counts evaluations and maps invalid designs to an infinite objective."""
+
+    def __init__(self, problem: SearchProblem, options: SearchOptions):
+        self.problem = problem
+        self.options = options
+        self.count = 0
+
+    def __call__(self, x) -> float:
+        self.count += 1
+        for name, value in zip(self.problem.free, x):
+            lower, upper = self.problem.bounds_of(name)
+            if not lower < value < upper:
+                return math.inf
+        try:
+            state = self.problem.evaluate(x)
+        except (ArithmeticError, ValueError):
+            return math.inf
+        return objective(self.problem, state, self.options)
+
+def _explore(evaluate, x, f, delta, smallnum):
+    """Try a relative step up and down along each variable, keeping improvements."""
+
+    x = list(x)
+    for i, value in enumerate(x):
+        step = delta * max(abs(value), smallnum)
+        for trial in (value + step, value - step):
+            x[i] = trial
+            f_trial = evaluate(x)
+            if f_trial < f:
+                f = f_trial
+                break
+        else:
+            x[i] = value
+    return x, f
+
+def search(problem: SearchProblem, options: Optional[SearchOptions] = None, x0=None) -> SearchResult:
+    """Minimize the problem's objective by Hooke & Jeeves pattern search.
+
+    Starts from ``x0`` (default: the free variables of ``problem.state``) and
+    stops when the objective drops below ``objmin``, the step size falls below
+    ``delmin``, an iteration improves the objective by less than ``tol``
+    (relative), or ``maxit`` iterations have run.
+    """
+    options = options or SearchOptions()
+    evaluate = _Evaluator(problem, options)
+    start = time.perf_counter()
+    iteration_times = []
+
+    base = list(x0) if x0 is not None else [getattr(problem.state, name) for name in problem.free]
+    f_base = evaluate(base)
+    delta = options.delta
+    termination = "maxit"
+    while len(iteration_times) < options.maxit:
+        if f_base <= options.objmin:
+            termination = "objmin"
+            break
+        iteration_start = time.perf_counter()
+        x_new, f_new = _explore(evaluate, base, f_base, delta, options.smallnum)
+        if f_new < f_base:
+            f_start = f_base
+            while f_new < f_base:
+                pattern = [2.0 * new - old for new, old in zip(x_new, base)]
+                base, f_base = x_new, f_new
+                if f_base <= options.objmin:
+                    break
+                x_new, f_new = _explore(evaluate, pattern, evaluate(pattern), delta, options.smallnum)
+            iteration_times.append(time.perf_counter() - iteration_start)
+            if f_base > options.objmin and f_start - f_base < options.tol * f_start:
+                termination = "tol"
+                break
+        else:
+            iteration_times.append(time.perf_counter() - iteration_start)
+            delta /= STEP_REDUCTION
+            if delta < options.delmin:
+                termination = "delmin"
+                break
+    else:
+        if f_base <= options.objmin:
+            termination = "objmin"
+
+    state = problem.evaluate(base) if math.isfinite(f_base) else None
+    return SearchResult(
+        x=dict(zip(problem.free, base)),
+        objective=f_base,
+        feasible=state is not None and violation(problem, state, options) <= options.objmin,
+        termination=termination,
+        iterations=len(iteration_times),
+        evaluations=evaluate.count,
+        elapsed=time.perf_counter() - start,
+        iteration_times=iteration_times,
+        state=state,
+    )
+
+def starting_points(problem: SearchProblem, count: int, seed: int = 0) -> List[List[float]]:
+    """Return ``count`` points drawn uniformly inside the free variables' bounds.
+
+    The same ``seed`` always yields the same points.  Every free variable must
+    have finite bounds.
+    """
+    limits = [problem.bounds_of(name) for name in problem.free]
+    for name, (lower, upper) in zip(problem.free, limits):
+        if not (math.isfinite(lower) and math.isfinite(upper)):
+            raise ValueError(f"multi-start search needs finite bounds for {name}")
+    rng = random.Random(seed)
+    return [[rng.uniform(lower, upper) for lower, upper in limits] for _ in range(count)]
+
+def _search_from(problem: SearchProblem, options: SearchOptions, x0) -> SearchResult:
+    return search(problem, options, x0)
+
+def _rank(problem: SearchProblem, result: SearchResult) -> Tuple[float, float]:
+    merit = getattr(result.state, problem.merit) if problem.merit and result.state is not None else 0.0
+    return (merit, result.objective)
+
+def python_interpreter() -> Optional[str]:
+    """Return a Python interpreter matching this one, or None if none is found.
+
+    Inside FreeCAD ``sys.executable`` is the FreeCAD program; the interpreter
+    it embeds is looked for next to it and under ``sys.prefix``.
+    """
+    if os.path.basename(sys.executable).lower().startswith("python"):
+        return sys.executable
+    if os.name == "nt":
+        names = ("python.exe",)
+    else:
+        names = (f"python{sys.version_info.major}.{sys.version_info.minor}",)
+    directories = (os.path.dirname(sys.executable), os.path.join(sys.prefix, "bin"), sys.prefix)
+    for directory in directories:
+        for name in names:
+            candidate = os.path.join(directory, name)
+            if os.path.isfile(candidate) and os.access(candidate, os.X_OK):
+                return candidate
+    return None
+
+def _worker_context():
+    """Return the multiprocessing context of the search workers, or None to search in-process.
+
+    Workers are always spawned, never forked (forking FreeCAD would copy its
+    running Qt application), and run a plain Python interpreter rather than
+    relaunching the FreeCAD executable.  They only import the headless models.
+    """
+    interpreter = python_interpreter()
+    if interpreter is None:
+        return None
+    context = multiprocessing.get_context("spawn")
+    context.set_executable(interpreter)
+    return context
+
+def multistart(problem: SearchProblem, starts: int, options: Optional[SearchOptions] = None,
+               seed: int = 0, workers: Optional[int] = None, feasible_only: bool = True) -> List[SearchResult]:
+    """Run ``search`` from ``starts`` seeded points and return the ranked results.
+
+    The local searches run concurrently in a process pool of ``workers``
+    processes (default: one per CPU); ``workers=1`` runs them in this process,
+    as does the absence of a Python interpreter to start the workers with.
+    Results are sorted by the problem's merit value, then by objective, and
+    only feasible ones are returned unless ``feasible_only`` is False.
+    """
+    options = options or SearchOptions()
+    points = starting_points(problem, starts, seed)
+    workers = min(workers or os.cpu_count() or 1, len(points)) or 1
+    context = _worker_context() if workers > 1 else None
+    results = None
+    if context is not None:
+        try:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+                futures = [executor.submit(_search_from, problem, options, x0) for x0 in points]
+                results = [future.result() for future in futures]
+        except (BrokenProcessPool, OSError):
+            results = None  # the workers could not start; search here instead
+    if results is None:
+        results = [_search_from(problem, options, x0) for x0 in points]
+    if feasible_only:
+        results = [result for result in results if result.feasible]
+    return sorted(results, key=lambda result: _rank(problem, result))
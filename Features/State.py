@@ -0,0 +1,70 @@
+"""Lightweight property snapshots used by the headless spring models.
+
+A ``SpringState`` holds the same named values as a spring FeaturePython
+object, but as plain ``__slots__`` attributes, so the calculations never go
+through the FreeCAD property system.  ``from_object`` and ``apply_to`` are the
+only places where a state and a document object meet.
+"""
+
+from typing import Any, Dict, Iterable, Optional
+
+_MISSING = object()
+
+class SpringState:
+    """Base class for the per-type state snapshots.
+
+    Subclasses list their fields and default values in ``FIELDS`` and declare
+    ``__slots__ = tuple(FIELDS)``.
+    """
+
+    __slots__ = ()
+    FIELDS: Dict[str, Any] = {}
+
+    def __init__(self, **values):
+        for name, default in self.FIELDS.items():
+            setattr(self, name, values.pop(name, default))
+        if values:
+            raise TypeError(f"{type(self).__name__} has no fields {sorted(values)}")
+
+    @classmethod
+    def from_object(cls, obj):
+        """Create a state from the properties of a spring object.
+
+        Missing properties keep their default values; quantities are reduced
+        to their plain ``Value``.
+        """
+        state = cls()
+        for name in cls.FIELDS:
+            value = getattr(obj, name, None)
+            if value is not None:
+                setattr(state, name, getattr(value, "Value", value))
+        return state
+
+    def apply_to(self, obj, names: Optional[Iterable[str]] = None) -> None:
+        """Copy the named fields (default: all) onto ``obj`` in a single pass.
+
+        Only values that differ from the current property value are assigned,
+        so unchanged properties do not trigger ``onChanged`` or touch the object.
+        Properties the object does not have (yet) are skipped.
+        """
+        for name in self.FIELDS if names is None else names:
+            current = getattr(obj, name, _MISSING)
+            if current is _MISSING:
+                continue
+            value = getattr(self, name)
+            if current != value:
+                setattr(obj, name, value)
+
+    def copy(self):
+        """Return a shallow copy of this state."""
+        other = type(self).__new__(type(self))
+        for name in self.FIELDS:
+            setattr(other, name, getattr(self, name))
+        return other
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the fields of this state as a dictionary."""
+        return {name: getattr(self, name) for name in self.FIELDS}
+
+    def __repr__(self):
+        return f"{type(self).__name__}({', '.join(f'{k}={v!r}' for k, v in self.as_dict().items())})"
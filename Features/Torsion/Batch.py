@@ -0,0 +1,46 @@
+"""Vectorized evaluation of the torsion spring equations.
+
+The NumPy counterpart of ``Model.update_properties``: every input may be a
+scalar or an array, and ``jacobian`` returns the derivatives of the results
+with respect to the Independent variables in the same pass.
+"""
+
+from __future__ import annotations
+from typing import Dict
+
+import numpy as np
+
+from .. import ForwardDiff as fd
+from . import Model as SpringModel
+
+def evaluate(outside_diameter_at_free, wire_diameter, coils_total, length_at_free=0.0,
+             elastic_modulus=SpringModel.MUSIC_WIRE_YOUNG_MODULUS, _differentiate: bool = False) -> Dict[str, np.ndarray]:
+    """Evaluate the torsion spring Rate (torque per radian) for arrays of designs (0 where invalid)."""
+
+    od, d, nt, lf = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (
+        outside_diameter_at_free, wire_diameter, coils_total, length_at_free,
+    )))
+    e = np.asarray(elastic_modulus, dtype=float)
+    if _differentiate:
+        od, d, nt, lf = fd.variables(od, d, nt, lf)
+    dm = od - d
+    valid = (fd.value(dm) > 0.0) & (fd.value(d) > 0.0) & (fd.value(nt) > 0.0) & (e > 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        wire_m = d / 1000.0
+        mean_m = dm / 1000.0
+        rate = (e * wire_m ** 4) / (64.0 * nt * mean_m) * 1000.0
+    return {"Rate": fd.where(valid, rate, 0.0)}
+
+def jacobian(*args, **kwargs) -> Dict[str, np.ndarray]:
+    """Return the derivatives of the evaluate() outputs with respect to ``Model.INDEPENDENT``.
+
+    Takes the arguments of evaluate(); each result has a trailing axis
+    ordered as ``Model.INDEPENDENT``.
+    """
+    return fd.jacobian(evaluate(*args, _differentiate=True, **kwargs))
+
+def state_jacobian(state) -> Dict[str, Dict[str, float]]:
+    """Return jacobian() for one TorsionState as { output: { independent: derivative } }."""
+
+    jac = jacobian(state.OutsideDiameterAtFree, state.WireDiameter, state.CoilsTotal, state.LengthAtFree, state.ElasticModulus)
+    return {name: dict(zip(SpringModel.INDEPENDENT, grad.tolist())) for name, grad in jac.items()}
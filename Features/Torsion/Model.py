@@ -0,0 +1,87 @@
+"""Headless calculation model for torsion springs."""
+
+from __future__ import annotations
+
+from .. import Profiling
+from ..State import SpringState
+
+MUSIC_WIRE_YOUNG_MODULUS = 207e9  # Pascals
+
+INDEPENDENT = (
+    "OutsideDiameterAtFree",
+    "WireDiameter",
+    "CoilsTotal",
+    "LengthAtFree",
+)
+
+DEPENDENT = (
+    "Pitch",
+    "Rate",
+)
+
+GLOBAL = (
+    "CoilsInactive",
+    "ElasticModulus",
+)
+
+# Properties assigned by update_globals() and update_properties() respectively.
+GLOBAL_RESULTS = ()
+PROPERTY_RESULTS = ("Rate",)
+
+class TorsionState(SpringState):
+    """Property snapshot of a torsion spring."""
+
+    FIELDS = {
+        "OutsideDiameterAtFree": 20.0,
+        "WireDiameter": 2.0,
+        "CoilsTotal": 10.0,
+        "LengthAtFree": 25.0,
+        "Pitch": 2.5,
+        "Rate": 0.0,
+        "CoilsInactive": 0.0,
+        "ElasticModulus": MUSIC_WIRE_YOUNG_MODULUS,
+    }
+    __slots__ = tuple(FIELDS)
+
+def _as_float(value, default):
+    try:
+        candidate = getattr(value, "Value", value)
+        return float(candidate)
+    except (TypeError, ValueError):
+        return float(default)
+
+def update_globals(state) -> None:
+    """Update global properties based on the state's global properties."""
+
+def update_properties(state) -> None:
+    """Update dependent properties based on the state's properties."""
+
+    rate = 0.0
+
+    try:
+        outer = float(state.OutsideDiameterAtFree)
+        wire = float(state.WireDiameter)
+        coils = float(state.CoilsTotal)
+        young_modulus = _as_float(getattr(state, "ElasticModulus", MUSIC_WIRE_YOUNG_MODULUS), MUSIC_WIRE_YOUNG_MODULUS)
+    except (AttributeError, TypeError, ValueError):
+        state.Rate = rate
+        return
+
+    mean_diameter = outer - wire
+    if mean_diameter <= 0.0 or wire <= 0.0 or coils <= 0.0 or young_modulus <= 0.0:
+        state.Rate = rate
+        return
+
+    wire_m = wire / 1000.0
+    mean_m = mean_diameter / 1000.0
+    torque_per_radian = (young_modulus * wire_m**4) / (64.0 * coils * mean_m)
+    rate = torque_per_radian * 1000.0
+    state.Rate = rate
+
+def update(state) -> None:
+    """Run update_globals() followed by update_properties()."""
+
+    with Profiling.phase("update_globals"):
+        update_globals(state)
+    with Profiling.phase("update_properties"):
+        update_properties(state)
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-MUSIC_WIRE_YOUNG_MODULUS = 207e9  # Pascals
+from .. import Enums
+from . import Batch, Model
+from .Model import MUSIC_WIRE_YOUNG_MODULUS
 
 def _as_float(value, default):
     try:
@@ -14,28 +16,42 @@ def _as_float(value, default):
 def update_globals(obj) -> None:
     """Update global properties based on the object's global properties."""
 
+    state = Model.TorsionState.from_object(obj)
+    Model.update_globals(state)
+    state.apply_to(obj, Model.GLOBAL_RESULTS)
 
 def update_properties(obj) -> None:
     """Update properties based on the object's properties."""
 
-    rate = 0.0
-
-    try:
-        outer = float(obj.OutsideDiameterAtFree)
-        wire = float(obj.WireDiameter)
-        coils = float(obj.CoilsTotal)
-        young_modulus = _as_float(getattr(obj, "ElasticModulus", MUSIC_WIRE_YOUNG_MODULUS), MUSIC_WIRE_YOUNG_MODULUS)
-    except (AttributeError, TypeError, ValueError):
-        obj.Rate = rate
-        return
-
-    mean_diameter = outer - wire
-    if mean_diameter <= 0.0 or wire <= 0.0 or coils <= 0.0 or young_modulus <= 0.0:
-        obj.Rate = rate
-        return
-
-    wire_m = wire / 1000.0
-    mean_m = mean_diameter / 1000.0
-    torque_per_radian = (young_modulus * wire_m**4) / (64.0 * coils * mean_m)
-    rate = torque_per_radian * 1000.0
-    obj.Rate = rate
+    state = Model.TorsionState.from_object(obj)
+    Model.update_properties(state)
+    state.apply_to(obj, Model.PROPERTY_RESULTS)
+
+def sensitivities(obj) -> dict:
+    """Return the derivatives of the Dependent properties with respect to each Independent one.
+
+    The result maps output names to { independent name: derivative }.
+    """
+    return Batch.state_jacobian(Model.TorsionState.from_object(obj))
+
+def update(obj) -> None:
+    """Run update_globals() and update_properties() on a single state snapshot."""
+
+    state = Model.TorsionState.from_object(obj)
+    Model.update(state)
+    state.apply_to(obj, Model.GLOBAL_RESULTS + Model.PROPERTY_RESULTS)
+
+def end_template(obj, radius) -> tuple | None:
+    """Return the (template, leg length, 0, 0) of the spring's legs, or None.
+
+    ``radius`` is the radius of the coil the legs are attached to; the leg
+    length is the EndType's LegLength in coil diameters.
+    """
+    end_type_index = Enums.enum_index("Torsion", "EndType", getattr(obj, "EndType", None))
+    if end_type_index == 0:
+        return None
+    end_types = Enums.enum_table("Torsion", "EndType")
+    template = end_types.value(end_type_index, "Template")
+    if template == "none":
+        return None
+    return (template, end_types.value(end_type_index, "LegLength") * 2.0 * radius, 0.0, 0.0)
@@ -0,0 +1,167 @@
+"""Triangle meshes of spring coils built directly with NumPy.
+
+``helix_tube`` sweeps a circular wire section along the same helix as
+``Utils.helix_solid`` (``Part.makeHelix(pitch, height, radius)``: right-handed,
+starting at (radius, 0, 0) and rising along +Z) but produces vertex and face
+arrays analytically, with no OCC sweep or tessellation.  The section is
+carried by the helix's Frenet frame, which is constant along a helix, so every
+ring is a rotation of the first.  ``write_stl`` and ``write_obj`` stream any
+number of meshes into one binary STL or OBJ file.  This module needs NumPy but
+neither FreeCAD nor Part.
+"""
+
+import math, struct
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Iterable, Optional, Sequence
+
+import numpy as np
+
+# Default resolution: segments along one turn of the helix and around the wire.
+SEGMENTS_PER_TURN = 48
+SEGMENTS_AROUND = 12
+
+@dataclass
+class TubeMesh:
+    """Triangle mesh: ``vertices`` (n, 3) float and ``faces`` (m, 3) vertex indices, counter-clockwise seen from outside."""
+
+    vertices: np.ndarray
+    faces: np.ndarray
+    name: str = ""
+
+    def transformed(self, matrix: Sequence[float], name: Optional[str] = None) -> "TubeMesh":
+        """Return a copy with the vertices transformed by a 4x4 (row-major, 16 values) matrix."""
+
+        matrix = np.asarray(matrix, dtype=float).reshape(4, 4)
+        vertices = self.vertices @ matrix[:3, :3].T + matrix[:3, 3]
+        return TubeMesh(vertices, self.faces, self.name if name is None else name)
+
+    def triangles(self) -> np.ndarray:
+        """Return the (m, 3, 3) corner coordinates of every face."""
+        return self.vertices[self.faces]
+
+@lru_cache(maxsize=256)
+def _helix_tube(radius, pitch, height, wire_radius, segments_per_turn, segments_around, caps):
+    turns = height / pitch if pitch > 0.0 else 0.0
+    sections = max(int(math.ceil(turns * segments_per_turn)), 1)
+    t = np.linspace(0.0, 2.0 * math.pi * turns, sections + 1)  # helix angle of each ring
+    c = pitch / (2.0 * math.pi)
+    length = math.hypot(radius, c)
+
+    # Frenet frame: normal towards the axis, binormal = tangent x normal.
+    cos_t, sin_t = np.cos(t), np.sin(t)
+    center = np.column_stack((radius * cos_t, radius * sin_t, c * t))
+    normal = np.column_stack((-cos_t, -sin_t, np.zeros_like(t)))
+    binormal = np.column_stack((c * sin_t, -c * cos_t, np.full_like(t, radius))) / length
+
+    phi = np.linspace(0.0, 2.0 * math.pi, segments_around, endpoint=False)
+    ring = wire_radius * np.cos(phi)[None, :, None] * normal[:, None, :] + wire_radius * np.sin(phi)[None, :, None] * binormal[:, None, :]
+    vertices = (center[:, None, :] + ring).reshape(-1, 3)
+
+    # Two triangles per quad between ring i and ring i + 1.
+    i = np.arange(sections)[:, None] * segments_around
+    j = np.arange(segments_around)[None, :]
+    j1 = (j + 1) % segments_around
+    a, b = i + j, i + j1
+    d, e = a + segments_around, b + segments_around
+    faces = np.concatenate((
+        np.stack((a, b, d), axis=-1).reshape(-1, 3),
+        np.stack((b, e, d), axis=-1).reshape(-1, 3),
+    ))
+
+    if caps:
+        start, end = len(vertices), len(vertices) + 1
+        vertices = np.concatenate((vertices, center[[0, -1]]))
+        last = sections * segments_around
+        j, j1 = j[0], j1[0]
+        faces = np.concatenate((
+            faces,
+            np.column_stack((np.full(segments_around, start), j1, j)),
+            np.column_stack((np.full(segments_around, end), last + j, last + j1)),
+        ))
+
+    vertices.setflags(write=False)
+    faces = faces.astype(np.int64)
+    faces.setflags(write=False)
+    return vertices, faces
+
+def helix_tube(radius, pitch, height, wire_radius, segments_per_turn=SEGMENTS_PER_TURN,
+               segments_around=SEGMENTS_AROUND, caps=True, name="") -> TubeMesh:
+    """Return the mesh of a circular wire swept along a helix.
+
+    The arguments match ``Utils.helix_solid``.  Meshes of identical parameters
+    share their (read-only) arrays.
+    """
+    if segments_per_turn < 3 or segments_around < 3:
+        raise ValueError("a tube mesh needs at least 3 segments per turn and around the wire")
+    vertices, faces = _helix_tube(
+        float(radius), float(pitch), float(height), float(wire_radius),
+        int(segments_per_turn), int(segments_around), bool(caps),
+    )
+    return TubeMesh(vertices, faces, name)
+
+def helix_centerline(radius, pitch, height, segments_per_turn=SEGMENTS_PER_TURN) -> np.ndarray:
+    """Return the (n, 3) points of the helix that helix_tube sweeps along."""
+
+    turns = height / pitch if pitch > 0.0 else 0.0
+    sections = max(int(math.ceil(turns * segments_per_turn)), 1)
+    t = np.linspace(0.0, 2.0 * math.pi * turns, sections + 1)
+    return np.column_stack((radius * np.cos(t), radius * np.sin(t), pitch / (2.0 * math.pi) * t))
+
+def spring_mesh(obj, segments_per_turn=SEGMENTS_PER_TURN, segments_around=SEGMENTS_AROUND, placement=True) -> TubeMesh:
+    """Return the tube mesh of a spring object, in document coordinates if ``placement``."""
+
+    mesh = helix_tube(
+        obj.OutsideDiameterAtFree / 2.0, obj.Pitch, obj.LengthAtFree, obj.WireDiameter / 2.0,
+        segments_per_turn, segments_around, name=getattr(obj, "Label", "") or getattr(obj, "Name", ""),
+    )
+    if placement and hasattr(obj, "Placement"):
+        mesh = mesh.transformed(obj.Placement.toMatrix().A)
+    return mesh
+
+# ------------------------------------------------------------
+_STL_TRIANGLE = np.dtype([("normal", "<f4", (3,)), ("corners", "<f4", (3, 3)), ("attribute", "<u2")])
+
+def write_stl(path: str, meshes: Iterable[TubeMesh]) -> int:
+    """Write ``meshes`` into one binary STL file and return the number of triangles."""
+
+    count = 0
+    with open(path, "wb") as f:
+        f.write(b"Spring workbench tube mesh".ljust(80, b" "))
+        f.write(struct.pack("<I", 0))  # patched below
+        for mesh in meshes:
+            corners = mesh.triangles()
+            normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+            lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+            records = np.zeros(len(corners), dtype=_STL_TRIANGLE)
+            records["normal"] = np.divide(normals, lengths, out=np.zeros_like(normals), where=lengths > 0.0)
+            records["corners"] = corners
+            records.tofile(f)
+            count += len(records)
+        f.seek(80)
+        f.write(struct.pack("<I", count))
+    return count
+
+def write_obj(path: str, meshes: Iterable[TubeMesh]) -> int:
+    """Write ``meshes`` into one OBJ file, one object each, and return the number of triangles."""
+
+    count = 0
+    offset = 1  # OBJ indices are 1-based and global to the file
+    with open(path, "w") as f:
+        f.write("# Spring workbench tube mesh\n")
+        for number, mesh in enumerate(meshes, start=1):
+            f.write(f"o {mesh.name or f'spring{number}'}\n")
+            np.savetxt(f, mesh.vertices, fmt="v %.6f %.6f %.6f")
+            np.savetxt(f, mesh.faces + offset, fmt="f %d %d %d")
+            offset += len(mesh.vertices)
+            count += len(mesh.faces)
+    return count
+
+def write_meshes(path: str, meshes: Iterable[TubeMesh]) -> int:
+    """Write ``meshes`` as STL or OBJ depending on the extension of ``path``."""
+
+    if path.lower().endswith(".stl"):
+        return write_stl(path, meshes)
+    if path.lower().endswith(".obj"):
+        return write_obj(path, meshes)
+    raise ValueError(f"{path}: unsupported mesh type (expected .stl or .obj)")
@@ -1,10 +1,13 @@
 import FreeCAD, Part
 import sys, os, json, math, time
+from contextlib import contextmanager
 from dataclasses import dataclass
 from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
+from . import Enums, GeometryCache, Log
+
 SPRING_PREFERENCES_PATH = "User parameter:BaseApp/Preferences/Mod/Spring"
 
 def _spring_preferences() -> FreeCAD.ParamGet:
@@ -27,9 +30,118 @@ def preference_bool(name: str, default: bool) -> bool:
 
     return _spring_preferences().GetBool(name, default)
 
+def preference_string(name: str, default: str) -> str:
+    """Read a string preference value with a fallback default."""
+
+    return _spring_preferences().GetString(name, default)
+
+def catalog_directory() -> str:
+    """Return the directory stock-spring catalogs are loaded from."""
+
+    default = os.path.join(FreeCAD.getUserAppDataDir(), "Spring", "catalogs")
+    return preference_string("catalog_dir", "") or default
+
+def search_options():
+    """Return the design search settings stored in the Spring preferences."""
+
+    from .Search import SearchOptions
+
+    return SearchOptions(
+        maxit=preference_int("maxit", 600),
+        delta=preference_float("del", 1.0),
+        delmin=preference_float("delmin", 0.0001),
+        tol=preference_float("tol", 0.0001),
+        objmin=preference_float("objmin", 0.00001),
+        fix_wt=preference_float("fix_wt", 1.5),
+        con_wt=preference_float("con_wt", 1.0),
+        zero_wt=preference_float("zero_wt", 10.0),
+        viol_wt=preference_float("viol_wt", 1.0),
+        mfn_wt=preference_float("mfn_wt", 0.01),
+        nmerit=preference_int("nmerit", 1),
+        smallnum=preference_float("smallnum", 1.0e-07),
+    )
+
+_DEFERRED = 0  # depth of nested deferred_updates() blocks
+_BATCHES: Dict[tuple, int] = {}  # { (document name, object name or None): depth of spring_batch() blocks }
+
+@contextmanager
+def deferred_updates():
+    """Skip the calculations of springs created or edited inside the block.
+
+    The springs are brought up to date by their next ``execute``, so a single
+    document recompute after the block updates all of them.
+    """
+    global _DEFERRED
+    _DEFERRED += 1
+    try:
+        yield
+    finally:
+        _DEFERRED -= 1
+
+def updates_deferred(obj=None) -> bool:
+    """Return True inside deferred_updates(), or if ``obj`` is inside a spring_batch() block."""
+
+    if _DEFERRED > 0:
+        return True
+    if obj is None or not _BATCHES:
+        return False
+    doc = obj.Document.Name
+    return (doc, None) in _BATCHES or (doc, obj.Name) in _BATCHES
+
+# Proxy classes of the spring features; only compression springs carry a SpringType property.
+SPRING_PROXIES = ("CompressionSpring", "ExtensionSpring", "TorsionSpring")
+
+def is_spring(obj) -> bool:
+    """Return True if ``obj`` is a compression, extension or torsion spring feature."""
+    return type(getattr(obj, "Proxy", None)).__name__ in SPRING_PROXIES
+
+def document_springs(doc) -> list:
+    """Return the spring objects of ``doc``, in document order."""
+    return [obj for obj in doc.Objects if is_spring(obj)]
+
+def selected_springs(selection, doc) -> list:
+    """Return the springs among ``selection``, or every spring of ``doc`` if none is selected."""
+    return [obj for obj in selection if is_spring(obj)] or document_springs(doc)
+
+def _batch_springs(target):
+    """Return the springs covered by a spring_batch() target."""
+
+    if hasattr(target, "Objects"):  # a document
+        return document_springs(target)
+    return [target]
+
+@contextmanager
+def spring_batch(target, recompute: bool = True):
+    """Suspend the recalculation and shape rebuild of springs while editing them.
+
+    ``target`` is a spring object or a document (all of its springs).  Inside
+    the block, property changes are only recorded and recomputes skip the
+    covered springs; on exit they are touched and, unless ``recompute`` is
+    False or an exception is propagating, the document is recomputed once.
+    Nested blocks defer to the outermost one.
+    """
+    is_document = hasattr(target, "Objects")
+    doc = target if is_document else target.Document
+    key = (doc.Name, None if is_document else target.Name)
+    _BATCHES[key] = _BATCHES.get(key, 0) + 1
+    try:
+        yield target
+    except BaseException:
+        recompute = False
+        raise
+    finally:
+        _BATCHES[key] -= 1
+        if not _BATCHES[key]:
+            del _BATCHES[key]
+        pending = [obj for obj in _batch_springs(target) if not updates_deferred(obj)]
+        for obj in pending:
+            obj.touch()
+        if recompute and pending:
+            doc.recompute()
+
 def add_property(obj, name, default, typ="App::PropertyFloat", group="Spring", mode=0):
     """Safely add a FreeCAD property if it doesn't already exist."""
-    FreeCAD.Console.PrintMessage(f"[add_property] obj={obj} name={name} default={default} typ={typ} group={group} mode={mode}\n")
+    Log.debug("[add_property] obj=%s name=%s default=%s typ=%s group=%s mode=%s", obj, name, default, typ, group, mode)
     if not hasattr(obj, name):
         obj.addProperty(typ, name, group, "")
         if default is not None:
@@ -37,15 +149,30 @@ def add_property(obj, name, default, typ="App::PropertyFloat", group="Spring", m
         obj.setEditorMode(name, mode)
         
 def helix_solid(radius, pitch, height, wire_radius):
-    """Create a helical solid (coil) from geometric parameters."""
-    FreeCAD.Console.PrintMessage(f"[helix_solid] radius={radius} pitch={pitch} height={height} wire_radius={wire_radius}\n")
+    """Create a helical solid (coil) from geometric parameters.
+
+    Results are shared through the geometry cache, so identical springs are
+    only swept once.
+    """
+    Log.debug("[helix_solid] radius=%s pitch=%s height=%s wire_radius=%s", radius, pitch, height, wire_radius)
+    return GeometryCache.cached_shape(
+        "helix_solid", (radius, pitch, height, wire_radius),
+        lambda: _build_helix_solid(radius, pitch, height, wire_radius),
+    )
+
+def _build_helix_solid(radius, pitch, height, wire_radius):
+    """Sweep a circular wire section along a helix."""
     helix = Part.makeHelix(pitch, height, radius)
     helix_wire = helix if isinstance(helix, Part.Wire) else Part.Wire([helix])
-    helix_edge = helix_wire.Edges[0]
+    return _sweep_wire_section(helix_wire, wire_radius, height)
+
+def _sweep_wire_section(path_wire, wire_radius, height, frenet=True):
+    """Sweep a circle of ``wire_radius`` along ``path_wire`` (a cylinder if the sweep fails)."""
 
-    u0 = helix_edge.FirstParameter
-    start_pt = helix_edge.valueAt(u0)
-    tangent = helix_edge.tangentAt(u0)
+    path_edge = path_wire.Edges[0]
+    u0 = path_edge.FirstParameter
+    start_pt = path_edge.valueAt(u0)
+    tangent = path_edge.tangentAt(u0)
     if isinstance(tangent, tuple):
         tangent = tangent[0]
     tangent.normalize()
@@ -54,7 +181,7 @@ def helix_solid(radius, pitch, height, wire_radius):
     circle_wire = Part.Wire(circle)
 
     try:
-        sweep = helix_wire.makePipeShell([circle_wire], True, True)
+        sweep = path_wire.makePipeShell([circle_wire], True, frenet)
         if sweep.ShapeType == "Shell":
             sweep = Part.makeSolid(sweep)
     except Exception:
@@ -62,6 +189,211 @@ def helix_solid(radius, pitch, height, wire_radius):
 
     return sweep
 
+# Points per turn interpolated by the variable-pitch coil path.
+COIL_PATH_POINTS_PER_TURN = 16
+
+def coil_solid(radius, pitch, height, wire_radius, end_coils=0.0, ground=False):
+    """Create a coil with closed and/or ground ends.
+
+    ``end_coils`` turns at each end are closed (pitch of one wire diameter)
+    and the remaining height is wound at ``pitch``.  The wire follows one
+    variable-pitch B-spline path swept once; ``ground`` ends are then flattened
+    by a single planar trim to 0 <= z <= ``height``.  Without end coils or
+    grinding this is helix_solid.
+    """
+    if end_coils <= 0.0 and not ground:
+        return helix_solid(radius, pitch, height, wire_radius)
+    Log.debug("[coil_solid] radius=%s pitch=%s height=%s wire_radius=%s end_coils=%s ground=%s",
+              radius, pitch, height, wire_radius, end_coils, ground)
+    return GeometryCache.cached_shape(
+        "coil_solid", (radius, pitch, height, wire_radius, end_coils, float(bool(ground))),
+        lambda: _build_coil_solid(radius, pitch, height, wire_radius, end_coils, ground),
+    )
+
+def coil_path_points(radius, pitch, height, wire_radius, end_coils=0.0, ground=False) -> list:
+    """Return the points of the coil_solid centerline, COIL_PATH_POINTS_PER_TURN per turn.
+
+    The centerline rises from ``z0`` (0 for ground ends, where half the tip is
+    ground away, else one wire radius) to ``height - z0``: ``end_coils`` turns
+    at a pitch of one wire diameter, the active turns at ``pitch``, then the
+    closing end coils.
+    """
+    end_pitch = 2.0 * wire_radius
+    z0 = 0.0 if ground else wire_radius
+    active_turns = max(height - 2.0 * z0 - 2.0 * end_coils * end_pitch, 0.0) / pitch if pitch > 0.0 else 0.0
+    # (turns, pitch) of each section of the path
+    sections = [(end_coils, end_pitch), (active_turns, pitch), (end_coils, end_pitch)]
+
+    points = [FreeCAD.Vector(radius, 0.0, z0)]
+    turn, z = 0.0, z0
+    for turns, section_pitch in sections:
+        steps = int(math.ceil(turns * COIL_PATH_POINTS_PER_TURN))
+        for step in range(1, steps + 1):
+            angle = 2.0 * math.pi * (turn + turns * step / steps)
+            points.append(FreeCAD.Vector(
+                radius * math.cos(angle), radius * math.sin(angle), z + section_pitch * turns * step / steps,
+            ))
+        turn += turns
+        z += section_pitch * turns
+    return points
+
+def _build_coil_solid(radius, pitch, height, wire_radius, end_coils, ground):
+    """Sweep a circular wire section along the variable-pitch coil path, then grind the ends."""
+
+    curve = Part.BSplineCurve()
+    curve.interpolate(coil_path_points(radius, pitch, height, wire_radius, end_coils, ground))
+    sweep = _sweep_wire_section(Part.Wire([curve.toShape()]), wire_radius, height)
+    if not ground:
+        return sweep
+
+    # Both ends in one planar trim: keep what lies between z = 0 and z = height.
+    size = 2.0 * (radius + wire_radius) + 1.0
+    bounds = Part.makeBox(size, size, height, FreeCAD.Vector(-size / 2.0, -size / 2.0, 0.0))
+    try:
+        trimmed = sweep.common(bounds)
+        return trimmed.Solids[0] if len(trimmed.Solids) == 1 else trimmed
+    except Exception as e:
+        Log.warning("[coil_solid] grinding trim failed, keeping the unground coil: %s", e)
+        return sweep
+
+# End templates of extension (hooks and loops) and torsion (legs) springs.
+END_TEMPLATES = ("machine", "crossover", "straight", "bent")
+
+def end_template_path(template, radius, wire_radius, size, sweep=0.0, extension=0.0):
+    """Return the wire path of an end template as a list of edges.
+
+    Templates are built for the end of a coil of ``radius`` at (radius, 0, 0)
+    with the wire leaving along +Y and the spring body below z = 0:
+
+    * ``machine``: the wire bends up and forms a loop of radius ``size``
+      towards the axis over ``sweep`` degrees, after a straight rise of
+      ``extension`` loop radii (a hook).
+    * ``crossover``: the wire first crosses to the axis, then forms a loop of
+      radius ``size`` over the axis.
+    * ``straight``: a tangent leg of length ``size``.
+    * ``bent``: a tangent leg of length ``size`` bent up by 90 degrees for
+      half its length.
+    """
+    X, Y, Z = FreeCAD.Vector(1, 0, 0), FreeCAD.Vector(0, 1, 0), FreeCAD.Vector(0, 0, 1)
+    bend = 2.0 * wire_radius
+    if template == "machine":
+        steps = [("arc", bend, 90.0, Z)]
+        if extension > 0.0:
+            steps.append(("line", extension * size))
+        steps.append(("arc", size, sweep, -X))
+    elif template == "crossover":
+        steps = [("arc", bend, 90.0, -X), ("line", radius - bend), ("arc", size, sweep, Z)]
+    elif template == "straight":
+        steps = [("line", size)]
+    elif template == "bent":
+        steps = [("line", size), ("arc", bend, 90.0, Z), ("line", size / 2.0)]
+    else:
+        raise ValueError(f"unknown end template {template!r}")
+
+    # Walk the path: ("line", length) or ("arc", radius, degrees, direction curved towards).
+    point, tangent = FreeCAD.Vector(radius, 0, 0), Y
+    edges = []
+    for step in steps:
+        if step[0] == "line":
+            end = point + tangent * step[1]
+            edges.append(Part.LineSegment(point, end).toShape())
+            point = end
+            continue
+        _kind, arc_radius, degrees, toward = step
+        center = point + toward * arc_radius
+
+        def at(angle):
+            return center - toward * (arc_radius * math.cos(angle)) + tangent * (arc_radius * math.sin(angle))
+
+        angle = math.radians(degrees)
+        end = at(angle)
+        edges.append(Part.Arc(point, at(angle / 2.0), end).toShape())
+        point, tangent, toward = end, tangent * math.cos(angle) + toward * math.sin(angle), toward * math.cos(angle) - tangent * math.sin(angle)
+    return edges
+
+@lru_cache(maxsize=128)
+def end_template(template, radius, wire_radius, size, sweep=0.0, extension=0.0):
+    """Return the solid of an end template (see end_template_path).
+
+    Each template is swept once per parameter set; springs attach copies by
+    placement.  The returned shape is shared and must not be modified.
+    """
+    Log.debug("[end_template] template=%s radius=%s wire_radius=%s size=%s sweep=%s extension=%s",
+              template, radius, wire_radius, size, sweep, extension)
+
+    def build():
+        path = Part.Wire(end_template_path(template, radius, wire_radius, size, sweep, extension))
+        return _sweep_wire_section(path, wire_radius, size, frenet=False)
+
+    return GeometryCache.cached_shape(
+        f"end_{template}", (radius, wire_radius, size, sweep, extension), build,
+    )
+
+def attach_ends(coil, radius, pitch, height, wire_radius, ends):
+    """Return ``coil`` with an end template placed at both ends of its helix, as a compound.
+
+    ``ends`` is the (template, size, sweep, extension) of end_template, or
+    None for a bare coil.  The ends are placed copies of the cached template:
+    no booleans are involved.
+    """
+    if not ends or pitch <= 0.0:
+        return coil
+    template = end_template(ends[0], radius, wire_radius, *ends[1:])
+    lead = math.degrees(math.atan2(pitch / (2.0 * math.pi), radius))  # helix angle at the ends
+    turns = 360.0 * height / pitch
+
+    z_axis, x_axis = FreeCAD.Vector(0, 0, 1), FreeCAD.Vector(1, 0, 0)
+    bottom = template.copy(False)
+    bottom.Placement = FreeCAD.Placement(FreeCAD.Vector(), FreeCAD.Rotation(x_axis, 180.0 + lead))
+    top = template.copy(False)
+    top.Placement = FreeCAD.Placement(
+        FreeCAD.Vector(0, 0, height), FreeCAD.Rotation(z_axis, turns).multiply(FreeCAD.Rotation(x_axis, lead)),
+    )
+    return Part.makeCompound([coil, bottom, top])
+
+def helix_preview(radius, pitch, height, wire_radius, envelope=False):
+    """Create a cheap stand-in for helix_solid while a spring is being edited.
+
+    Returns the helix centerline, or with ``envelope`` the tube swept out by the
+    coil (a revolved rectangle, no helical sweep).
+    """
+    if not envelope:
+        return Part.makeHelix(pitch, height, radius)
+    inner = max(radius - wire_radius, 0.0)
+    outer = radius + wire_radius
+    profile = Part.makePolygon([
+        FreeCAD.Vector(inner, 0, 0),
+        FreeCAD.Vector(outer, 0, 0),
+        FreeCAD.Vector(outer, 0, height),
+        FreeCAD.Vector(inner, 0, height),
+        FreeCAD.Vector(inner, 0, 0),
+    ])
+    return Part.Face(profile).revolve(FreeCAD.Vector(0, 0, 0), FreeCAD.Vector(0, 0, 1), 360)
+
+# Property groups holding a spring's design data, in report order.
+SPRING_PROPERTY_GROUPS = ("Independent", "Dependent", "Global")
+
+def spring_properties(objs, groups=SPRING_PROPERTY_GROUPS) -> List[str]:
+    """Return the names of the properties in ``groups`` found on any of ``objs``.
+
+    Names are ordered by group, then as the springs declare them.  Only the
+    first object of each spring class (proxy type) is inspected.
+    """
+    by_group = {group: [] for group in groups}
+    seen_types = set()
+    seen = set()
+    for obj in objs:
+        spring_type = type(getattr(obj, "Proxy", None))
+        if spring_type in seen_types:
+            continue
+        seen_types.add(spring_type)
+        for name in obj.PropertiesList:
+            group = obj.getGroupOfProperty(name)
+            if group in by_group and name not in seen:
+                seen.add(name)
+                by_group[group].append(name)
+    return [name for group in groups for name in by_group[group]]
+
 def spring_coils(height, pitch):
     """Number of coils based on total height and pitch."""
     return height / pitch
@@ -74,66 +406,41 @@ def spring_solid_length(wire_diameter, coils):
     """Total length when fully compressed."""
     return wire_diameter * (coils + 1)
         
-_ENUM_CACHE = {}  # { name: (header, rows, mtime) }
-
 def load_enum_table(type, enum_name):
     """
-    Load <enum_name>.json once and return (header, rows).
+    Load <enum_name>.json once and return (header, rows, mtime).
     Cached after first load for performance.
     """
-    FreeCAD.Console.PrintMessage(f"[load_enum_table] type={type} enum_name={enum_name}\n")
-    global _ENUM_CACHE
-
-    # If cached, return immediately
-    if enum_name in _ENUM_CACHE:
-        print(f"[load_enum_table] _ENUM_CACHE[enum_name]={_ENUM_CACHE[enum_name]}")
-        return _ENUM_CACHE[enum_name]
-
-    # Locate JSON relative to this script
-    base_dir = os.path.dirname(__file__)
-    path = os.path.join(base_dir, f"./{type}/{enum_name}.json")
-    path = os.path.abspath(path)
-    mtime = os.path.getmtime(path) if os.path.exists(path) else 0
+    Log.debug("[load_enum_table] type=%s enum_name=%s", type, enum_name)
 
     try:
-        with open(path, "r") as f:
-            data = json.load(f)
-
-        header, rows = data[0], data[1:]
-        _ENUM_CACHE[enum_name] = (header, rows, mtime)
-        FreeCAD.Console.PrintMessage(f"[enum_loader] Reloaded {enum_name} (modified)\n")
-
+        header, rows, mtime = Enums.load_enum_table(type, enum_name)
     except Exception as e:
-        FreeCAD.Console.PrintError(f"[enum_loader] Failed to load {enum_name}: {e}\n")
-        header, rows = [], []
-        _ENUM_CACHE[enum_name] = (header, rows, mtime)
+        Log.error("[enum_loader] Failed to load %s: %s", enum_name, e)
+        return [], [], 0
 
-    print(f"[load_enum_table] header={header} rows={rows} mtime={mtime}")
+    Log.debug("[load_enum_table] header=%s rows=%s mtime=%s", header, rows, mtime)
     return header, rows, mtime
 
 def clear_enum_cache():
     """Clear all cached enumeration data (for dev/debug use)."""
-    FreeCAD.Console.PrintMessage(f"[clear_enum_cache]"+"\n")
-    global _ENUM_CACHE
-    _ENUM_CACHE.clear()
-    FreeCAD.Console.PrintMessage(f"[clear_enum_cache] Cache cleared\n")
+    Enums.clear_enum_cache()
+    Log.debug("[clear_enum_cache] Cache cleared")
     
 def reload_enum(fp, type, name):
     """
     Rebuild a single enumeration property from its JSON definition.
     Keeps the current value if it is still valid.
     """
-    FreeCAD.Console.PrintMessage(f"[reload_enum] fp={fp} type={type} name={name}\n")
+    Log.debug("[reload_enum] fp=%s type=%s name=%s", fp, type, name)
 
     _header, rows, _mtime = load_enum_table(type, name)
     if not rows:
-        FreeCAD.Console.PrintWarning(f"[reload_enum] No data for {name}\n")
+        Log.warning("[reload_enum] No data for %s", name)
         return
 
     enum_values = [r[0] for r in rows]
-    print(f"[reload_enum] enum_values={enum_values}")
     current = getattr(fp, name, None)
-    print(f"[reload_enum] current={current}")
     setattr(fp, name, enum_values)
 
     # Restore previous selection if still valid
@@ -142,4 +449,4 @@ def reload_enum(fp, type, name):
     else:
         setattr(fp, name, enum_values[0])
 
-    FreeCAD.Console.PrintMessage(f"[reload_enum] {name} reloaded with {len(enum_values)} enum_values={enum_values}\n")
+    Log.debug("[reload_enum] %s reloaded with %d enum_values=%s (was %s)", name, len(enum_values), enum_values, current)
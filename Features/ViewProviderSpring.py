@@ -1,7 +1,91 @@
+from . import Log
+from . import Utils as CoreUtils
+
 try:
     import FreeCADGui
+    from pivy import coin
 except ImportError:
     FreeCADGui = None
+    coin = None
+
+# Display modes drawn from scene-graph nodes shared by all springs of the same
+# geometry (built from NumPy arrays, placed by each spring's own transform)
+# instead of each spring's tessellated shape.
+INSTANCED_MODE = "Instanced"
+CENTERLINE_MODE = "Centerline"
+SHARED_MODES = (INSTANCED_MODE, CENTERLINE_MODE)
+
+# Properties that change the geometry drawn by the shared display modes.
+GEOMETRY_PROPERTIES = {"OutsideDiameterAtFree", "WireDiameter", "Pitch", "LengthAtFree"}
+
+_SHARED = {}  # { (mode, geometry): [coin node, number of springs using it] }
+
+def _geometry(fp):
+    """Return the (radius, pitch, height, wire radius, segments per turn, segments around) drawn for ``fp``, or None."""
+
+    try:
+        radius = fp.OutsideDiameterAtFree / 2.0
+        geometry = (radius, fp.Pitch, fp.LengthAtFree, fp.WireDiameter / 2.0)
+    except AttributeError:
+        return None
+    if min(geometry) <= 0.0:
+        return None
+    return geometry + (
+        CoreUtils.preference_int("mesh_segments_per_turn", 48),
+        CoreUtils.preference_int("mesh_segments_around", 12),
+    )
+
+def _build_node(mode, geometry):
+    from . import TubeMesh
+
+    radius, pitch, height, wire_radius, segments_per_turn, segments_around = geometry
+    node = coin.SoSeparator()
+    coordinates = coin.SoCoordinate3()
+    if mode == CENTERLINE_MODE:
+        points = TubeMesh.helix_centerline(radius, pitch, height, segments_per_turn)
+        coordinates.point.setValues(0, len(points), points.tolist())
+        lines = coin.SoLineSet()
+        lines.numVertices.setValue(len(points))
+        node.addChild(coordinates)
+        node.addChild(lines)
+        return node
+
+    mesh = TubeMesh.helix_tube(radius, pitch, height, wire_radius, segments_per_turn, segments_around)
+    hints = coin.SoShapeHints()
+    hints.vertexOrdering = coin.SoShapeHints.COUNTERCLOCKWISE
+    hints.shapeType = coin.SoShapeHints.SOLID
+    hints.creaseAngle = 0.5
+    coordinates.point.setValues(0, len(mesh.vertices), mesh.vertices.tolist())
+    faces = coin.SoIndexedFaceSet()
+    indices = [i for face in mesh.faces.tolist() for i in face + [-1]]
+    faces.coordIndex.setValues(0, len(indices), indices)
+    node.addChild(hints)
+    node.addChild(coordinates)
+    node.addChild(faces)
+    return node
+
+def acquire_node(mode, geometry):
+    """Return the shared node drawing ``geometry`` in ``mode``, building it for its first user."""
+
+    key = (mode, geometry)
+    entry = _SHARED.get(key)
+    if entry is None:
+        entry = _SHARED[key] = [_build_node(mode, geometry), 0]
+    entry[1] += 1
+    return entry[0]
+
+def release_node(mode, geometry):
+    """Drop one user of a shared node; the node is freed with its last user."""
+
+    entry = _SHARED.get((mode, geometry))
+    if entry is not None:
+        entry[1] -= 1
+        if entry[1] <= 0:
+            del _SHARED[(mode, geometry)]
+
+def shared_node_count() -> int:
+    """Return the number of distinct shared nodes currently drawn."""
+    return len(_SHARED)
 
 class ViewProviderSpring:
     def __init__(self, vobj):
@@ -10,20 +94,55 @@ class ViewProviderSpring:
         vobj.Proxy = self
 
     def attach(self, vobj):
-        pass
+        self.Object = vobj.Object
+        self._slots = {}  # { mode: (material, group holding the shared node) }
+        self._drawn = None  # (mode, geometry) of the shared node in use
+        if coin is None:
+            return
+        for mode in SHARED_MODES:
+            root = coin.SoSeparator()
+            material = coin.SoMaterial()
+            slot = coin.SoGroup()
+            root.addChild(material)
+            root.addChild(slot)
+            vobj.addDisplayMode(root, mode)
+            self._slots[mode] = (material, slot)
+        self._update_color(vobj)
+
+    def _update_instance(self, vobj):
+        """Point the active shared display mode at the node of the spring's current geometry."""
+
+        mode = getattr(vobj, "DisplayMode", None)
+        geometry = _geometry(vobj.Object) if mode in self._slots else None
+        drawn = (mode, geometry) if geometry is not None else None
+        if drawn == self._drawn:
+            return
+        if self._drawn is not None:
+            self._slots[self._drawn[0]][1].removeAllChildren()
+            release_node(*self._drawn)
+        if drawn is not None:
+            self._slots[mode][1].addChild(acquire_node(mode, geometry))
+        self._drawn = drawn
+
+    def _update_color(self, vobj):
+        color = getattr(vobj, "ShapeColor", None)
+        if color is not None:
+            for material, _slot in self._slots.values():
+                material.diffuseColor.setValue(color[0], color[1], color[2])
 
     def updateData(self, fp, prop):
-        pass
+        if prop in GEOMETRY_PROPERTIES and getattr(self, "_slots", None):
+            self._update_instance(fp.ViewObject)
 
     def getDisplayModes(self, obj):
-        return ["Shaded"]
+        return ["Shaded", INSTANCED_MODE, CENTERLINE_MODE]
 
     def getDefaultDisplayMode(self):
-        return "Shaded"
+        return INSTANCED_MODE if CoreUtils.preference_bool("instanced_display", False) else "Shaded"
 
     def getDisplayValue(self, prop):
         """Return a formatted string for display in the Property Editor."""
-        FreeCAD.Console.PrintMessage(f"[ViewProviderSpring.getDisplayValue] prop={prop}\n")
+        Log.debug("[ViewProviderSpring.getDisplayValue] prop=%s", prop)
         if prop == "TorsionModulus" or prop == "ElasticModulus":
             val = getattr(self.Object, prop)
             return f"{val:.6e}"  # always scientific notation
@@ -34,7 +153,18 @@ class ViewProviderSpring:
         return mode
 
     def onChanged(self, vobj, prop):
-        pass
+        if not getattr(self, "_slots", None):
+            return
+        if prop == "DisplayMode":
+            self._update_instance(vobj)
+        elif prop == "ShapeColor":
+            self._update_color(vobj)
+
+    def onDelete(self, vobj, subelements):
+        if getattr(self, "_drawn", None) is not None:
+            release_node(*self._drawn)
+            self._drawn = None
+        return True
 
     def __getstate__(self):
         return None
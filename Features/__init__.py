@@ -1,11 +1,27 @@
-"""Spring feature modules exposed for convenient imports."""
+"""Spring feature modules exposed for convenient imports.
 
-from .Compression import Spring as CompressionSpring
-from .Extension import Spring as ExtensionSpring
-from .Torsion import Spring as TorsionSpring
+The feature modules import FreeCAD, so they are loaded on first access; the
+headless modules (``State``, ``Enums`` and each type's ``Model``) can be
+imported in plain Python processes.
+"""
+
+import importlib
+
+_LAZY = {
+    "CompressionSpring": ".Compression.Spring",
+    "ExtensionSpring": ".Extension.Spring",
+    "TorsionSpring": ".Torsion.Spring",
+}
 
 __all__ = [
     "CompressionSpring",
     "ExtensionSpring",
     "TorsionSpring",
-]
\ No newline at end of file
+]
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module(_LAZY[name], __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -22,6 +22,12 @@ class SpringWorkbench(Gui.Workbench):
             CreateExtensionSpring,
             CreateTorsionSpring,
             DisplaySpringInfo,
+            BuildFullShapes,
+            SearchSpring,
+            FindCatalogMatches,
+            ProfilingStats,
+            ImportSprings,
+            ExportSpringMeshes,
         )
         from Spring.Preferences.SpringPreferencePage import SpringPreferencePage
 
@@ -30,6 +36,12 @@ class SpringWorkbench(Gui.Workbench):
         CreateExtensionSpring.register()
         CreateTorsionSpring.register()
         DisplaySpringInfo.register()
+        BuildFullShapes.register()
+        SearchSpring.register()
+        FindCatalogMatches.register()
+        ProfilingStats.register()
+        ImportSprings.register()
+        ExportSpringMeshes.register()
 
         # Build toolbar/menu
         self.list = [
@@ -37,6 +49,12 @@ class SpringWorkbench(Gui.Workbench):
             "Spring_CreateExtensionSpring",
             "Spring_CreateTorsionSpring",
             "Spring_DisplaySpringInfo",
+            "Spring_BuildFullShapes",
+            "Spring_SearchSpring",
+            "Spring_FindCatalogMatches",
+            "Spring_ProfilingStats",
+            "Spring_ImportSprings",
+            "Spring_ExportSpringMeshes",
         ]
         self.appendToolbar("Spring", self.list)
         self.appendMenu("Spring", self.list)
@@ -1,6 +1,8 @@
 import FreeCAD, FreeCADGui
 from PySide2 import QtWidgets
 
+from Spring.Features import GeometryCache, Log, Profiling
+
 class SpringPreferencePage:
     PARAM_PATH = "User parameter:BaseApp/Preferences/Mod/Spring"
 
@@ -9,6 +11,15 @@ class SpringPreferencePage:
         ("maxit", "Maximum iterations", 600),
         ("weapon", "Weapon selection", 1),
         ("nmerit", "Merit function", 1),
+        ("search_starts", "Search starting points", 1),
+        ("search_workers", "Search worker processes (0 = all CPUs)", 0),
+        ("catalog_matches", "Catalog matches listed", 5),
+        ("log_level", "Log level (0 error, 1 warning, 2 info, 3 debug)", 1),
+        ("geometry_cache_memory_mb", "Geometry cache memory (MB)", 64),
+        ("geometry_cache_disk_mb", "Geometry cache disk (MB)", 256),
+        ("preview_idle_ms", "Build full shape after idle (ms)", 1500),
+        ("mesh_segments_per_turn", "Mesh segments per coil turn", 48),
+        ("mesh_segments_around", "Mesh segments around the wire", 12),
     )
 
     FLOAT_PREFERENCES = (
@@ -29,6 +40,15 @@ class SpringPreferencePage:
         ("show_violations", "Show violations", True),
         ("enable_auto_fix", "Enable auto fix", True),
         ("enable_auto_search", "Enable auto search", True),
+        ("geometry_cache", "Cache spring geometry", True),
+        ("preview_while_editing", "Preview shapes while editing", False),
+        ("preview_envelope", "Preview as envelope tube", False),
+        ("profiling", "Profile recomputes", False),
+        ("instanced_display", "Display new springs as shared instances", False),
+    )
+
+    STRING_PREFERENCES = (
+        ("catalog_dir", "Stock catalog directory", ""),
     )
 
     def __init__(self):
@@ -37,6 +57,7 @@ class SpringPreferencePage:
         self._int_controls = {}
         self._float_controls = {}
         self._bool_controls = {}
+        self._string_controls = {}
 
         for key, label, default in self.INTEGER_PREFERENCES:
             spin = QtWidgets.QSpinBox()
@@ -59,6 +80,12 @@ class SpringPreferencePage:
             self._bool_controls[key] = checkbox
             layout.addRow(f"{label}:", checkbox)
 
+        for key, label, default in self.STRING_PREFERENCES:
+            edit = QtWidgets.QLineEdit()
+            edit.setText(default)
+            self._string_controls[key] = edit
+            layout.addRow(f"{label}:", edit)
+
     def saveSettings(self):
         params = FreeCAD.ParamGet(self.PARAM_PATH)
         for key, _, default in self.INTEGER_PREFERENCES:
@@ -67,6 +94,11 @@ class SpringPreferencePage:
             params.SetFloat(key, self._float_controls[key].value())
         for key, _, default in self.BOOLEAN_PREFERENCES:
             params.SetBool(key, self._bool_controls[key].isChecked())
+        for key, _, default in self.STRING_PREFERENCES:
+            params.SetString(key, self._string_controls[key].text())
+        GeometryCache.reset_shared_cache()
+        Log.refresh()
+        Profiling.refresh()
 
     def loadSettings(self):
         params = FreeCAD.ParamGet(self.PARAM_PATH)
@@ -76,5 +108,7 @@ class SpringPreferencePage:
             self._float_controls[key].setValue(params.GetFloat(key, default))
         for key, _, default in self.BOOLEAN_PREFERENCES:
             self._bool_controls[key].setChecked(params.GetBool(key, default))
+        for key, _, default in self.STRING_PREFERENCES:
+            self._string_controls[key].setText(params.GetString(key, default))
 
 FreeCADGui.addPreferencePage(SpringPreferencePage, "Spring")
@@ -0,0 +1,364 @@
+"""Benchmarks for the Spring workbench calculations, enum loading and geometry.
+
+Run with a plain Python interpreter (calculation and enum benchmarks run
+against a minimal FreeCAD stand-in) or with ``freecadcmd`` (adds the
+``helix_solid`` and ``coil_solid`` geometry benchmarks):
+
+    python Tests/bench_Springs.py                      # print timings
+    python Tests/bench_Springs.py --save baseline.json  # record a baseline
+    python Tests/bench_Springs.py --baseline baseline.json --tolerance 0.25
+
+With ``--baseline`` the exit status is 1 if any benchmark's median time per
+call is more than ``tolerance`` slower than the baseline.
+"""
+
+import argparse, importlib.util, json, os, statistics, sys, tempfile, time, types
+from types import SimpleNamespace
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# -----------------------------------------------------------------------------
+# Environment
+# -----------------------------------------------------------------------------
+def _install_freecad_stand_in():
+    """Register minimal FreeCAD and Part modules when the real ones are missing.
+
+    Returns True if the stand-in is used.  It provides just enough for the
+    calculation modules to import: a silent console, preferences that always
+    return their defaults and the user directories.
+    """
+    try:
+        import FreeCAD  # noqa: F401
+        return False
+    except ImportError:
+        pass
+
+    class _Params:
+        def GetInt(self, name, default=0):
+            return default
+
+        def GetFloat(self, name, default=0.0):
+            return default
+
+        def GetBool(self, name, default=False):
+            return default
+
+        def GetString(self, name, default=""):
+            return default
+
+    freecad = types.ModuleType("FreeCAD")
+    freecad.GuiUp = False
+    freecad.Console = SimpleNamespace(
+        PrintMessage=lambda text: None,
+        PrintLog=lambda text: None,
+        PrintWarning=lambda text: sys.stderr.write(text),
+        PrintError=lambda text: sys.stderr.write(text),
+    )
+    freecad.ParamGet = lambda path: _Params()
+    freecad.getUserCachePath = tempfile.gettempdir
+    freecad.getUserAppDataDir = tempfile.gettempdir
+    freecad.STAND_IN = True
+    part = types.ModuleType("Part")
+    part.Shape = type("Shape", (), {})  # only referenced in annotations
+    sys.modules["FreeCAD"] = freecad
+    sys.modules["Part"] = part
+    return True
+
+def _import_spring_package():
+    """Make the repository importable as the ``Spring`` package."""
+
+    if "Spring" in sys.modules:
+        return
+    try:
+        import Spring  # installed in FreeCAD's Mod directory
+        if os.path.samefile(os.path.dirname(Spring.__file__), REPO_DIR):
+            return
+    except (ImportError, TypeError, OSError):
+        pass
+    spec = importlib.util.spec_from_file_location(
+        "Spring", os.path.join(REPO_DIR, "__init__.py"), submodule_search_locations=[REPO_DIR]
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["Spring"] = module
+    spec.loader.exec_module(module)
+
+STAND_IN = _install_freecad_stand_in()
+_import_spring_package()
+
+from Spring.Features import Enums, Log, Profiling  # noqa: E402
+from Spring.Features.Compression import Model as CompressionModel  # noqa: E402
+from Spring.Features.Extension import Model as ExtensionModel  # noqa: E402
+from Spring.Features.Torsion import Model as TorsionModel  # noqa: E402
+
+Log.set_level(Log.WARNING)
+Profiling.set_enabled(False)
+
+# -----------------------------------------------------------------------------
+# Benchmarks
+# -----------------------------------------------------------------------------
+BENCHMARKS = []  # [(name, setup)], setup() returns the function to time
+
+def benchmark(name):
+    def register(setup):
+        BENCHMARKS.append((name, setup))
+        return setup
+    return register
+
+def _design_grid(count):
+    """Return ``count`` deterministic (OD, wire diameter, free length, coils) designs."""
+
+    return [
+        (20.0 + (i % 17), 1.5 + 0.1 * (i % 13), 40.0 + (i % 23), 6.0 + (i % 11))
+        for i in range(count)
+    ]
+
+def _scalar_update_properties(model, state_class):
+    designs = _design_grid(100)
+
+    def run():
+        for od, d, lf, nt in designs:
+            state = state_class(OutsideDiameterAtFree=od, WireDiameter=d, LengthAtFree=lf, CoilsTotal=nt)
+            model.update_properties(state)
+    return run
+
+@benchmark("compression.update_properties x100")
+def _():
+    state = CompressionModel.CompressionState()
+    CompressionModel.update_globals(state)
+    designs = _design_grid(100)
+
+    def run():
+        for od, d, lf, nt in designs:
+            state.OutsideDiameterAtFree, state.WireDiameter, state.LengthAtFree, state.CoilsTotal = od, d, lf, nt
+            CompressionModel.update_properties(state)
+    return run
+
+@benchmark("compression.update x100")
+def _():
+    state = CompressionModel.CompressionState()
+    designs = _design_grid(100)
+
+    def run():
+        for od, d, lf, nt in designs:
+            state.OutsideDiameterAtFree, state.WireDiameter, state.LengthAtFree, state.CoilsTotal = od, d, lf, nt
+            CompressionModel.update(state)
+    return run
+
+@benchmark("compression.update_changed(ForceAtDeflection2) x100")
+def _():
+    state = CompressionModel.CompressionState()
+    CompressionModel.update(state)
+
+    def run():
+        for i in range(100):
+            state.ForceAtDeflection2 = 150.0 + i
+            CompressionModel.update_changed(state, {"ForceAtDeflection2"})
+    return run
+
+@benchmark("extension.update_properties x100")
+def _():
+    return _scalar_update_properties(ExtensionModel, ExtensionModel.ExtensionState)
+
+@benchmark("torsion.update_properties x100")
+def _():
+    return _scalar_update_properties(TorsionModel, TorsionModel.TorsionState)
+
+@benchmark("compression.adapter_update(obj) x100")
+def _():
+    from Spring.Features.Compression import Utils as CompressionUtils
+    obj = SimpleNamespace(**CompressionModel.CompressionState().as_dict())
+    designs = _design_grid(100)
+
+    def run():
+        for od, d, lf, nt in designs:
+            obj.OutsideDiameterAtFree, obj.WireDiameter, obj.LengthAtFree, obj.CoilsTotal = od, d, lf, nt
+            CompressionUtils.update(obj)
+    return run
+
+@benchmark("compression.batch_evaluate 10000")
+def _():
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    from Spring.Features.Compression import Batch
+    designs = np.array(_design_grid(10000)).T
+
+    def run():
+        Batch.evaluate(designs[0], designs[1], designs[2], designs[3], 50.0, 190.0, end_type_index=3)
+    return run
+
+@benchmark("compression.batch_jacobian 10000")
+def _():
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    from Spring.Features.Compression import Batch
+    designs = np.array(_design_grid(10000)).T
+
+    def run():
+        Batch.jacobian(designs[0], designs[1], designs[2], designs[3], 50.0, 190.0, end_type_index=3)
+    return run
+
+@benchmark("enums.load_enum_table cold x9")
+def _():
+    tables = [(t, n) for t in ("Compression", "Extension", "Torsion") for n in ("EndType", "LifeCategory", "PropCalcMethod")]
+
+    def run():
+        Enums.clear_enum_cache()
+        for type, name in tables:
+            Enums.load_enum_table(type, name)
+    return run
+
+@benchmark("enums.load_enum_table warm x9")
+def _():
+    tables = [(t, n) for t in ("Compression", "Extension", "Torsion") for n in ("EndType", "LifeCategory", "PropCalcMethod")]
+    for type, name in tables:
+        Enums.load_enum_table(type, name)
+
+    def run():
+        for type, name in tables:
+            Enums.load_enum_table(type, name)
+    return run
+
+@benchmark("enums.enum_index x1000")
+def _():
+    def run():
+        for _ in range(1000):
+            Enums.enum_index("Compression", "EndType", "Closed&Ground")
+    return run
+
+def _helix_grid():
+    return [
+        (radius, pitch, 10.0 * pitch, wire_radius)
+        for radius in (8.0, 14.0, 20.0)
+        for pitch in (3.0, 5.0)
+        for wire_radius in (0.8, 1.4)
+    ]
+
+@benchmark("geometry.helix_solid uncached grid x12")
+def _():
+    if STAND_IN:
+        return None
+    from Spring.Features import Utils as CoreUtils
+    grid = _helix_grid()
+
+    def run():
+        for params in grid:
+            CoreUtils._build_helix_solid(*params)
+    return run
+
+@benchmark("geometry.helix_solid cached grid x12")
+def _():
+    if STAND_IN:
+        return None
+    from Spring.Features import GeometryCache
+    cache = GeometryCache.GeometryCache(256 * 1024 * 1024)
+    from Spring.Features import Utils as CoreUtils
+    grid = _helix_grid()
+    for params in grid:
+        cache.get_or_build(GeometryCache.cache_key("helix_solid", *params), lambda: CoreUtils._build_helix_solid(*params))
+
+    def run():
+        for params in grid:
+            cache.get_or_build(GeometryCache.cache_key("helix_solid", *params), lambda: CoreUtils._build_helix_solid(*params))
+    return run
+
+@benchmark("geometry.coil_solid closed&ground grid x12")
+def _():
+    if STAND_IN:
+        return None
+    from Spring.Features import Utils as CoreUtils
+    grid = _helix_grid()
+
+    def run():
+        for params in grid:
+            CoreUtils._build_coil_solid(*params, 1.0, True)
+    return run
+
+# -----------------------------------------------------------------------------
+# Runner
+# -----------------------------------------------------------------------------
+def measure(run, repeat, min_time):
+    """Return per-call times of ``repeat`` rounds, each lasting at least ``min_time`` seconds."""
+
+    run()  # warm-up
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            run()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or number >= 1 << 20:
+            break
+        number *= 2
+    times = [elapsed / number]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            run()
+        times.append((time.perf_counter() - start) / number)
+    return times
+
+def run_benchmarks(pattern="", repeat=5, min_time=0.2):
+    """Run the benchmarks whose name contains ``pattern``; return {name: result}."""
+
+    results = {}
+    for name, setup in BENCHMARKS:
+        if pattern not in name:
+            continue
+        try:
+            run = setup()
+        except ImportError as e:
+            print(f"{name:55s} skipped ({e})")
+            continue
+        if run is None:
+            print(f"{name:55s} skipped (needs {'FreeCAD/Part' if 'geometry' in name else 'numpy'})")
+            continue
+        times = measure(run, repeat, min_time)
+        results[name] = {"median": statistics.median(times), "min": min(times), "repeat": repeat}
+        print(f"{name:55s} {1e6 * results[name]['median']:12.1f} us  (min {1e6 * results[name]['min']:.1f} us)")
+    return results
+
+def compare(results, baseline, tolerance):
+    """Print the change against ``baseline``; return the names that regressed."""
+
+    regressions = []
+    for name, result in results.items():
+        reference = baseline.get(name)
+        if not reference:
+            continue
+        ratio = result["median"] / reference["median"]
+        flag = "REGRESSION" if ratio > 1.0 + tolerance else ""
+        print(f"{name:55s} {ratio:6.2f}x baseline {flag}")
+        if flag:
+            regressions.append(name)
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-k", "--filter", default="", help="only run benchmarks whose name contains this text")
+    parser.add_argument("--repeat", type=int, default=5, help="timed rounds per benchmark")
+    parser.add_argument("--min-time", type=float, default=0.2, help="minimum seconds per round")
+    parser.add_argument("--save", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare against the results in this JSON file")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed slowdown against the baseline")
+    args = parser.parse_args(argv)
+
+    print(f"Spring benchmarks ({'FreeCAD stand-in' if STAND_IN else 'FreeCAD'}, Python {sys.version.split()[0]})")
+    results = run_benchmarks(args.filter, args.repeat, args.min_time)
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        if regressions:
+            print(f"❌ {len(regressions)} benchmark(s) regressed by more than {100 * args.tolerance:.0f} %")
+            return 1
+        print("✅ No regressions")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
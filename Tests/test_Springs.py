@@ -1,8 +1,13 @@
-import FreeCAD, Part, unittest, math, os, tempfile
+import FreeCAD, Part, unittest, math, os, tempfile, csv, json
 from types import SimpleNamespace
 
 from Spring.Features.Compression import Spring as CompressionSpring
 from Spring.Features.Compression import Utils as CompressionUtils
+from Spring.Features.Compression import Batch as CompressionBatch
+from Spring.Features.Compression import Model as CompressionModel
+from Spring.Features import BulkImport, Catalog, CycleLife, Enums, Export, GeometryCache, MassProperties, Materials, Preview, Profiling, Search, TubeMesh
+from Spring.Features import Utils as CoreUtils
+from Spring.Features import ViewProviderSpring
 from Spring.Features.Extension import Spring as ExtensionSpring
 from Spring.Features.Extension import Utils as ExtensionUtils
 from Spring.Features.Torsion import Spring as TorsionSpring
@@ -187,5 +192,625 @@ class TestSpring(unittest.TestCase):
                     "LengthAtFree": h
                 })
 
+    def test_compression_batch_matches_scalar(self):
+        """The vectorized evaluator must agree with update_properties."""
+        springs = []
+        for d, w, lf in [(20.0, 2.0, 40.0), (28.0, 2.8, 80.0), (35.0, 3.5, 120.0)]:
+            spring = CompressionSpring.make()
+            spring.OutsideDiameterAtFree = d
+            spring.WireDiameter = w
+            spring.LengthAtFree = lf
+            springs.append(spring)
+        self.doc.recompute()
+
+        results = CompressionBatch.evaluate(
+            [s.OutsideDiameterAtFree for s in springs],
+            [s.WireDiameter for s in springs],
+            [s.LengthAtFree for s in springs],
+            [s.CoilsTotal for s in springs],
+            [s.ForceAtDeflection1 for s in springs],
+            [s.ForceAtDeflection2 for s in springs],
+            coils_inactive=[s.CoilsInactive for s in springs],
+            add_coils_at_solid=[s.AddCoilsAtSolid for s in springs],
+        )
+        for i, spring in enumerate(springs):
+            for name in ("Rate", "Deflection2", "StressAtSolid", "FactorOfSafetyAtDeflection2", "Weight", "PercentAvailableDeflection", "CycleLife"):
+                self.assertAlmostEqual(results[name][i], getattr(spring, name), places=6, msg=name)
+
+    def test_compression_state_matches_object(self):
+        """The headless model must reproduce the feature's computed properties."""
+        spring = CompressionSpring.make()
+        spring.EndType = "Closed"
+        self.doc.recompute()
+
+        state = CompressionModel.CompressionState.from_object(spring)
+        for name in CompressionModel.DEPENDENT:
+            setattr(state, name, 0.0)
+        CompressionModel.update(state)
+        for name in CompressionModel.DEPENDENT:
+            self.assertAlmostEqual(getattr(state, name), getattr(spring, name), places=9, msg=name)
+
+    def test_geometry_cache_reuses_helix_solid(self):
+        """A repeated helix_solid call must be served from the cache."""
+        cache = GeometryCache.GeometryCache(16 * 1024 * 1024)
+        key = GeometryCache.cache_key("helix_solid", 10.0, 2.5, 25.0, 1.0)
+        first = cache.get_or_build(key, lambda: CoreUtils._build_helix_solid(10.0, 2.5, 25.0, 1.0))
+        second = cache.get_or_build(key, lambda: self.fail("shape was rebuilt"))
+        self.assertEqual(cache.stats()["misses"], 1)
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertAlmostEqual(first.Volume, second.Volume, places=6)
+
+    def test_geometry_cache_failed_disk_write_leaves_no_temp_file(self):
+        """A disk write that fails after creating its temporary file removes it."""
+        directory = tempfile.mkdtemp()
+        cache = GeometryCache.GeometryCache(16 * 1024 * 1024, directory, 16 * 1024 * 1024)
+        key = GeometryCache.cache_key("box", 1.0)
+        os.makedirs(os.path.join(cache._path(key), "blocker"))  # os.replace onto a non-empty directory fails
+        cache.put(key, Part.makeBox(1.0, 1.0, 1.0))
+        self.assertFalse([name for name in os.listdir(directory) if name.endswith(".tmp")])
+        self.assertEqual(cache.stats()["disk_bytes"], 0)
+
+    def test_compression_incremental_update(self):
+        """Changing a force recomputes only its downstream properties."""
+        affected = set()
+        for index in CompressionModel.GRAPH.plan({"ForceAtDeflection2"}):
+            affected.update(CompressionModel.GRAPH.nodes[index].outputs)
+        self.assertIn("StressAtDeflection2", affected)
+        self.assertNotIn("Pitch", affected)
+        self.assertNotIn("Weight", affected)
+
+        spring = CompressionSpring.make()
+        spring.ForceAtDeflection2 = 150.0
+        self.doc.recompute()
+        state = CompressionModel.CompressionState.from_object(spring)
+        CompressionModel.update(state)
+        for name in CompressionModel.DEPENDENT:
+            self.assertAlmostEqual(getattr(state, name), getattr(spring, name), places=9, msg=name)
+
+    def test_shape_kept_when_only_forces_change(self):
+        """Analytic-only edits must not rebuild the swept shape."""
+        spring = CompressionSpring.make()
+        self.doc.recompute()
+        signature = spring.ShapeSignature
+        shape = spring.Shape
+
+        spring.ForceAtDeflection2 = 150.0
+        self.doc.recompute()
+        self.assertEqual(spring.ShapeSignature, signature)
+        self.assertTrue(spring.Shape.isSame(shape))
+
+        spring.LengthAtFree = 90.0
+        self.doc.recompute()
+        self.assertNotEqual(spring.ShapeSignature, signature)
+
+    def test_compression_search_reaches_feasible_design(self):
+        """The pattern search turns the infeasible default spring into a feasible one."""
+        state = CompressionModel.CompressionState()
+        CompressionModel.update(state)
+        problem = CompressionModel.search_problem(state)
+        result = Search.search(problem, Search.SearchOptions())
+        self.assertTrue(result.feasible, result.termination)
+        self.assertEqual(result.termination, "objmin")
+        self.assertGreaterEqual(result.state.FactorOfSafetyAtSolid, 0.99)
+        self.assertEqual(set(result.x), set(CompressionModel.SEARCH_FREE))
+
+    def test_compression_multistart_is_deterministic(self):
+        """Multi-start search returns the same ranked feasible designs for the same seed."""
+        state = CompressionModel.CompressionState()
+        problem = CompressionModel.search_problem(state)
+        first = Search.multistart(problem, 6, seed=7, workers=1)
+        second = Search.multistart(problem, 6, seed=7, workers=1)
+        self.assertTrue(first)
+        self.assertEqual([r.x for r in first], [r.x for r in second])
+        self.assertTrue(all(r.feasible for r in first))
+        weights = [r.state.Weight for r in first]
+        self.assertEqual(weights, sorted(weights))
+
+    def test_compression_multistart_worker_processes(self):
+        """Searches in spawned worker processes rank the same designs as in-process ones."""
+        problem = CompressionModel.search_problem(CompressionModel.CompressionState())
+        if Search.python_interpreter() is None:
+            self.skipTest("no Python interpreter to start workers with")
+        serial = Search.multistart(problem, 4, seed=3, workers=1)
+        parallel = Search.multistart(problem, 4, seed=3, workers=2)
+        self.assertTrue(parallel)
+        self.assertEqual([r.x for r in parallel], [r.x for r in serial])
+
+    def test_catalog_nearest_match(self):
+        """Catalog queries return the nearest entries that carry the load and apply them."""
+        with tempfile.TemporaryDirectory() as tmp:
+            with open(os.path.join(tmp, "stock.csv"), "w") as f:
+                f.write("Number,OutsideDiameterAtFree,WireDiameter,LengthAtFree,Rate,LengthAtSolid,CoilsTotal\n")
+                f.write("S-1,30.0,4.0,60.0,10.0,40.0,10\n")  # close, but goes solid under 300 N
+                f.write("S-2,32.0,4.0,62.0,12.0,20.0,9\n")
+                f.write("S-3,80.0,8.0,200.0,50.0,60.0,12\n")
+            matches = Catalog.directory_index(tmp).nearest(31.5, 3.9375, 60.0, 11.0, k=2, force=300.0)
+            self.assertEqual([m.number for m in matches], ["S-2", "S-3"])
+
+            spring = CompressionSpring.make()
+            CompressionUtils.apply_catalog_match(spring, matches[0])
+            self.doc.recompute()
+            self.assertEqual((spring.CatalogName, spring.CatalogNumber), ("stock", "S-2"))
+            self.assertAlmostEqual(spring.LengthAtFree, 62.0)
+            Catalog.clear_index_cache()
+
+    def test_catalog_without_files_is_empty(self):
+        """A missing or empty catalog directory gives an empty index and no matches."""
+        with tempfile.TemporaryDirectory() as tmp:
+            for directory in (tmp, os.path.join(tmp, "missing")):
+                index = Catalog.directory_index(directory)
+                self.assertEqual(len(index), 0)
+                self.assertEqual(index.nearest(31.5, 3.9375, 60.0, 11.0, k=2, force=300.0), [])
+            Catalog.clear_index_cache()
+
+    def test_material_table_drives_globals(self):
+        """MaterialType is an enumeration of the material table, which supplies the globals."""
+        materials = Materials.load_materials()
+        self.assertIs(Materials.load_materials(), materials)  # parsed once
+        spring = CompressionSpring.make()
+        self.doc.recompute()
+        self.assertEqual(spring.getEnumerationsOfProperty("MaterialType"), list(materials.names))
+        self.assertEqual(spring.MaterialType, "MUSIC_WIRE")
+        self.assertAlmostEqual(spring.TorsionModulus, materials.value("MUSIC_WIRE", "gg") * 1.0e9)
+        self.assertAlmostEqual(spring.Density, materials.value("MUSIC_WIRE", "Density"))
+
+        constants = CompressionBatch.material_constants(["MUSIC_WIRE"] * 3, [1, 3, 7])
+        self.assertEqual(list(constants["percent_tensile_endurance"]), [
+            materials.value("MUSIC_WIRE", "pte1"), materials.value("MUSIC_WIRE", "pte3"), materials.value("MUSIC_WIRE", "pte7"),
+        ])
+
+    def test_material_table_checks_are_throttled(self):
+        """The table file is re-checked at most every VALIDATE_INTERVAL, and restores only touch changed enumerations."""
+        path = os.path.join(tempfile.mkdtemp(), "MaterialType.json")
+        with open(Materials.table_path()) as f:
+            data = json.load(f)
+        with open(path, "w") as f:
+            json.dump(data, f)
+        table = Materials.load_materials(path)
+        with open(path, "w") as f:
+            json.dump(data[:2], f)
+        os.utime(path, (table.mtime + 10.0, table.mtime + 10.0))
+        self.assertIs(Materials.load_materials(path), table)  # within the interval
+        table.checked -= Materials.VALIDATE_INTERVAL
+        self.assertEqual(len(Materials.load_materials(path)), 1)
+
+        spring = CompressionSpring.make()
+        spring.MaterialType = spring.getEnumerationsOfProperty("MaterialType")[-1]
+        self.doc.recompute()
+        CompressionUtils.reload_material_enum(spring)
+        self.assertNotIn("Touched", spring.State)
+        self.assertEqual(spring.MaterialType, spring.getEnumerationsOfProperty("MaterialType")[-1])
+
+    def test_enum_registry_keyed_by_type(self):
+        """Tables of the same name for different spring types must not collide."""
+        Enums.clear_enum_cache()
+        compression = Enums.enum_table("Compression", "EndType")
+        extension = Enums.enum_table("Extension", "EndType")
+        self.assertIn("AddCoilsAtSolid", compression.columns)
+        self.assertNotIn("AddCoilsAtSolid", extension.columns)
+        self.assertEqual(Enums.load_enum_table("Compression", "EndType")[0], compression.header)
+        self.assertEqual(Enums.enum_index("Compression", "EndType", "Closed"), 3)
+        self.assertEqual(compression.value(3, "CoilsInactive"), 2.0)
+        self.assertEqual(Enums.enum_index("Compression", "EndType", "No such end"), 0)
+
+    def test_profiling_records_recompute_phases(self):
+        """With profiling on, recomputes record per-object and per-type phase timings."""
+        Profiling.set_enabled(True)
+        Profiling.reset()
+        try:
+            spring = CompressionSpring.make()
+            self.doc.recompute()
+            spring.ForceAtDeflection2 = 150.0
+            self.doc.recompute()
+            ExtensionSpring.make()
+            TorsionSpring.make()
+            self.doc.recompute()
+            rows = Profiling.rows()
+        finally:
+            Profiling.set_enabled(False)
+            Profiling.reset()
+        key = f"{self.doc.Name}/{spring.Name}"
+        phases = {row["phase"]: row for row in rows if row["scope"] == "object" and row["key"] == key}
+        self.assertEqual(phases["recompute"]["calls"], 2)
+        self.assertIn("update_properties", phases)
+        types = {row["key"] for row in rows if row["scope"] == "type" and row["phase"] == "recompute"}
+        self.assertEqual(types, {"CompressionSpring", "ExtensionSpring", "TorsionSpring"})
+
+    def test_cycle_life_interpolates_sn_table(self):
+        """Cycle life follows the S-N points and the array path matches the scalar one."""
+        pte = [Materials.load_materials().value("MUSIC_WIRE", c) for c in ("pte4", "pte3", "pte2", "pte1")]
+        tensile = 1500.0
+        for percent, log_cycles in zip(pte, CycleLife.LOG_CYCLES):
+            # With no minimum stress the equivalent stress is the maximum stress.
+            life = CycleLife.cycle_life("MUSIC_WIRE", 2, tensile, 0.0, 0.01 * percent * tensile)
+            self.assertAlmostEqual(math.log10(life), log_cycles, places=9)
+
+        stress1 = [0.0, 150.0, 300.0, 450.0]
+        stress2 = [400.0, 550.0, 700.0, 850.0]
+        lives = CycleLife.cycle_life_array("MUSIC_WIRE", [[2], [7]], tensile, stress1, stress2)
+        for row, life_category_index in enumerate((2, 7)):
+            for i in range(len(stress1)):
+                expected = CycleLife.cycle_life("MUSIC_WIRE", life_category_index, tensile, stress1[i], stress2[i])
+                self.assertAlmostEqual(lives[row, i] / expected, 1.0, places=9)
+        self.assertEqual(CycleLife.cycle_life("MUSIC_WIRE", 0, tensile, 0.0, 400.0), 0.0)
+
+        spring = CompressionSpring.make()
+        self.doc.recompute()
+        self.assertGreater(spring.CycleLife, 0.0)
+
+    def test_bulk_import_recomputes_once(self):
+        """Imported springs are created with deferred updates and computed by one recompute."""
+        path = os.path.join(tempfile.mkdtemp(), "springs.csv")
+        with open(path, "w") as f:
+            f.write("SpringType,Label,OutsideDiameterAtFree,WireDiameter,EndType\n")
+            f.write("Compression,C1,20,2,Closed\n")
+            f.write("Compression,C2,30,3,\n")
+            f.write("Extension,E1,20,2,\n")
+        springs = BulkImport.import_springs(path, self.doc)
+        self.assertEqual([s.Label for s in springs], ["C1", "C2", "E1"])
+        self.assertEqual(springs[0].EndType, "Closed")
+        self.assertAlmostEqual(springs[0].CoilsInactive, 2.0)
+        self.assertAlmostEqual(springs[1].MeanDiameterAtFree, 27.0)
+        self.assertGreater(springs[2].Rate, 0.0)
+        self.assertFalse(any("Invalid" in s.State for s in springs))
+
+        count = len(self.doc.Objects)
+        with self.assertRaises(ValueError):
+            BulkImport.import_springs([{"OutsideDiameterAtFree": 20.0}, {"NoSuchProperty": 1.0}], self.doc)
+        self.assertEqual(len(self.doc.Objects), count)
+
+        nulls = BulkImport.import_springs([{"SpringType": "Torsion", "WireDiameter": None, "CoilsTotal": 8}], self.doc)
+        self.assertAlmostEqual(nulls[0].WireDiameter, 2.0)  # the default
+        self.assertAlmostEqual(nulls[0].CoilsTotal, 8.0)
+        count = len(self.doc.Objects)
+        with self.assertRaises(ValueError):
+            BulkImport.import_springs([{"WireDiameter": [2.0]}], self.doc)
+        self.assertEqual(len(self.doc.Objects), count)
+
+    def test_user_specified_end_type_keeps_entered_coils(self):
+        """Table end types set the inactive coils read-only; User_Specified keeps the entered values editable."""
+        spring = CompressionSpring.make()
+        spring.EndType = "Closed"
+        self.doc.recompute()
+        self.assertAlmostEqual(spring.CoilsInactive, 2.0)
+        self.assertIn("ReadOnly", spring.getEditorMode("CoilsInactive"))
+
+        spring.EndType = "User_Specified"
+        spring.CoilsInactive = 3.5
+        spring.AddCoilsAtSolid = 0.25
+        self.doc.recompute()
+        self.assertNotIn("ReadOnly", spring.getEditorMode("CoilsInactive"))
+        self.assertNotIn("ReadOnly", spring.getEditorMode("AddCoilsAtSolid"))
+        self.assertAlmostEqual(spring.CoilsInactive, 3.5)
+        self.assertAlmostEqual(spring.AddCoilsAtSolid, 0.25)
+        self.assertAlmostEqual(spring.CoilsActive, spring.CoilsTotal - 3.5)
+
+    def test_preview_detail_and_full_build(self):
+        """ShapeDetail=Preview assigns the lightweight shape, and build_full_shapes replaces it with the swept solid."""
+        spring = CompressionSpring.make()
+        spring.EndType = "Open"
+        spring.ShapeDetail = "Preview"
+        self.doc.recompute()
+        args = (spring.OutsideDiameterAtFree / 2.0, spring.Pitch, spring.LengthAtFree, spring.WireDiameter / 2.0)
+        preview = CoreUtils.helix_preview(*args, CoreUtils.preference_bool("preview_envelope", False))
+        solid = CoreUtils.helix_solid(*args)
+        self.assertTrue(spring.ShapeIsPreview)
+        self.assertEqual(len(spring.Shape.Faces), len(preview.Faces))
+        self.assertAlmostEqual(spring.Shape.Volume, preview.Volume, places=3)
+        self.assertNotAlmostEqual(spring.Shape.Volume, solid.Volume, places=3)
+
+        self.assertEqual(Preview.build_full_shapes([spring]), 1)
+        self.assertFalse(spring.ShapeIsPreview)
+        self.assertEqual(len(spring.Shape.Solids), 1)
+        self.assertAlmostEqual(spring.Shape.Volume, solid.Volume, places=3)
+        self.assertEqual(Preview.build_full_shapes([spring]), 0)  # already full
+
+        spring.ShapeDetail = "Full"
+        spring.LengthAtFree = 30.0
+        self.doc.recompute()
+        self.assertFalse(spring.ShapeIsPreview)
+        self.assertEqual(len(spring.Shape.Solids), 1)
+        spring.ShapeDetail = "Preview"
+        self.doc.recompute()
+        self.assertTrue(spring.ShapeIsPreview)
+
+    def test_spring_batch_defers_updates(self):
+        """Edits inside spring_batch() are applied by a single update on exit."""
+        spring = CompressionSpring.make()
+        with CoreUtils.spring_batch(spring):
+            spring.OutsideDiameterAtFree = 20.0
+            spring.WireDiameter = 2.0
+            spring.EndType = "Closed"
+            self.doc.recompute()
+            self.assertAlmostEqual(spring.MeanDiameterAtFree, 25.2)  # still the defaults
+        self.assertAlmostEqual(spring.MeanDiameterAtFree, 18.0)
+        self.assertAlmostEqual(spring.CoilsInactive, 2.0)
+        self.assertNotIn("Touched", spring.State)
+
+        other = CompressionSpring.make()
+        with CoreUtils.spring_batch(self.doc):
+            spring.LengthAtFree = 60.0
+            other.LengthAtFree = 70.0
+        self.assertAlmostEqual(spring.LengthAtFree - spring.LengthAtDeflection2, spring.Deflection2)
+        self.assertAlmostEqual(other.Slenderness, 70.0 / other.MeanDiameterAtFree)
+
+    def test_spring_batch_covers_every_spring_type(self):
+        """A document batch updates extension and torsion springs, with or without compression springs."""
+        extension = ExtensionSpring.make()
+        torsion = TorsionSpring.make()
+        self.doc.recompute()
+        self.assertEqual(CoreUtils.document_springs(self.doc), [extension, torsion])
+        with CoreUtils.spring_batch(self.doc):
+            extension.WireDiameter = 2.0
+            torsion.WireDiameter = 2.0
+        self.assertAlmostEqual(extension.Rate, _expected_extension_rate(extension.OutsideDiameterAtFree, 2.0, extension.CoilsTotal))
+        self.assertAlmostEqual(torsion.Rate, _expected_torsion_rate(torsion.OutsideDiameterAtFree, 2.0, torsion.CoilsTotal))
+        self.assertNotIn("Touched", extension.State)
+
+        compression = CompressionSpring.make()
+        with CoreUtils.spring_batch(self.doc):
+            compression.LengthAtFree = 60.0
+            extension.CoilsTotal = 12.0
+            torsion.CoilsTotal = 8.0
+        self.assertEqual(CoreUtils.document_springs(self.doc), [extension, torsion, compression])
+        self.assertAlmostEqual(compression.Slenderness, 60.0 / compression.MeanDiameterAtFree)
+        self.assertAlmostEqual(extension.Rate, _expected_extension_rate(extension.OutsideDiameterAtFree, 2.0, 12.0))
+        self.assertAlmostEqual(torsion.Rate, _expected_torsion_rate(torsion.OutsideDiameterAtFree, 2.0, 8.0))
+
+    def test_spring_properties_lists_design_groups(self):
+        """Report columns cover the Independent, Dependent and Global properties of every spring type."""
+        springs = [CompressionSpring.make(), CompressionSpring.make(), TorsionSpring.make()]
+        names = CoreUtils.spring_properties(springs)
+        self.assertEqual(len(names), len(set(names)))
+        self.assertLess(names.index("OutsideDiameterAtFree"), names.index("Rate"))
+        self.assertLess(names.index("Rate"), names.index("MaterialType"))
+        self.assertNotIn("ShapeDetail", names)
+
+        mixed = CoreUtils.spring_properties([ExtensionSpring.make(), TorsionSpring.make()])
+        self.assertIn("HookDeflectionAllowance", mixed)  # extension only
+        self.assertIn("ElasticModulus", mixed)  # torsion only
+
+    def test_export_streams_full_precision(self):
+        """Exports read every design property from the springs and leave no file when stopped early."""
+        springs = [CompressionSpring.make(), ExtensionSpring.make()]
+        springs[0].OutsideDiameterAtFree = 28.123456789
+        self.doc.recompute()
+        directory = tempfile.mkdtemp()
+
+        csv_path = os.path.join(directory, "springs.csv")
+        self.assertEqual(Export.export_springs(csv_path, springs), 2)
+        with open(csv_path, newline="") as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual(float(rows[0]["OutsideDiameterAtFree"]), springs[0].OutsideDiameterAtFree)
+        self.assertEqual(rows[1]["MaterialType"], "")  # not a property of extension springs
+
+        jsonl_path = os.path.join(directory, "springs.jsonl")
+        Export.export_springs(jsonl_path, springs)
+        with open(jsonl_path) as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual(records[0]["Rate"], springs[0].Rate)
+        self.assertEqual(set(records[0]), set(Export.export_columns(springs)))
+
+        stopped = os.path.join(directory, "stopped.csv")
+        export = Export.iter_export(stopped, springs)
+        next(export)
+        export.close()
+        self.assertFalse(os.path.exists(stopped) or os.path.exists(stopped + ".part"))
+
+    def test_export_job_snapshots_every_spring_type(self):
+        """Document exports include every spring type, and ExportJob writes the values read when it was created."""
+        springs = [CompressionSpring.make(), ExtensionSpring.make(), TorsionSpring.make()]
+        self.doc.recompute()
+        self.assertEqual(CoreUtils.document_springs(self.doc), springs)
+        path = os.path.join(tempfile.mkdtemp(), "springs.jsonl")
+        job = Export.ExportJob(path, CoreUtils.document_springs(self.doc))
+        rate = springs[2].Rate
+        springs[2].WireDiameter = 3.0
+        self.doc.recompute()
+        job.start()
+        job.join()
+        self.assertIsNone(job.error)
+        self.assertEqual(job.written, 3)
+        with open(path) as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual([r["Name"] for r in records], [s.Name for s in springs])
+        self.assertEqual(records[2]["Rate"], rate)
+        self.assertNotEqual(springs[2].Rate, rate)
+
+    def test_tube_mesh_is_closed_and_matches_solid(self):
+        """The analytic tube mesh is watertight and encloses about the swept solid's volume."""
+        radius, pitch, height, wire_radius = 14.0, 5.0, 50.0, 1.4
+        mesh = TubeMesh.helix_tube(radius, pitch, height, wire_radius, 96, 24)
+        edges = {tuple(edge) for face in mesh.faces.tolist() for edge in zip(face, face[1:] + face[:1])}
+        self.assertTrue(all((b, a) in edges for a, b in edges))
+
+        corners = mesh.triangles()
+        volume = sum(a.dot(b.cross(c)) for a, b, c in (
+            [FreeCAD.Vector(*p) for p in triangle] for triangle in corners.tolist()
+        )) / 6.0
+        solid = CoreUtils._build_helix_solid(radius, pitch, height, wire_radius)
+        self.assertAlmostEqual(volume / solid.Volume, 1.0, delta=0.02)
+
+        spring = CompressionSpring.make()
+        spring.Placement = FreeCAD.Placement(FreeCAD.Vector(100.0, 0.0, 0.0), FreeCAD.Rotation())
+        self.doc.recompute()
+        placed = TubeMesh.spring_mesh(spring)
+        outer = (spring.OutsideDiameterAtFree + spring.WireDiameter) / 2.0  # helix radius is OD / 2, as in execute
+        self.assertAlmostEqual(placed.vertices[:, 0].min(), 100.0 - outer, delta=0.1)
+
+        path = os.path.join(tempfile.mkdtemp(), "springs.stl")
+        count = TubeMesh.write_meshes(path, [mesh, placed])
+        self.assertEqual(count, len(mesh.faces) + len(placed.faces))
+        self.assertEqual(os.path.getsize(path), 84 + 50 * count)
+
+    def test_mesh_export_of_mixed_selection(self):
+        """Selected compression, extension and torsion springs are all exported; other objects are skipped."""
+        springs = [CompressionSpring.make(), ExtensionSpring.make(), TorsionSpring.make()]
+        for number, spring in enumerate(springs):
+            spring.Label = f"Mixed{number}"
+        box = self.doc.addObject("Part::Box", "Box")
+        unselected = CompressionSpring.make()
+        self.doc.recompute()
+
+        selection = [springs[0], box, springs[1], springs[2]]
+        self.assertEqual(CoreUtils.selected_springs(selection, self.doc), springs)
+        self.assertEqual(CoreUtils.selected_springs([box], self.doc), springs + [unselected])
+
+        path = os.path.join(tempfile.mkdtemp(), "springs.obj")
+        TubeMesh.write_meshes(path, (TubeMesh.spring_mesh(obj) for obj in CoreUtils.selected_springs(selection, self.doc)))
+        with open(path) as f:
+            names = [line.split()[1] for line in f if line.startswith("o ")]
+        self.assertEqual(names, ["Mixed0", "Mixed1", "Mixed2"])
+
+    @unittest.skipIf(ViewProviderSpring.coin is None, "needs pivy")
+    def test_view_provider_shares_nodes_by_geometry(self):
+        """Springs of the same geometry draw one shared node, freed with its last user."""
+        geometry = (14.0, 5.0, 50.0, 1.4, 48, 12)
+        count = ViewProviderSpring.shared_node_count()
+        first = ViewProviderSpring.acquire_node(ViewProviderSpring.INSTANCED_MODE, geometry)
+        second = ViewProviderSpring.acquire_node(ViewProviderSpring.INSTANCED_MODE, geometry)
+        self.assertIs(first, second)
+        self.assertEqual(ViewProviderSpring.shared_node_count(), count + 1)
+        ViewProviderSpring.release_node(ViewProviderSpring.INSTANCED_MODE, geometry)
+        self.assertEqual(ViewProviderSpring.shared_node_count(), count + 1)
+        ViewProviderSpring.release_node(ViewProviderSpring.INSTANCED_MODE, geometry)
+        self.assertEqual(ViewProviderSpring.shared_node_count(), count)
+
+    @unittest.skipIf(ViewProviderSpring.coin is None, "needs pivy")
+    def test_view_provider_tracks_shared_nodes(self):
+        """View providers acquire and release shared nodes through mode switches, geometry changes and deletes."""
+        def stub(fp):
+            vobj = SimpleNamespace(Object=fp, DisplayMode="Shaded", ShapeColor=(0.8, 0.8, 0.8),
+                                   addDisplayMode=lambda node, mode: None)
+            fp.ViewObject = vobj
+            provider = ViewProviderSpring.ViewProviderSpring(None)
+            provider.attach(vobj)
+            return provider, vobj
+
+        def geometry():
+            return SimpleNamespace(OutsideDiameterAtFree=28.0, Pitch=5.0, LengthAtFree=50.0, WireDiameter=2.8)
+
+        count = ViewProviderSpring.shared_node_count()
+        provider, vobj = stub(geometry())
+        twin, twin_vobj = stub(geometry())
+        self.assertEqual(ViewProviderSpring.shared_node_count(), count)  # "Shaded" draws the shape
+
+        for view, view_vobj in ((provider, vobj), (twin, twin_vobj)):
+            view_vobj.DisplayMode = ViewProviderSpring.INSTANCED_MODE
+            view.onChanged(view_vobj, "DisplayMode")
+        self.assertEqual(ViewProviderSpring.shared_node_count(), count + 1)
+        self.assertEqual(provider._slots[ViewProviderSpring.INSTANCED_MODE][1].getNumChildren(), 1)
+
+        provider.updateData(vobj.Object, "Rate")
+        self.assertEqual(ViewProviderSpring.shared_node_count(), count + 1)
+        vobj.Object.LengthAtFree = 60.0
+        provider.updateData(vobj.Object, "LengthAtFree")
+        self.assertEqual(ViewProviderSpring.shared_node_count(), count + 2)
+        self.assertEqual(provider._slots[ViewProviderSpring.INSTANCED_MODE][1].getNumChildren(), 1)
+
+        vobj.DisplayMode = ViewProviderSpring.CENTERLINE_MODE
+        provider.onChanged(vobj, "DisplayMode")
+        self.assertEqual(ViewProviderSpring.shared_node_count(), count + 2)
+        self.assertEqual(provider._slots[ViewProviderSpring.INSTANCED_MODE][1].getNumChildren(), 0)
+        self.assertEqual(provider._slots[ViewProviderSpring.CENTERLINE_MODE][1].getNumChildren(), 1)
+
+        self.assertTrue(provider.onDelete(vobj, []))
+        self.assertEqual(ViewProviderSpring.shared_node_count(), count + 1)
+        twin.onDelete(twin_vobj, [])
+        self.assertEqual(ViewProviderSpring.shared_node_count(), count)
+
+    def test_mass_properties_match_weight_and_solid(self):
+        """Analytic mass properties agree with Weight per EndType and with the swept solid."""
+        spring = CompressionSpring.make()
+        for end_type in ("Closed&Ground", "Tapered_C&G"):
+            spring.EndType = end_type
+            self.doc.recompute()
+            properties = MassProperties.spring_mass_properties(spring)
+            self.assertAlmostEqual(float(properties.mass) / spring.Weight, 1.0, places=9)
+            self.assertAlmostEqual(float(properties.centroid[2]), spring.LengthAtFree / 2.0, places=6)
+
+        batch = MassProperties.compression_mass_properties([20.0, 30.0], 2.0, 50.0, 10.0, [4, 5], spring.Density)
+        self.assertEqual(batch.inertia.shape, (2, 3, 3))
+        self.assertGreater(batch.inertia[1, 0, 0], batch.inertia[0, 0, 0])
+
+        errors = MassProperties.cross_check(14.0, 5.0, 50.0, 1.4)
+        self.assertLess(errors["volume"], 1e-3)
+        self.assertLess(errors["centroid"], 1e-3)
+        self.assertLess(errors["inertia"], 1e-3)
+
+    def test_ground_ends_are_trimmed_flat(self):
+        """Closed and ground ends give one valid solid bounded by the grinding planes."""
+        spring = CompressionSpring.make()
+        spring.EndType = "Closed&Ground"
+        self.doc.recompute()
+        shape = spring.Shape
+        self.assertTrue(shape.isValid())
+        self.assertEqual(len(shape.Solids), 1)
+        bounds = shape.optimalBoundingBox()
+        self.assertAlmostEqual(bounds.ZMin, 0.0, places=3)
+        self.assertAlmostEqual(bounds.ZMax, spring.LengthAtFree, places=3)
+
+        spring.EndType = "Closed"
+        self.doc.recompute()
+        bounds = spring.Shape.optimalBoundingBox()
+        self.assertAlmostEqual(bounds.ZMin, 0.0, delta=0.05 * spring.WireDiameter)
+        self.assertAlmostEqual(bounds.ZMax, spring.LengthAtFree, delta=0.05 * spring.WireDiameter)
+        self.assertEqual(CompressionUtils.end_geometry(spring), (1.0, False))
+
+    def test_hooks_and_legs_attach_cached_templates(self):
+        """Extension hooks and torsion legs are placed copies of one cached template per key."""
+        spring = ExtensionSpring.make()
+        spring.EndType = "Full_Loop"
+        self.doc.recompute()
+        self.assertEqual(len(spring.Shape.Solids), 3)
+        self.assertTrue(all(solid.isValid() for solid in spring.Shape.Solids))
+        radius = spring.OutsideDiameterAtFree / 2.0
+        bounds = spring.Shape.BoundBox
+        self.assertGreater(bounds.ZMax, spring.LengthAtFree + radius)
+        self.assertLess(bounds.ZMin, -radius)
+
+        ends = ExtensionUtils.end_template(spring, radius)
+        template = CoreUtils.end_template(ends[0], radius, spring.WireDiameter / 2.0, *ends[1:])
+        self.assertIs(CoreUtils.end_template(ends[0], radius, spring.WireDiameter / 2.0, *ends[1:]), template)
+
+        spring.EndType = "Close_Wound_Coil"
+        self.doc.recompute()
+        self.assertEqual(len(spring.Shape.Solids), 1)
+
+        torsion = TorsionSpring.make()
+        self.doc.recompute()
+        self.assertEqual(torsion.EndType, "Tangent")
+        self.assertEqual(len(torsion.Shape.Solids), 3)
+        self.assertGreater(torsion.Shape.BoundBox.YLength, torsion.OutsideDiameterAtFree + torsion.WireDiameter)
+
+    def test_sensitivities_match_finite_differences(self):
+        """Forward-mode derivatives agree with central differences of update_properties."""
+        spring = CompressionSpring.make()
+        spring.EndType = "Closed&Ground"
+        self.doc.recompute()
+        derivatives = CompressionUtils.sensitivities(spring)
+        state = CompressionModel.CompressionState.from_object(spring)
+        for name in CompressionModel.INDEPENDENT:
+            step = 1e-6 * max(1.0, abs(getattr(state, name)))
+            upper, lower = state.copy(), state.copy()
+            setattr(upper, name, getattr(state, name) + step)
+            setattr(lower, name, getattr(state, name) - step)
+            CompressionModel.update(upper)
+            CompressionModel.update(lower)
+            for output in ("Rate", "StressAtSolid", "FactorOfSafetyAtCycleLife", "Weight", "PercentAvailableDeflection"):
+                expected = (getattr(upper, output) - getattr(lower, output)) / (2.0 * step)
+                self.assertAlmostEqual(derivatives[output][name], expected, delta=1e-5 * max(1.0, abs(expected)), msg=f"{output}/{name}")
+
+        batch = CompressionBatch.jacobian([20.0, 28.0], 2.0, 40.0, 10.0, 50.0, 190.0)
+        self.assertEqual(batch["Rate"].shape, (2, len(CompressionModel.INDEPENDENT)))
+        self.assertNotIn("CycleLife", batch)
+
+        extension = ExtensionSpring.make()
+        self.doc.recompute()
+        rate = ExtensionUtils.sensitivities(extension)["Rate"]
+        self.assertAlmostEqual(rate["WireDiameter"], 4.0 * extension.Rate / extension.WireDiameter
+                               + 3.0 * extension.Rate / (extension.OutsideDiameterAtFree - extension.WireDiameter), places=9)
+        self.assertEqual(TorsionUtils.sensitivities(TorsionSpring.make())["Rate"]["LengthAtFree"], 0.0)
+
 print("✅ Entering unittest.main() ...")
 unittest.main(module=None, verbosity=2)